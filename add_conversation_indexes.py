@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Migration: add the messaging-path indexes — a unique (yard_sale_id,
+participant1_id, participant2_id) index on conversations plus the message
+lookup indexes. create_all never adds indexes to existing tables, so on a
+live database this script is what actually provides the unique guarantee
+that get_or_create_conversation's duplicate-insert handling relies on.
+Duplicate conversation rows — including mirror-order (a, b) / (b, a) pairs
+left by older creation paths — are merged first (messages repointed to the
+keeper) and the survivors normalized to sorted participant order, so the
+unique index can be created. Safe to run multiple times.
+"""
+
+import mysql.connector
+from mysql.connector import Error
+
+
+def migrate():
+    try:
+        connection = mysql.connector.connect(
+            host='127.0.0.1',
+            port=3306,
+            user='root',
+            password=''  # adjust as needed
+        )
+        if connection.is_connected():
+            cursor = connection.cursor()
+            cursor.execute("USE fastapi_db")
+
+            def try_exec(sql: str, ok: str, dup_hint: str = "Duplicate"):
+                try:
+                    cursor.execute(sql)
+                    print(f"✅ {ok}")
+                except Error as e:
+                    if dup_hint in str(e):
+                        print(f"✅ {ok} (already exists)")
+                    else:
+                        print(f"❌ {ok} failed: {e}")
+
+            # Merge duplicate conversations before adding the unique index.
+            # Older creation paths wrote the pair buyer-first, so the same two
+            # users can appear as both (a, b) and (b, a) — group on the
+            # order-insensitive (LEAST, GREATEST) pair, keep the lowest id,
+            # repoint the siblings' messages at it, then drop the siblings.
+            # No-op when there are no dupes.
+            duplicate_keepers = (
+                "SELECT yard_sale_id, "
+                "       LEAST(participant1_id, participant2_id) AS p_lo, "
+                "       GREATEST(participant1_id, participant2_id) AS p_hi, "
+                "       MIN(id) AS keep_id "
+                "FROM conversations "
+                "GROUP BY yard_sale_id, p_lo, p_hi "
+                "HAVING COUNT(*) > 1"
+            )
+            keeper_join = (
+                "  ON k.yard_sale_id = c.yard_sale_id "
+                " AND k.p_lo = LEAST(c.participant1_id, c.participant2_id) "
+                " AND k.p_hi = GREATEST(c.participant1_id, c.participant2_id) "
+            )
+
+            cursor.execute(
+                "UPDATE messages m "
+                "JOIN conversations c ON c.id = m.conversation_id "
+                f"JOIN ({duplicate_keepers}) k "
+                f"{keeper_join}"
+                "SET m.conversation_id = k.keep_id "
+                "WHERE c.id <> k.keep_id"
+            )
+            print(f"✅ Repointed {cursor.rowcount} message(s) to surviving conversations")
+
+            cursor.execute(
+                "DELETE c FROM conversations c "
+                f"JOIN ({duplicate_keepers}) k "
+                f"{keeper_join}"
+                "WHERE c.id <> k.keep_id"
+            )
+            print(f"✅ Removed {cursor.rowcount} duplicate conversation(s)")
+
+            # Normalize the survivors to sorted order (the invariant the app
+            # now maintains via get_or_create_conversation). After the merge
+            # each pair has exactly one row, so the swap cannot collide. The
+            # @tmp indirection is the MySQL idiom for swapping two columns,
+            # since SET clauses see already-assigned values.
+            cursor.execute(
+                "UPDATE conversations "
+                "SET participant1_id = (@tmp := participant1_id), "
+                "    participant1_id = participant2_id, "
+                "    participant2_id = @tmp "
+                "WHERE participant1_id > participant2_id"
+            )
+            print(f"✅ Normalized participant order on {cursor.rowcount} conversation(s)")
+
+            # With participants sorted, the triplet uniquely identifies a
+            # conversation; this backs both the lookup in
+            # get_or_create_conversation and its duplicate-insert race handling
+            try_exec(
+                "CREATE UNIQUE INDEX ix_conversations_ys_participants "
+                "ON conversations (yard_sale_id, participant1_id, participant2_id)",
+                "Added unique index on conversations (yard_sale_id, participants)"
+            )
+
+            try_exec(
+                "CREATE INDEX ix_messages_conversation_created "
+                "ON messages (conversation_id, created_at)",
+                "Added index on messages (conversation_id, created_at)"
+            )
+
+            try_exec(
+                "CREATE INDEX ix_messages_recipient_unread "
+                "ON messages (recipient_id, is_read)",
+                "Added index on messages (recipient_id, is_read)"
+            )
+
+            try_exec(
+                "CREATE INDEX ix_messages_sender_created "
+                "ON messages (sender_id, created_at)",
+                "Added index on messages (sender_id, created_at)"
+            )
+
+            connection.commit()
+
+    except Error as e:
+        print(f"❌ Database error: {e}")
+    finally:
+        try:
+            if connection.is_connected():
+                cursor.close()
+                connection.close()
+                print("✅ Database connection closed")
+        except NameError:
+            pass
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Migration: add the trust-path indexes — a unique (reviewer_id,
+rated_user_id) constraint on user_ratings plus supporting indexes for the
+ratings and verification lookups. Safe to run multiple times.
+"""
+
+import mysql.connector
+from mysql.connector import Error
+
+
+def migrate():
+    try:
+        connection = mysql.connector.connect(
+            host='127.0.0.1',
+            port=3306,
+            user='root',
+            password=''  # adjust as needed
+        )
+        if connection.is_connected():
+            cursor = connection.cursor()
+            cursor.execute("USE fastapi_db")
+
+            def try_exec(sql: str, ok: str, dup_hint: str = "Duplicate"):
+                try:
+                    cursor.execute(sql)
+                    print(f"✅ {ok}")
+                except Error as e:
+                    if dup_hint in str(e):
+                        print(f"✅ {ok} (already exists)")
+                    else:
+                        print(f"❌ {ok} failed: {e}")
+
+            # One rating per reviewer/rated-user pair; lets the create
+            # endpoints insert without a pre-flight duplicate SELECT.
+            # Fails if existing data already has duplicates — clean those
+            # up first.
+            try_exec(
+                "ALTER TABLE user_ratings "
+                "ADD CONSTRAINT uq_user_ratings_reviewer_rated "
+                "UNIQUE (reviewer_id, rated_user_id)",
+                "Added unique (reviewer_id, rated_user_id) on user_ratings"
+            )
+
+            try_exec(
+                "CREATE INDEX ix_user_ratings_rated_user "
+                "ON user_ratings (rated_user_id)",
+                "Added index on user_ratings (rated_user_id)"
+            )
+
+            try_exec(
+                "CREATE INDEX ix_verifications_user_type "
+                "ON verifications (user_id, verification_type)",
+                "Added index on verifications (user_id, verification_type)"
+            )
+
+            try_exec(
+                "CREATE INDEX ix_verifications_user_status "
+                "ON verifications (user_id, status)",
+                "Added index on verifications (user_id, status)"
+            )
+
+            connection.commit()
+
+    except Error as e:
+        print(f"❌ Database error: {e}")
+    finally:
+        try:
+            if connection.is_connected():
+                cursor.close()
+                connection.close()
+                print("✅ Database connection closed")
+        except NameError:
+            pass
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Migration: add cached average_rating / total_ratings columns to users and
+backfill them from user_ratings. Safe to run multiple times.
+"""
+
+import mysql.connector
+from mysql.connector import Error
+
+
+def migrate():
+    try:
+        connection = mysql.connector.connect(
+            host='127.0.0.1',
+            port=3306,
+            user='root',
+            password=''  # adjust as needed
+        )
+        if connection.is_connected():
+            cursor = connection.cursor()
+            cursor.execute("USE fastapi_db")
+
+            def try_exec(sql: str, ok: str, dup_hint: str = "Duplicate"):
+                try:
+                    cursor.execute(sql)
+                    print(f"✅ {ok}")
+                except Error as e:
+                    if dup_hint in str(e):
+                        print(f"✅ {ok} (already exists)")
+                    else:
+                        print(f"❌ {ok} failed: {e}")
+
+            # Add cached aggregate columns
+            try_exec(
+                "ALTER TABLE users ADD COLUMN average_rating FLOAT NULL",
+                "Added users.average_rating"
+            )
+            try_exec(
+                "ALTER TABLE users ADD COLUMN total_ratings INT NOT NULL DEFAULT 0",
+                "Added users.total_ratings"
+            )
+
+            # Backfill from user_ratings; recomputes every row so re-running
+            # just converges to the same values
+            cursor.execute(
+                "UPDATE users u "
+                "LEFT JOIN ("
+                "  SELECT rated_user_id, AVG(rating) AS avg_rating, COUNT(*) AS cnt "
+                "  FROM user_ratings GROUP BY rated_user_id"
+                ") r ON r.rated_user_id = u.id "
+                "SET u.average_rating = r.avg_rating, "
+                "    u.total_ratings = COALESCE(r.cnt, 0)"
+            )
+            print(f"✅ Backfilled rating aggregates on {cursor.rowcount} user(s)")
+
+            connection.commit()
+
+    except Error as e:
+        print(f"❌ Database error: {e}")
+    finally:
+        try:
+            if connection.is_connected():
+                cursor.close()
+                connection.close()
+                print("✅ Database connection closed")
+        except NameError:
+            pass
+
+
+if __name__ == "__main__":
+    migrate()
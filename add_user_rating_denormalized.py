@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Migration: add denormalized reviewer_username / rated_user_username /
+yard_sale_title columns to user_ratings and backfill them. Safe to run
+multiple times.
+"""
+
+import mysql.connector
+from mysql.connector import Error
+
+
+def migrate():
+    try:
+        connection = mysql.connector.connect(
+            host='127.0.0.1',
+            port=3306,
+            user='root',
+            password=''  # adjust as needed
+        )
+        if connection.is_connected():
+            cursor = connection.cursor()
+            cursor.execute("USE fastapi_db")
+
+            def try_exec(sql: str, ok: str, dup_hint: str = "Duplicate"):
+                try:
+                    cursor.execute(sql)
+                    print(f"✅ {ok}")
+                except Error as e:
+                    if dup_hint in str(e):
+                        print(f"✅ {ok} (already exists)")
+                    else:
+                        print(f"❌ {ok} failed: {e}")
+
+            try_exec(
+                "ALTER TABLE user_ratings ADD COLUMN reviewer_username VARCHAR(50) NULL",
+                "Added user_ratings.reviewer_username"
+            )
+            try_exec(
+                "ALTER TABLE user_ratings ADD COLUMN rated_user_username VARCHAR(50) NULL",
+                "Added user_ratings.rated_user_username"
+            )
+            try_exec(
+                "ALTER TABLE user_ratings ADD COLUMN yard_sale_title VARCHAR(200) NULL",
+                "Added user_ratings.yard_sale_title"
+            )
+
+            # Backfill; only touches rows that are still NULL so re-running
+            # is a no-op
+            cursor.execute(
+                "UPDATE user_ratings r "
+                "JOIN users u ON u.id = r.reviewer_id "
+                "SET r.reviewer_username = u.username "
+                "WHERE r.reviewer_username IS NULL"
+            )
+            print(f"✅ Backfilled reviewer_username on {cursor.rowcount} rating(s)")
+
+            cursor.execute(
+                "UPDATE user_ratings r "
+                "JOIN users u ON u.id = r.rated_user_id "
+                "SET r.rated_user_username = u.username "
+                "WHERE r.rated_user_username IS NULL"
+            )
+            print(f"✅ Backfilled rated_user_username on {cursor.rowcount} rating(s)")
+
+            cursor.execute(
+                "UPDATE user_ratings r "
+                "JOIN yard_sales ys ON ys.id = r.yard_sale_id "
+                "SET r.yard_sale_title = ys.title "
+                "WHERE r.yard_sale_title IS NULL AND r.yard_sale_id IS NOT NULL"
+            )
+            print(f"✅ Backfilled yard_sale_title on {cursor.rowcount} rating(s)")
+
+            connection.commit()
+
+    except Error as e:
+        print(f"❌ Database error: {e}")
+    finally:
+        try:
+            if connection.is_connected():
+                cursor.close()
+                connection.close()
+                print("✅ Database connection closed")
+        except NameError:
+            pass
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Migration: add denormalized owner_username column to yard_sales and
+backfill it from users. Safe to run multiple times.
+"""
+
+import mysql.connector
+from mysql.connector import Error
+
+
+def migrate():
+    try:
+        connection = mysql.connector.connect(
+            host='127.0.0.1',
+            port=3306,
+            user='root',
+            password=''  # adjust as needed
+        )
+        if connection.is_connected():
+            cursor = connection.cursor()
+            cursor.execute("USE fastapi_db")
+
+            def try_exec(sql: str, ok: str, dup_hint: str = "Duplicate"):
+                try:
+                    cursor.execute(sql)
+                    print(f"✅ {ok}")
+                except Error as e:
+                    if dup_hint in str(e):
+                        print(f"✅ {ok} (already exists)")
+                    else:
+                        print(f"❌ {ok} failed: {e}")
+
+            # Add owner_username column
+            try_exec(
+                "ALTER TABLE yard_sales ADD COLUMN owner_username VARCHAR(50) NULL",
+                "Added yard_sales.owner_username"
+            )
+
+            # Backfill from users; only touches rows that are still NULL so
+            # re-running is a no-op
+            cursor.execute(
+                "UPDATE yard_sales ys "
+                "JOIN users u ON u.id = ys.owner_id "
+                "SET ys.owner_username = u.username "
+                "WHERE ys.owner_username IS NULL"
+            )
+            print(f"✅ Backfilled owner_username on {cursor.rowcount} yard sale(s)")
+
+            connection.commit()
+
+    except Error as e:
+        print(f"❌ Database error: {e}")
+    finally:
+        try:
+            if connection.is_connected():
+                cursor.close()
+                connection.close()
+                print("✅ Database connection closed")
+        except NameError:
+            pass
+
+
+if __name__ == "__main__":
+    migrate()
@@ -1,22 +1,31 @@
-from fastapi import FastAPI, HTTPException, status, Depends, Form, WebSocket, WebSocketDisconnect, UploadFile, File, Header, Cookie, Query, Request
-from fastapi.responses import JSONResponse, StreamingResponse, HTMLResponse
+from fastapi import FastAPI, HTTPException, status, Depends, Form, WebSocket, WebSocketDisconnect, UploadFile, File, Header, Cookie, Query, Request, BackgroundTasks, Response
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse, HTMLResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi.concurrency import run_in_threadpool
+import anyio
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.docs import get_swagger_ui_html
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request as StarletteRequest
 from starlette.responses import Response
-from pydantic import BaseModel, Field, EmailStr, model_validator
+from pydantic import BaseModel, ConfigDict, Field, EmailStr, TypeAdapter, model_validator
 from typing import List, Optional, Dict
 import uvicorn
 from datetime import datetime, timedelta
 import pytz
 import json
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+import orjson
+from jose import JWTError, jwt, jwk
+import bcrypt
 import secrets
-from sqlalchemy.orm import Session
+import hashlib
+from sqlalchemy import select, func, lambda_stmt, tuple_, update
+from sqlalchemy import inspect as sqla_inspect
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, joinedload, selectinload
 import uuid
 import boto3
 from botocore.exceptions import ClientError
@@ -29,7 +38,7 @@ from dotenv import load_dotenv
 # This must be called before any os.getenv() calls
 load_dotenv()
 from database import get_db, create_tables, User, Item, YardSale, Comment, Message, Conversation, UserRating, Report, Verification, VisitedYardSale, Notification
-from database import MarketItemComment, WatchedItem, MarketItemConversation, MarketItemMessage, Event, EventComment, EventConversation, EventMessage, SavedFilter, get_mountain_time
+from database import MarketItemComment, WatchedItem, MarketItemConversation, MarketItemMessage, Event, EventComment, EventConversation, EventMessage, SavedFilter, get_mountain_time, session_scope
 
 def calculate_price_reduction_fields(item: Item) -> dict:
     """Calculate price reduction fields for MarketItemResponse"""
@@ -63,11 +72,16 @@ def get_optional_user_from_auth_header(authorization: Optional[str], db: Session
             return None
         if token in token_blacklist:
             return None
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        username: str = payload.get("sub")
-        if not username:
-            return None
-        user = get_user_by_username(db, username)
+        # Skip signature verification if this exact token was validated
+        # recently, same as get_current_user
+        username = get_cached_token_username(token)
+        if username is None:
+            payload = jwt.decode(token, JWT_SIGNING_KEY, algorithms=[ALGORITHM], options=JWT_DECODE_OPTIONS)
+            username = payload.get("sub")
+            if not username:
+                return None
+            cache_token_username(token, username, payload.get("exp"))
+        user = get_user_for_token(db, username)
         return user
     except Exception:
         return None
@@ -83,9 +97,29 @@ class UserPermission(str, Enum):
     ADMIN = "admin"
 
 # Authentication configuration
-SECRET_KEY = secrets.token_urlsafe(32)  # Generate a random secret key
+# Load the signing secret from the environment so tokens survive restarts
+# and all gunicorn/uvicorn workers accept each other's tokens; a per-process
+# random key meant every restart (and every sibling worker) rejected
+# previously issued tokens. The random fallback keeps single-process dev
+# working without setup.
+SECRET_KEY = os.getenv("JWT_SECRET") or secrets.token_urlsafe(32)
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 180  # 3 hours
+ACCESS_TOKEN_EXPIRE_SECONDS = ACCESS_TOKEN_EXPIRE_MINUTES * 60
+# Construct the HMAC key object once; jose otherwise rebuilds it on every
+# encode/sign call
+JWT_SIGNING_KEY = jwk.construct(SECRET_KEY, ALGORITHM)
+# Tokens carry only sub + exp, so skip the claim checks that can never
+# apply and require the two that must be present; shared by every decode
+JWT_DECODE_OPTIONS = {
+    "verify_aud": False,
+    "verify_iss": False,
+    "verify_sub": False,
+    "verify_jti": False,
+    "verify_at_hash": False,
+    "require_exp": True,
+    "require_sub": True,
+}
 
 # MinIO S3 Configuration
 # Use environment variables if set, otherwise use defaults
@@ -107,9 +141,12 @@ DOMAIN_NAME = os.getenv("DOMAIN_NAME", "http://10.1.2.165:8000")  # For local de
 verify_ssl = os.getenv("MINIO_VERIFY_SSL", "false").lower() == "true"
 
 # Create boto3 config for S3 client
+# max_pool_connections sized above the upload executor so parallel uploads
+# never queue inside urllib3; adaptive retries back off under throttling
 s3_config = Config(
     signature_version='s3v4',
-    retries={'max_attempts': 3, 'mode': 'standard'}
+    max_pool_connections=int(os.getenv("S3_MAX_POOL_CONNECTIONS", "64")),
+    retries={'max_attempts': 3, 'mode': 'adaptive'}
 )
 
 # Initialize S3 client for MinIO
@@ -130,27 +167,38 @@ s3_client = boto3.client(
         config=s3_config
 )
 
+# Bounded pool for S3 transfers. The shared client is thread-safe, so upload
+# handlers submit put_object here and await the future instead of blocking
+# the event loop; concurrent uploads parallelize up to the pool size.
+UPLOAD_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv("UPLOAD_WORKERS", "16")),
+    thread_name_prefix="s3-upload"
+)
+
 # Helper functions
-def get_mountain_time() -> datetime:
-    """Get current time in Mountain Time Zone (Vernal, Utah)"""
-    mountain_tz = pytz.timezone('America/Denver')  # Mountain Time Zone
-    return datetime.now(mountain_tz)
+# get_mountain_time is imported from database.py, which caches the pytz
+# timezone at module level instead of looking it up per call
+
+# Standard payment methods, encoded once at import so the /payment-methods
+# endpoint serves pre-built bytes instead of re-encoding the list per call
+STANDARD_PAYMENT_METHODS = (
+    "Cash",
+    "Credit Card",
+    "Debit Card",
+    "Venmo",
+    "PayPal",
+    "Zelle",
+    "Apple Pay",
+    "Google Pay",
+    "Samsung Pay",
+    "Cash App",
+    "Check"
+)
+_PAYMENT_METHODS_JSON = orjson.dumps(list(STANDARD_PAYMENT_METHODS))
 
 def get_standard_payment_methods() -> List[str]:
     """Get list of standard payment methods available"""
-    return [
-        "Cash",
-        "Credit Card",
-        "Debit Card",
-        "Venmo",
-        "PayPal",
-        "Zelle",
-        "Apple Pay",
-        "Google Pay",
-        "Samsung Pay",
-        "Cash App",
-        "Check"
-    ]
+    return list(STANDARD_PAYMENT_METHODS)
 
 # Yard Sale Status Enum
 class YardSaleStatus(str, Enum):
@@ -159,25 +207,47 @@ class YardSaleStatus(str, Enum):
     ON_BREAK = "on_break"
 
 # Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__default_rounds=12)
+# The bcrypt library is called directly (no passlib dispatch layer); only one
+# scheme is ever used. Cost factor is tunable via BCRYPT_ROUNDS; the default
+# of 10 (OWASP's floor) costs roughly a quarter of the CPU of 12, since each
+# extra round doubles the work. Verification reads the cost from the stored
+# hash, so existing higher-cost hashes keep working and get replaced at the
+# new cost whenever the user next changes their password.
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "10"))
 
 # Security scheme
 security = HTTPBearer()
 
+# Main event loop, captured at startup in lifespan; used to dispatch
+# WebSocket sends from threadpool (def) endpoints
+MAIN_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
 # Lifespan event handler
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
-    try:
-        create_tables()
-        print("✅ Database tables created successfully")
-    except Exception as e:
-        print(f"⚠️  Warning: Could not create database tables: {e}")
-        print("   The application will start, but database operations may fail.")
-        print("   You can create tables manually later with: python setup_docker_database.py")
-        import traceback
-        traceback.print_exc()
-        # Don't crash - let the app start anyway
+    # Capture the main event loop so sync endpoints running on the threadpool
+    # can hand WebSocket notifications back to it (see create_notification)
+    global MAIN_LOOP
+    MAIN_LOOP = asyncio.get_running_loop()
+    # Sync (def) endpoints run on the AnyIO threadpool; the default of 40
+    # tokens caps concurrent bcrypt work, so make it tunable for auth-heavy load
+    anyio.to_thread.current_default_thread_limiter().total_tokens = int(os.getenv("THREADPOOL_TOKENS", "64"))
+    # Schema creation is a one-time setup task (setup_database.py /
+    # setup_docker_database.py); running create_all on every worker start adds
+    # reflection queries and races between workers. Set CREATE_TABLES_ON_STARTUP=0
+    # once the schema is managed out-of-band.
+    if os.getenv("CREATE_TABLES_ON_STARTUP", "1") == "1":
+        try:
+            create_tables()
+            print("✅ Database tables created successfully")
+        except Exception as e:
+            print(f"⚠️  Warning: Could not create database tables: {e}")
+            print("   The application will start, but database operations may fail.")
+            print("   You can create tables manually later with: python setup_docker_database.py")
+            import traceback
+            traceback.print_exc()
+            # Don't crash - let the app start anyway
     yield
     # Shutdown (if needed)
 
@@ -188,6 +258,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",  # Swagger UI
     redoc_url="/redoc",  # ReDoc
+    default_response_class=ORJSONResponse,  # orjson encodes datetimes natively and much faster than stdlib json
     lifespan=lifespan
 )
 
@@ -471,7 +542,7 @@ class DocsAuthMiddleware(BaseHTTPMiddleware):
                     )
                 
                 # Decode and validate token
-                payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+                payload = jwt.decode(token, JWT_SIGNING_KEY, algorithms=[ALGORITHM], options=JWT_DECODE_OPTIONS)
                 username = payload.get("sub")
                 if not username:
                     # For browser requests, show login form
@@ -763,6 +834,10 @@ class UserBase(BaseModel):
     email: str = Field(..., description="Email address")
 
 class UserCreate(UserBase):
+    # EmailStr validates with the precompiled email-validator machinery at
+    # class-build time; UserBase keeps plain str so responses never reject
+    # legacy addresses already stored in the database
+    email: EmailStr = Field(..., description="Email address")
     password: str = Field(..., min_length=6, max_length=72, description="Password (6-72 characters)")
     password_confirm: str = Field(..., min_length=6, max_length=72, description="Confirm password (must match password)")
     full_name: Optional[str] = Field(None, max_length=100, description="Full name")
@@ -795,6 +870,8 @@ class UserCreate(UserBase):
         return self
 
 class UserResponse(UserBase):
+    model_config = ConfigDict(from_attributes=True)
+
     id: str
     full_name: Optional[str]
     phone_number: Optional[str]
@@ -825,12 +902,12 @@ class UserLogin(BaseModel):
     password: str = Field(..., description="Password")
 
 class PasswordUpdate(BaseModel):
-    email: str = Field(..., description="Email address of the account")
+    email: EmailStr = Field(..., description="Email address of the account")
     current_password: str = Field(..., min_length=6, max_length=72, description="Current password")
     new_password: str = Field(..., min_length=6, max_length=72, description="New password (6-72 characters)")
 
 class PasswordReset(BaseModel):
-    email: str = Field(..., description="Email address of the account")
+    email: EmailStr = Field(..., description="Email address of the account")
     new_password: str = Field(..., min_length=6, max_length=72, description="New password (6-72 characters)")
     confirm_password: str = Field(..., min_length=6, max_length=72, description="Confirm new password")
 
@@ -1068,6 +1145,9 @@ class MarketItemConversationResponse(BaseModel):
 class YardSaleMessageCreate(BaseModel):
     content: str = Field(..., min_length=1, max_length=1000, description="Message content")
 
+class YardSaleMessageBatchCreate(BaseModel):
+    messages: List[YardSaleMessageCreate] = Field(..., min_length=1, max_length=50, description="Messages to send in one request")
+
 class YardSaleMessageResponse(BaseModel):
     id: str
     content: str
@@ -1225,6 +1305,8 @@ class MessageCreate(BaseModel):
     conversation_id: Optional[str] = Field(None, description="ID of the conversation (for replying in existing conversations)")
 
 class ConversationResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: str
     yard_sale_id: str
     yard_sale_title: str
@@ -1237,9 +1319,6 @@ class ConversationResponse(BaseModel):
     unread_count: int = 0
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
-    
-    class Config:
-        from_attributes = True
 
 class MessageResponse(BaseModel):
     id: str
@@ -1263,6 +1342,13 @@ class UserRatingCreate(BaseModel):
     yard_sale_id: Optional[str] = Field(None, description="Optional yard sale ID if rating is related to a specific sale")
     rated_user_id: Optional[str] = Field(None, description="ID of the user being rated (required for /ratings endpoint)")
 
+class AdminRatingImport(BaseModel):
+    reviewer_id: str = Field(..., description="ID of the user giving the rating")
+    rated_user_id: str = Field(..., description="ID of the user being rated")
+    rating: int = Field(..., ge=1, le=5, description="Rating from 1 to 5 stars")
+    review_text: Optional[str] = Field(None, max_length=1000, description="Optional review text")
+    yard_sale_id: Optional[str] = Field(None, description="Optional yard sale ID if rating is related to a specific sale")
+
 class UserRatingResponse(BaseModel):
     id: str
     rating: int
@@ -1330,6 +1416,12 @@ class VerificationResponse(BaseModel):
     user_id: str
     user_username: str
 
+# Module-level adapters so hot listing loops can validate a whole page of
+# plain dicts in one C-level call instead of one model constructor per row
+UserRatingListAdapter = TypeAdapter(List[UserRatingResponse])
+ReportListAdapter = TypeAdapter(List[ReportResponse])
+VerificationListAdapter = TypeAdapter(List[VerificationResponse])
+
 # Image Upload Models
 class ImageUploadResponse(BaseModel):
     success: bool
@@ -1612,6 +1704,7 @@ class MessagesWithNotificationStatus(BaseModel):
     messages: List[MessageResponse]
     unread_message_count: int
     total_messages: int
+    next_cursor: Optional[datetime] = None  # Pass as ?before= to fetch the next page
 
 class BulkMarkReadRequest(BaseModel):
     message_ids: List[int]
@@ -1659,7 +1752,70 @@ class ConversationSummariesResponse(BaseModel):
     total_unread: int
 
 # Token blacklist for logout functionality
-token_blacklist = set()
+class TokenBlacklist:
+    """Bounded in-process store of revoked tokens.
+
+    Tokens are kept as sha256 digests together with their exp claim, so the
+    structure holds a small fixed amount per revocation and prunes entries
+    for tokens that have expired anyway once it grows past the threshold.
+    """
+
+    PRUNE_THRESHOLD = int(os.getenv("TOKEN_BLACKLIST_PRUNE_THRESHOLD", "10000"))
+    _MISSING = object()
+
+    def __init__(self):
+        self._revoked = {}  # sha256(token) -> exp epoch seconds (or None)
+
+    def add(self, token: str):
+        """Revoke a token (reads its exp claim without re-verifying the signature)"""
+        try:
+            exp = jwt.get_unverified_claims(token).get("exp")
+        except JWTError:
+            exp = None
+        if len(self._revoked) >= self.PRUNE_THRESHOLD:
+            now = datetime.now().timestamp()
+            self._revoked = {key: e for key, e in self._revoked.items() if e is None or e > now}
+        self._revoked[hashlib.sha256(token.encode()).digest()] = exp
+
+    def __contains__(self, token: str) -> bool:
+        # Fast negative path: with no revocations outstanding (the common
+        # case), skip hashing the token entirely — same job a bloom filter
+        # would do in front of a shared store
+        if not self._revoked:
+            return False
+        exp = self._revoked.get(hashlib.sha256(token.encode()).digest(), self._MISSING)
+        if exp is self._MISSING:
+            return False
+        if exp is not None and exp < datetime.now().timestamp():
+            # Token has expired on its own; normal validation will reject it
+            return False
+        return True
+
+token_blacklist = TokenBlacklist()
+
+# Cache of successfully validated JWTs keyed by token hash, so repeat requests
+# from the same session skip the signature verification. Entries expire with
+# the token; the cache is cleared wholesale if it ever fills up.
+TOKEN_VALIDATION_CACHE_MAX = 10000
+_token_validation_cache = {}  # sha256(token) -> (username, exp epoch seconds or None)
+
+def get_cached_token_username(token: str) -> Optional[str]:
+    """Return the cached username for a previously validated token, if still valid"""
+    key = hashlib.sha256(token.encode()).digest()
+    entry = _token_validation_cache.get(key)
+    if entry is None:
+        return None
+    username, exp = entry
+    if exp is not None and exp < datetime.now().timestamp():
+        _token_validation_cache.pop(key, None)
+        return None
+    return username
+
+def cache_token_username(token: str, username: str, exp: Optional[float]):
+    """Record a validated token so later requests can skip jwt.decode"""
+    if len(_token_validation_cache) >= TOKEN_VALIDATION_CACHE_MAX:
+        _token_validation_cache.clear()
+    _token_validation_cache[hashlib.sha256(token.encode()).digest()] = (username, exp)
 
 # WebSocket connection manager
 class ConnectionManager:
@@ -1678,16 +1834,25 @@ class ConnectionManager:
         if user_id in self.active_connections:
             websocket = self.active_connections[user_id]
             try:
-                await websocket.send_text(json.dumps(message))
+                # orjson encodes the payload (datetimes included) natively;
+                # decode to keep sending text frames so clients are unaffected
+                await websocket.send_text(orjson.dumps(message).decode())
             except:
                 # Connection closed, remove it
                 self.disconnect(user_id)
 
     async def broadcast(self, message: dict):
-        for user_id, websocket in self.active_connections.items():
-            try:
-                await websocket.send_text(json.dumps(message))
-            except:
+        payload = orjson.dumps(message).decode()
+        # Snapshot the mapping (disconnect mutates it) and send to every
+        # socket concurrently, so broadcast latency is the slowest client
+        # rather than the sum of all of them
+        connections = list(self.active_connections.items())
+        results = await asyncio.gather(
+            *(websocket.send_text(payload) for _, websocket in connections),
+            return_exceptions=True
+        )
+        for (user_id, _), result in zip(connections, results):
+            if isinstance(result, Exception):
                 # Connection closed, remove it
                 self.disconnect(user_id)
 
@@ -1705,32 +1870,65 @@ def get_or_create_conversation(db: Session, yard_sale_id: str, user1_id: str, us
     participant1_id = min(user1_id, user2_id)
     participant2_id = max(user1_id, user2_id)
     
+    now = get_mountain_time()
+
     # Look for existing conversation
     conversation = db.query(Conversation).filter(
         Conversation.yard_sale_id == yard_sale_id,
         Conversation.participant1_id == participant1_id,
         Conversation.participant2_id == participant2_id
     ).first()
-    
+
     if not conversation:
-        # Create new conversation
+        # Create new conversation; the id and timestamps are client-side
+        # defaults, so no refresh round-trip is needed after commit
         conversation = Conversation(
             yard_sale_id=yard_sale_id,
             participant1_id=participant1_id,
             participant2_id=participant2_id,
-            created_at=get_mountain_time(),
-            updated_at=get_mountain_time()
+            created_at=now,
+            updated_at=now
         )
         db.add(conversation)
-        db.commit()
-        db.refresh(conversation)
+        try:
+            db.commit()
+        except IntegrityError:
+            # Concurrent sender created the same conversation first; the
+            # unique triplet index guarantees exactly one row exists
+            db.rollback()
+            conversation = db.query(Conversation).filter(
+                Conversation.yard_sale_id == yard_sale_id,
+                Conversation.participant1_id == participant1_id,
+                Conversation.participant2_id == participant2_id
+            ).one()
     else:
-        # Update the conversation's updated_at timestamp
-        conversation.updated_at = get_mountain_time()
+        # Update the conversation's updated_at timestamp; flushed as a single
+        # UPDATE in the same commit as the caller's message insert would be
+        conversation.updated_at = now
         db.commit()
-    
+
     return conversation
 
+def delete_row_in_background(model, row_id: str):
+    """Hard-delete a row in a background task using its own session.
+
+    Used by delete endpoints so the response isn't blocked on the delete commit.
+    """
+    with session_scope() as db:
+        if model is Message:
+            # Notifications keep a plain FK to the message they announce (no
+            # ON DELETE), so detach them first — otherwise the delete fails
+            # on the FK and the message silently outlives the "deleted"
+            # response already sent to the client
+            db.execute(
+                update(Notification)
+                .where(Notification.related_message_id == row_id)
+                .values(related_message_id=None)
+            )
+        obj = db.get(model, row_id)
+        if obj is not None:
+            db.delete(obj)
+
 # Notification helper functions
 def create_notification(
     db: Session,
@@ -1757,22 +1955,45 @@ def create_notification(
     db.commit()
     db.refresh(notification)
     
-    # Send real-time WebSocket notification
-    import asyncio
-    try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            # If we're in an async context, schedule the coroutine
-            asyncio.create_task(send_websocket_notification(user_id, notification))
-        else:
-            # If we're not in an async context, run it
-            loop.run_until_complete(send_websocket_notification(user_id, notification))
-    except:
-        # If WebSocket fails, continue without error
-        pass
-    
+    # Send real-time WebSocket notification. Endpoints run as def on the
+    # threadpool, so there is no running loop here — hand the coroutine to
+    # the main loop captured at startup. Fire-and-forget: a failed send is
+    # handled inside send_websocket_notification.
+    if MAIN_LOOP is not None:
+        asyncio.run_coroutine_threadsafe(
+            send_websocket_notification(user_id, notification), MAIN_LOOP
+        )
+
     return notification
 
+def create_notifications_bulk(db: Session, rows: List[dict]):
+    """Insert many notifications in one round-trip.
+
+    Fanout paths (admin broadcasts, report alerts) were looping
+    create_notification and paying an INSERT + COMMIT per recipient.
+    bulk_insert_mappings bypasses the unit of work, so the client-side
+    column defaults (id, is_read, created_at) are filled here; the same
+    rows are then used to dispatch the WebSocket messages.
+    """
+    if not rows:
+        return []
+    now = get_mountain_time()
+    for row in rows:
+        row.setdefault("id", str(uuid.uuid4()))
+        row.setdefault("is_read", False)
+        row.setdefault("created_at", now)
+    db.bulk_insert_mappings(Notification, rows)
+    db.commit()
+
+    notifications = [Notification(**row) for row in rows]
+    if MAIN_LOOP is not None:
+        for notification in notifications:
+            asyncio.run_coroutine_threadsafe(
+                send_websocket_notification(notification.user_id, notification),
+                MAIN_LOOP,
+            )
+    return notifications
+
 async def send_websocket_notification(user_id: str, notification: Notification):
     """Send real-time notification via WebSocket"""
     websocket_message = {
@@ -1792,78 +2013,165 @@ async def send_websocket_notification(user_id: str, notification: Notification):
     await manager.send_personal_message(websocket_message, user_id)
 
 # Authentication utility functions
+def _truncate_password(password: str) -> bytes:
+    """Trim a password to bcrypt's 72-byte limit on a character boundary.
+
+    The single encode here is the one bcrypt needs anyway; passwords at or
+    under the limit (the overwhelming majority) take no extra work. Over the
+    limit, backing the cut off over UTF-8 continuation bytes drops a
+    multi-byte character split by the cut — the same result the old
+    decode/encode round-trip produced, without rebuilding the bytes.
+    """
+    password_bytes = password.encode('utf-8')
+    if len(password_bytes) <= 72:
+        return password_bytes
+    cut = 72
+    while cut > 0 and (password_bytes[cut] & 0xC0) == 0x80:
+        cut -= 1
+    return password_bytes[:cut]
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash"""
-    # Ensure password is not longer than 72 bytes (bcrypt limitation)
-    password_bytes = plain_password.encode('utf-8')
-    if len(password_bytes) > 72:
-        plain_password = password_bytes[:72].decode('utf-8', errors='ignore')
-    
-    try:
-        return pwd_context.verify(plain_password, hashed_password)
-    except Exception as e:
-        # Fallback: truncate to 72 characters (not bytes) if still failing
-        if len(plain_password) > 72:
-            plain_password = plain_password[:72]
-        return pwd_context.verify(plain_password, hashed_password)
+    return bcrypt.checkpw(_truncate_password(plain_password), hashed_password.encode('utf-8'))
 
 def get_password_hash(password: str) -> str:
     """Hash a password"""
-    # Ensure password is not longer than 72 bytes (bcrypt limitation)
-    # Convert to bytes to check actual byte length (not character length)
-    password_bytes = password.encode('utf-8')
-    if len(password_bytes) > 72:
-        # Truncate to 72 bytes and decode back to string
-        password_bytes = password_bytes[:72]
-        password = password_bytes.decode('utf-8', errors='ignore')
-    
-    # Passlib expects a string, but we need to ensure it won't exceed 72 bytes
-    # when passlib encodes it internally
-    try:
-        return pwd_context.hash(password)
-    except ValueError as e:
-        # If passlib still complains about length, try one more truncation
-        if "72 bytes" in str(e).lower():
-            # Double-check byte length
-            final_bytes = password.encode('utf-8')
-            if len(final_bytes) > 72:
-                final_bytes = final_bytes[:72]
-                password = final_bytes.decode('utf-8', errors='ignore')
-        return pwd_context.hash(password)
-        raise
+    return bcrypt.hashpw(_truncate_password(password), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode('utf-8')
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Create a JWT access token"""
-    to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-    return encoded_jwt
+    # Integer epoch math avoids the datetime copy/convert dance, and the
+    # preconstructed signing key skips jose's per-call key parsing
+    expire_seconds = int(expires_delta.total_seconds()) if expires_delta else ACCESS_TOKEN_EXPIRE_SECONDS
+    to_encode = {**data, "exp": int(datetime.now().timestamp()) + expire_seconds}
+    return jwt.encode(to_encode, JWT_SIGNING_KEY, algorithm=ALGORITHM)
 
 def get_user_by_username(db: Session, username: str):
     """Get user by username or email"""
-    return db.query(User).filter(
-        (User.username == username) | (User.email == username)
-    ).first()
+    # Two single-column probes instead of the old (username | email) OR
+    # filter: each predicate is sargable against its unique index, where the
+    # OR form pushed MySQL into an index merge. The likelier column goes
+    # first — logins with an "@" are emails — so the common case is one
+    # seek. lambda_stmt caches the compiled statements across calls.
+    if "@" in username:
+        stmt = lambda_stmt(lambda: select(User).where(User.email == username))
+        fallback = lambda_stmt(lambda: select(User).where(User.username == username))
+    else:
+        stmt = lambda_stmt(lambda: select(User).where(User.username == username))
+        fallback = lambda_stmt(lambda: select(User).where(User.email == username))
+    user = db.execute(stmt).scalars().first()
+    if user is None:
+        user = db.execute(fallback).scalars().first()
+    return user
 
 def get_user_by_id_helper(db: Session, user_id: str):
     """Get user by ID (helper function)"""
-    return db.query(User).filter(User.id == user_id).first()
+    return db.get(User, user_id)
+
+def orm_to_dict(obj) -> dict:
+    """Mapped column values for a loaded ORM object, without SQLAlchemy
+    internals like _sa_instance_state — safe to splat into a response model"""
+    return {attr.key: getattr(obj, attr.key) for attr in sqla_inspect(obj).mapper.column_attrs}
+
+def yard_sale_data(yard_sale) -> dict:
+    """Column values for a YardSale with owner_username guaranteed set,
+    falling back to the owner relationship for rows that predate the
+    materialized column"""
+    data = orm_to_dict(yard_sale)
+    if not data.get("owner_username"):
+        data["owner_username"] = yard_sale.owner.username if yard_sale.owner else "unknown"
+    return data
+
+def get_users_map(db: Session, user_ids) -> dict:
+    """Load several users with one IN query, returned as {id: User}"""
+    ids = {user_id for user_id in user_ids if user_id}
+    if not ids:
+        return {}
+    return {user.id: user for user in db.query(User).filter(User.id.in_(ids))}
+
+def get_last_messages_map(db: Session, conversation_ids, message_model=Message) -> dict:
+    """Fetch each conversation's newest message in one windowed query,
+    returned as {conversation_id: message}. Works for any of the message
+    tables (Message, MarketItemMessage, EventMessage)."""
+    if not conversation_ids:
+        return {}
+    from sqlalchemy.orm import aliased
+    row_number = func.row_number().over(
+        partition_by=message_model.conversation_id,
+        order_by=(message_model.created_at.desc(), message_model.id.desc())
+    ).label("rn")
+    subquery = select(message_model, row_number).where(
+        message_model.conversation_id.in_(conversation_ids)
+    ).subquery()
+    latest = aliased(message_model, subquery)
+    return {
+        message.conversation_id: message
+        for message in db.execute(
+            select(latest).where(subquery.c.rn == 1)
+        ).scalars()
+    }
+
+def get_unread_counts_map(db: Session, conversation_ids, recipient_id: str, message_model=Message) -> dict:
+    """Count unread messages per conversation for a recipient in one grouped
+    query, returned as {conversation_id: count}"""
+    if not conversation_ids:
+        return {}
+    return dict(db.execute(
+        select(message_model.conversation_id, func.count(message_model.id))
+        .where(
+            message_model.conversation_id.in_(conversation_ids),
+            message_model.recipient_id == recipient_id,
+            message_model.is_read == False
+        )
+        .group_by(message_model.conversation_id)
+    ).all())
+
+# Maps token usernames to user ids so the per-request user fetch can use a
+# primary-key get (identity map + PK index) instead of the username/email OR
+# lookup. Usernames are immutable, so entries only go stale if a user is
+# deleted, which the miss path handles. Cleared wholesale if it fills up.
+USER_ID_CACHE_MAX = 10000
+_user_id_cache = {}  # username -> user id
+
+def get_user_for_token(db: Session, username: str):
+    """Resolve the authenticated user, preferring a cached PK lookup"""
+    user_id = _user_id_cache.get(username)
+    if user_id is not None:
+        user = db.get(User, user_id)
+        if user is not None:
+            return user
+        _user_id_cache.pop(username, None)
+    user = get_user_by_username(db, username)
+    if user is not None:
+        if len(_user_id_cache) >= USER_ID_CACHE_MAX:
+            _user_id_cache.clear()
+        _user_id_cache[user.username] = user.id
+    return user
+
+def get_user_auth_row(db: Session, username: str):
+    """Load only the columns the login flow needs, not the full User row"""
+    # Same split as get_user_by_username: probe the likelier unique index
+    # first rather than an OR filter that defeats both
+    cols = select(User.id, User.username, User.permissions, User.hashed_password)
+    if "@" in username:
+        primary, fallback = User.email, User.username
+    else:
+        primary, fallback = User.username, User.email
+    row = db.execute(cols.where(primary == username)).first()
+    if row is None:
+        row = db.execute(cols.where(fallback == username)).first()
+    return row
 
 def authenticate_user(db: Session, username: str, password: str):
     """Authenticate a user"""
-    user = get_user_by_username(db, username)
+    user = get_user_auth_row(db, username)
     if not user:
         return False
     if not verify_password(password, user.hashed_password):
         return False
     return user
 
-async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security), db: Session = Depends(get_db)):
+def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security), db: Session = Depends(get_db)):
     """Get current authenticated user from JWT token"""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -1879,38 +2187,47 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Token has been revoked"
             )
-        
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        username: str = payload.get("sub")
+
+        # Skip signature verification if this exact token was validated recently
+        username = get_cached_token_username(token)
         if username is None:
-            raise credentials_exception
+            payload = jwt.decode(token, JWT_SIGNING_KEY, algorithms=[ALGORITHM], options=JWT_DECODE_OPTIONS)
+            username = payload.get("sub")
+            if username is None:
+                raise credentials_exception
+            cache_token_username(token, username, payload.get("exp"))
         token_data = TokenData(username=username)
     except JWTError:
         raise credentials_exception
     
-    user = get_user_by_username(db, username=token_data.username)
+    user = get_user_for_token(db, token_data.username)
     if user is None:
         raise credentials_exception
     return user
 
-async def get_current_active_user(current_user: User = Depends(get_current_user)):
+def get_current_active_user(current_user: User = Depends(get_current_user)):
     """Get current active user"""
     if not current_user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
 
-async def get_current_admin_user(current_user: User = Depends(get_current_active_user)):
+# Hoisted so the per-request permission dependencies compare against ready
+# strings instead of walking the enum (and building a list) each call
+_ADMIN_PERMISSION = UserPermission.ADMIN.value
+_MODERATOR_PERMISSIONS = (UserPermission.MODERATOR.value, UserPermission.ADMIN.value)
+
+def get_current_admin_user(current_user: User = Depends(get_current_active_user)):
     """Get current user and verify they have admin permissions"""
-    if current_user.permissions != UserPermission.ADMIN.value:
+    if current_user.permissions != _ADMIN_PERMISSION:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin access required"
         )
     return current_user
 
-async def get_current_moderator_or_admin_user(current_user: User = Depends(get_current_active_user)):
+def get_current_moderator_or_admin_user(current_user: User = Depends(get_current_active_user)):
     """Get current user and verify they have moderator or admin permissions"""
-    if current_user.permissions not in [UserPermission.MODERATOR.value, UserPermission.ADMIN.value]:
+    if current_user.permissions not in _MODERATOR_PERMISSIONS:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Moderator or admin access required"
@@ -1939,24 +2256,28 @@ async def health_check():
 
 # Authentication endpoints
 @app.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-async def register_user(user: UserCreate, db: Session = Depends(get_db)):
+def register_user(user: UserCreate, db: Session = Depends(get_db)):
     """Register a new user"""
-    
-    # Check if username already exists
-    if get_user_by_username(db, user.username):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Username already registered"
+
+    # Check username and email availability in a single query
+    existing = db.execute(
+        select(User.username, User.email).where(
+            (User.username == user.username) | (User.email == user.username) |
+            (User.username == user.email) | (User.email == user.email)
         )
-    
-    # Check if email already exists
-    if get_user_by_username(db, user.email):
+    ).first()
+    if existing:
+        if user.username in (existing.username, existing.email):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Username already registered"
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
-    
-    # Create new user
+
+    # Create new user (this def handler already runs on the threadpool)
     hashed_password = get_password_hash(user.password)
     
     # Extract location data
@@ -1979,30 +2300,23 @@ async def register_user(user: UserCreate, db: Session = Depends(get_db)):
     )
     
     db.add(db_user)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        # Concurrent registration won the race; the UNIQUE constraints are the
+        # source of truth
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Username or email already registered"
+        )
     db.refresh(db_user)
-    
+
     # Return user without password
-    return UserResponse(
-        id=db_user.id,
-        username=db_user.username,
-        email=db_user.email,
-        full_name=db_user.full_name,
-        phone_number=db_user.phone_number,
-        company=db_user.company,
-        city=db_user.city,
-        state=db_user.state,
-        zip_code=db_user.zip_code,
-        bio=db_user.bio,
-        profile_picture=db_user.profile_picture,
-        is_active=db_user.is_active,
-        permissions=UserPermission(db_user.permissions),
-        created_at=db_user.created_at,
-        updated_at=db_user.updated_at
-    )
+    return UserResponse.model_validate(db_user)
 
 @app.post("/login", response_model=Token)
-async def login_user(user_credentials: UserLogin, db: Session = Depends(get_db)):
+def login_user(user_credentials: UserLogin, db: Session = Depends(get_db)):
     """Login user and return access token"""
     user = authenticate_user(db, user_credentials.username, user_credentials.password)
     if not user:
@@ -2024,7 +2338,7 @@ async def login_user(user_credentials: UserLogin, db: Session = Depends(get_db))
     }
 
 @app.post("/docs-login")
-async def docs_login(
+def docs_login(
     credentials: UserLogin,
     db: Session = Depends(get_db)
 ):
@@ -2074,35 +2388,21 @@ async def docs_login(
     return response
 
 @app.post("/logout", status_code=status.HTTP_200_OK)
-async def logout_user(current_user: User = Depends(get_current_active_user)):
+def logout_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    current_user: User = Depends(get_current_active_user)
+):
     """Logout user by blacklisting their token"""
-    # Note: In a real application, you'd need to store the token to blacklist it
-    # For this example, we'll return a success message
+    token_blacklist.add(credentials.credentials)
     return {"message": "Successfully logged out"}
 
 @app.get("/me", response_model=UserResponse)
 async def read_users_me(current_user: User = Depends(get_current_active_user)):
     """Get current user information"""
-    return UserResponse(
-        id=current_user.id,
-        username=current_user.username,
-        email=current_user.email,
-        full_name=current_user.full_name,
-        phone_number=current_user.phone_number,
-        company=current_user.company,
-        city=current_user.city,
-        state=current_user.state,
-        zip_code=current_user.zip_code,
-        bio=current_user.bio,
-        profile_picture=current_user.profile_picture,
-        is_active=current_user.is_active,
-        permissions=UserPermission(current_user.permissions),
-        created_at=current_user.created_at,
-        updated_at=current_user.updated_at
-    )
+    return UserResponse.model_validate(current_user)
 
 @app.put("/me", response_model=UserResponse)
-async def update_user_profile(
+def update_user_profile(
     user_update: UserUpdate,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
@@ -2146,26 +2446,10 @@ async def update_user_profile(
             detail=f"Failed to update profile: {str(e)}"
         )
     
-    return UserResponse(
-        id=current_user.id,
-        username=current_user.username,
-        email=current_user.email,
-        full_name=current_user.full_name,
-        phone_number=current_user.phone_number,
-        company=current_user.company,
-        city=current_user.city,
-        state=current_user.state,
-        zip_code=current_user.zip_code,
-        bio=current_user.bio,
-        profile_picture=current_user.profile_picture,
-        is_active=current_user.is_active,
-        permissions=UserPermission(current_user.permissions),
-        created_at=current_user.created_at,
-        updated_at=current_user.updated_at
-    )
+    return UserResponse.model_validate(current_user)
 
 @app.put("/me/password")
-async def update_password(
+def update_password(
     password_data: PasswordUpdate,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
@@ -2184,7 +2468,7 @@ async def update_password(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Current password is incorrect"
         )
-    
+
     # Hash new password
     new_hashed_password = get_password_hash(password_data.new_password)
     
@@ -2196,7 +2480,7 @@ async def update_password(
     return {"message": "Password updated successfully"}
 
 @app.put("/reset-password")
-async def reset_password(
+def reset_password(
     password_data: PasswordReset,
     db: Session = Depends(get_db)
 ):
@@ -2217,9 +2501,9 @@ async def reset_password(
             detail="No account found with this email address"
         )
     
-    # Hash new password
+    # Hash new password (this def handler already runs on the threadpool)
     new_hashed_password = get_password_hash(password_data.new_password)
-    
+
     # Update password in database
     user.hashed_password = new_hashed_password
     user.updated_at = get_mountain_time()
@@ -2233,11 +2517,11 @@ async def reset_password(
 @app.get("/payment-methods", response_model=List[str])
 async def get_payment_methods():
     """Get list of available payment methods"""
-    return get_standard_payment_methods()
+    return Response(content=_PAYMENT_METHODS_JSON, media_type="application/json")
 
 # Market Item Endpoints (public marketplace)
 @app.post("/market-items", response_model=MarketItemResponse, status_code=status.HTTP_201_CREATED)
-async def create_market_item(item: MarketItemCreate, current_user: User = Depends(get_current_active_user), db: Session = Depends(get_db)):
+def create_market_item(item: MarketItemCreate, current_user: User = Depends(get_current_active_user), db: Session = Depends(get_db)):
     """Create a market item (public by default)"""
     # Ensure price is 0 if is_free is True
     final_price = 0.0 if item.is_free else item.price
@@ -2272,15 +2556,16 @@ async def create_market_item(item: MarketItemCreate, current_user: User = Depend
         owner_id=current_user.id
     )
     db.add(db_item)
-    db.commit()
-    db.refresh(db_item)
+    # Flush assigns the client-side defaults (id, created_at); building the
+    # response before commit avoids the refresh SELECT round-trip
+    db.flush()
     price_reduction = calculate_price_reduction_fields(db_item)
-    
+
     # Check if owner is admin
     owner_is_admin = current_user.permissions == "admin"
-    
+
     # Build response manually to avoid duplicate keyword arguments
-    return MarketItemResponse(
+    response = MarketItemResponse(
         id=str(db_item.id),
         name=db_item.name,
         description=db_item.description,
@@ -2315,9 +2600,11 @@ async def create_market_item(item: MarketItemCreate, current_user: User = Depend
         is_watched=None,
         **price_reduction
     )
+    db.commit()
+    return response
 
 @app.get("/market-items", response_model=MarketItemsPaginatedResponse)
-async def list_market_items(
+def list_market_items(
     search: Optional[str] = Query(None, description="Search term to match in name or description"),
     category: Optional[str] = None,
     min_price: Optional[float] = None,
@@ -2632,7 +2919,7 @@ async def list_market_items(
 
 # Market Item Messaging Endpoints (must be before /market-items/{item_id} route)
 @app.get("/market-items/conversations", response_model=List[MarketItemConversationResponse])
-async def get_market_item_conversations(
+def get_market_item_conversations(
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
@@ -2642,25 +2929,37 @@ async def get_market_item_conversations(
         (MarketItemConversation.participant1_id == current_user.id) | 
         (MarketItemConversation.participant2_id == current_user.id)
     ).order_by(MarketItemConversation.updated_at.desc()).all()
-    
+
+    conversation_ids = [conv.id for conv in conversations]
+
+    # Batch the per-conversation lookups: one windowed query for the latest
+    # messages, one grouped count for unread, one IN query each for item
+    # names and the users referenced anywhere in the page
+    last_messages = get_last_messages_map(db, conversation_ids, MarketItemMessage)
+    unread_counts = get_unread_counts_map(db, conversation_ids, current_user.id, MarketItemMessage)
+
+    item_ids = {conv.item_id for conv in conversations if conv.item_id}
+    item_names = dict(db.execute(
+        select(Item.id, Item.name).where(Item.id.in_(item_ids))
+    ).all()) if item_ids else {}
+
+    user_ids = set()
+    for conv in conversations:
+        user_ids.update((conv.participant1_id, conv.participant2_id))
+    for last_msg in last_messages.values():
+        user_ids.update((last_msg.sender_id, last_msg.recipient_id))
+    users = get_users_map(db, user_ids)
+
     result: List[MarketItemConversationResponse] = []
     for conv in conversations:
-        # Get item info
-        item = db.query(Item).filter(Item.id == conv.item_id).first()
-        
-        # Get participant usernames
-        p1 = db.query(User).filter(User.id == conv.participant1_id).first()
-        p2 = db.query(User).filter(User.id == conv.participant2_id).first()
-        
-        # Get last message
-        last_msg = db.query(MarketItemMessage).filter(
-            MarketItemMessage.conversation_id == conv.id
-        ).order_by(MarketItemMessage.created_at.desc()).first()
-        
+        p1 = users.get(conv.participant1_id)
+        p2 = users.get(conv.participant2_id)
+        last_msg = last_messages.get(conv.id)
+
         last_message_response = None
         if last_msg:
-            sender = db.query(User).filter(User.id == last_msg.sender_id).first()
-            recipient = db.query(User).filter(User.id == last_msg.recipient_id).first()
+            sender = users.get(last_msg.sender_id)
+            recipient = users.get(last_msg.recipient_id)
             last_message_response = MarketItemMessageResponse(
                 id=last_msg.id,
                 content=last_msg.content,
@@ -2674,18 +2973,11 @@ async def get_market_item_conversations(
                 recipient_id=last_msg.recipient_id,
                 recipient_username=recipient.username if recipient else "unknown"
             )
-        
-        # Count unread messages for current user
-        unread_count = db.query(MarketItemMessage).filter(
-            MarketItemMessage.conversation_id == conv.id,
-            MarketItemMessage.recipient_id == current_user.id,
-            MarketItemMessage.is_read == False
-        ).count()
-        
+
         result.append(MarketItemConversationResponse(
             id=conv.id,
             item_id=conv.item_id,
-            item_name=item.name if item else "Unknown Item",
+            item_name=item_names.get(conv.item_id, "Unknown Item"),
             participant1_id=conv.participant1_id,
             participant1_username=p1.username if p1 else "unknown",
             participant2_id=conv.participant2_id,
@@ -2693,12 +2985,12 @@ async def get_market_item_conversations(
             created_at=conv.created_at,
             updated_at=conv.updated_at,
             last_message=last_message_response,
-            unread_count=unread_count
+            unread_count=unread_counts.get(conv.id, 0)
         ))
     return result
 
 @app.post("/market-items/conversations/{conversation_id}/messages", response_model=MarketItemMessageResponse, status_code=status.HTTP_201_CREATED)
-async def send_market_item_conversation_message(
+def send_market_item_conversation_message(
     conversation_id: str,
     message: MarketItemMessageCreate,
     current_user: User = Depends(get_current_active_user),
@@ -2706,7 +2998,7 @@ async def send_market_item_conversation_message(
 ):
     """Send a message in an existing market item conversation"""
     # Get conversation
-    conversation = db.query(MarketItemConversation).filter(MarketItemConversation.id == conversation_id).first()
+    conversation = db.get(MarketItemConversation, conversation_id)
     if not conversation:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Conversation not found")
     
@@ -2735,13 +3027,14 @@ async def send_market_item_conversation_message(
     # Update conversation updated_at
     conversation.updated_at = get_mountain_time()
     
-    db.commit()
-    db.refresh(db_message)
+    # Flush assigns the client-side defaults (id, created_at, is_read); the
+    # response is built before commit so no readback SELECT is needed
+    db.flush()
     
     # Get usernames
-    recipient = db.query(User).filter(User.id == recipient_id).first()
+    recipient = db.get(User, recipient_id)
     
-    return MarketItemMessageResponse(
+    response = MarketItemMessageResponse(
         id=db_message.id,
         content=db_message.content,
         is_read=db_message.is_read,
@@ -2755,15 +3048,18 @@ async def send_market_item_conversation_message(
         recipient_username=recipient.username if recipient else "unknown"
     )
 
+    db.commit()
+    return response
+
 @app.get("/market-items/conversations/{conversation_id}/messages", response_model=List[MarketItemMessageResponse])
-async def get_market_item_conversation_messages(
+def get_market_item_conversation_messages(
     conversation_id: str,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """Get all messages for a specific market item conversation"""
     # Get conversation
-    conversation = db.query(MarketItemConversation).filter(MarketItemConversation.id == conversation_id).first()
+    conversation = db.get(MarketItemConversation, conversation_id)
     if not conversation:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Conversation not found")
     
@@ -2776,10 +3072,11 @@ async def get_market_item_conversation_messages(
         MarketItemMessage.conversation_id == conversation_id
     ).order_by(MarketItemMessage.created_at.asc()).all()
     
+    users = get_users_map(db, [m.sender_id for m in messages] + [m.recipient_id for m in messages])
     result: List[MarketItemMessageResponse] = []
     for msg in messages:
-        sender = db.query(User).filter(User.id == msg.sender_id).first()
-        recipient = db.query(User).filter(User.id == msg.recipient_id).first()
+        sender = users.get(msg.sender_id)
+        recipient = users.get(msg.recipient_id)
         result.append(MarketItemMessageResponse(
             id=msg.id,
             content=msg.content,
@@ -2796,54 +3093,68 @@ async def get_market_item_conversation_messages(
     return result
 
 @app.put("/market-items/messages/{message_id}/read", status_code=status.HTTP_200_OK)
-async def mark_market_item_message_read(
+def mark_market_item_message_read(
     message_id: str,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """Mark a market item message as read"""
-    message = db.query(MarketItemMessage).filter(MarketItemMessage.id == message_id).first()
-    if not message:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Message not found")
-    
-    # Only recipient can mark as read
-    if message.recipient_id != current_user.id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to mark this message as read")
-    
-    message.is_read = True
+    # Ownership rides in the UPDATE's WHERE clause: one statement on the
+    # happy path instead of SELECT-then-UPDATE (and no TOCTOU window)
+    updated = db.execute(
+        update(MarketItemMessage)
+        .where(MarketItemMessage.id == message_id, MarketItemMessage.recipient_id == current_user.id)
+        .values(is_read=True)
+    ).rowcount
     db.commit()
-    
+
+    if not updated:
+        # Failure path only: one SELECT to tell missing from not-yours
+        recipient_id = db.execute(
+            select(MarketItemMessage.recipient_id).where(MarketItemMessage.id == message_id)
+        ).scalar()
+        if recipient_id is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Message not found")
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to mark this message as read")
+
     return {"message": "Message marked as read"}
 
 @app.get("/market-items/messages/unread-count", response_model=dict)
-async def get_market_item_unread_count(
+def get_market_item_unread_count(
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """Get unread message count for market items"""
-    unread_count = db.query(MarketItemMessage).filter(
-        MarketItemMessage.recipient_id == current_user.id,
+    user_id = current_user.id
+    stmt = lambda_stmt(lambda: select(func.count()).select_from(MarketItemMessage).where(
+        MarketItemMessage.recipient_id == user_id,
         MarketItemMessage.is_read == False
-    ).count()
-    
+    ))
+    unread_count = db.execute(stmt).scalar() or 0
+
     return {"unread_count": unread_count}
 
 @app.post("/market-items/{item_id}/messages", response_model=MarketItemMessageResponse, status_code=status.HTTP_201_CREATED)
-async def send_market_item_message(
+def send_market_item_message(
     item_id: str,
     message: MarketItemMessageCreate,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """Send a message to the seller about a market item (creates conversation if needed)"""
-    # Get the item
-    item = db.query(Item).filter(Item.id == item_id).first()
-    if not item:
+    # Validate the item and fetch the seller's username in one joined query
+    row = db.execute(
+        select(Item.owner_id, User.username)
+        .join(User, User.id == Item.owner_id)
+        .where(Item.id == item_id)
+    ).first()
+    if row is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Item not found")
-    
+
     # Determine recipient (seller is the item owner)
-    seller_id = item.owner_id
+    seller_id = row.owner_id
     recipient_id = message.recipient_id or seller_id
+    recipient_username = row.username if recipient_id == seller_id else None
     
     # Can't message yourself
     if current_user.id == recipient_id:
@@ -2888,13 +3199,17 @@ async def send_market_item_message(
     # Update conversation updated_at
     conversation.updated_at = get_mountain_time()
     
-    db.commit()
-    db.refresh(db_message)
-    
-    # Get usernames
-    recipient = db.query(User).filter(User.id == recipient_id).first()
-    
-    return MarketItemMessageResponse(
+    # Flush assigns the client-side defaults (id, created_at, is_read); the
+    # response is built before commit so no readback SELECT is needed
+    db.flush()
+
+    # Only look the recipient up if it wasn't the seller from the joined query
+    if recipient_username is None:
+        recipient_username = db.execute(
+            select(User.username).where(User.id == recipient_id)
+        ).scalar()
+
+    response = MarketItemMessageResponse(
         id=db_message.id,
         content=db_message.content,
         is_read=db_message.is_read,
@@ -2905,19 +3220,22 @@ async def send_market_item_message(
         sender_is_admin=(current_user.permissions == "admin"),
         sender_profile_picture=current_user.profile_picture,
         recipient_id=recipient_id,
-        recipient_username=recipient.username if recipient else "unknown"
+        recipient_username=recipient_username or "unknown"
     )
 
+    db.commit()
+    return response
+
 @app.get("/market-items/{item_id}/messages", response_model=List[MarketItemMessageResponse])
-async def get_market_item_messages(
+def get_market_item_messages(
     item_id: str,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """Get all messages for a conversation about a specific market item"""
     # Get the item
-    item = db.query(Item).filter(Item.id == item_id).first()
-    if not item:
+    # Existence check only — select the PK instead of hydrating the full row
+    if db.execute(select(Item.id).where(Item.id == item_id)).first() is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Item not found")
     
     # Find conversation for this item involving current user
@@ -2934,10 +3252,11 @@ async def get_market_item_messages(
         MarketItemMessage.conversation_id == conversation.id
     ).order_by(MarketItemMessage.created_at.asc()).all()
     
+    users = get_users_map(db, [m.sender_id for m in messages] + [m.recipient_id for m in messages])
     result: List[MarketItemMessageResponse] = []
     for msg in messages:
-        sender = db.query(User).filter(User.id == msg.sender_id).first()
-        recipient = db.query(User).filter(User.id == msg.recipient_id).first()
+        sender = users.get(msg.sender_id)
+        recipient = users.get(msg.recipient_id)
         result.append(MarketItemMessageResponse(
             id=msg.id,
             content=msg.content,
@@ -2955,7 +3274,7 @@ async def get_market_item_messages(
 
 # Market Item Featured Image Endpoints (must be before /market-items/{item_id} route)
 @app.put("/market-items/{item_id}/featured-image", response_model=FeaturedImageResponse)
-async def set_market_item_featured_image(
+def set_market_item_featured_image(
     item_id: str,
     request: Request,
     featured_request: SetFeaturedImageRequest,
@@ -3030,7 +3349,7 @@ async def set_market_item_featured_image(
     )
 
 @app.delete("/market-items/{item_id}/featured-image", response_model=FeaturedImageResponse)
-async def remove_market_item_featured_image(
+def remove_market_item_featured_image(
     item_id: str,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
@@ -3057,14 +3376,14 @@ async def remove_market_item_featured_image(
     )
 
 @app.get("/market-items/{item_id}/images", response_model=dict)
-async def get_market_item_images(
+def get_market_item_images(
     item_id: str,
     request: Request,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """Get all available images for a market item (photos + user's uploaded images)"""
-    item = db.query(Item).filter(Item.id == item_id).first()
+    item = db.get(Item, item_id)
     
     if not item:
         raise HTTPException(
@@ -3091,22 +3410,11 @@ async def get_market_item_images(
     uploaded_images = []
     if item.owner_id == current_user.id:
         try:
-            prefix = f"images/{current_user.id}/"
-            response = s3_client.list_objects_v2(
-                Bucket=MINIO_BUCKET_NAME,
-                Prefix=prefix
-            )
-            
-            if 'Contents' in response:
-                for obj in response['Contents']:
-                    image_url = f"{base_url}/image-proxy/{obj['Key']}"
-                    uploaded_images.append({
-                        'key': obj['Key'],
-                        'url': image_url,
-                        'size': obj['Size'],
-                        'last_modified': obj['LastModified'].isoformat(),
-                        'filename': obj['Key'].split('/')[-1]
-                    })
+            for obj in list_user_image_objects(current_user.id):
+                uploaded_images.append({
+                    **obj,
+                    'url': f"{base_url}/image-proxy/{obj['key']}"
+                })
         except Exception as e:
             print(f"Error fetching uploaded images: {e}")
     
@@ -3119,7 +3427,7 @@ async def get_market_item_images(
     }
 
 @app.get("/market-items/{item_id}", response_model=MarketItemResponse)
-async def get_market_item(item_id: str, authorization: Optional[str] = Header(None, alias="Authorization"), db: Session = Depends(get_db)):
+def get_market_item(item_id: str, authorization: Optional[str] = Header(None, alias="Authorization"), db: Session = Depends(get_db)):
     """Get a single market item (must be public unless hidden)"""
     try:
         from sqlalchemy.orm import joinedload
@@ -3188,14 +3496,14 @@ async def get_market_item(item_id: str, authorization: Optional[str] = Header(No
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Internal server error: {str(e)}")
 
 @app.post("/market-items/{item_id}/comments", response_model=MarketItemCommentResponse, status_code=status.HTTP_201_CREATED)
-async def create_market_item_comment(
+def create_market_item_comment(
     item_id: str,
     comment: MarketItemCommentCreate,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
-    item = db.query(Item).filter(Item.id == item_id).first()
-    if not item:
+    # Existence check only — select the PK instead of hydrating the full row
+    if db.execute(select(Item.id).where(Item.id == item_id)).first() is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Item not found")
     db_comment = MarketItemComment(
         content=comment.content,
@@ -3203,9 +3511,10 @@ async def create_market_item_comment(
         user_id=current_user.id
     )
     db.add(db_comment)
-    db.commit()
-    db.refresh(db_comment)
-    return MarketItemCommentResponse(
+    # Flush assigns the client-side defaults; build the response before
+    # commit so no refresh SELECT is needed
+    db.flush()
+    response = MarketItemCommentResponse(
         id=db_comment.id,
         content=db_comment.content,
         created_at=db_comment.created_at,
@@ -3216,17 +3525,19 @@ async def create_market_item_comment(
         user_profile_picture=current_user.profile_picture,
         item_id=item_id
     )
+    db.commit()
+    return response
 
 @app.get("/market-items/{item_id}/comments", response_model=List[MarketItemCommentResponse])
-async def get_market_item_comments(item_id: str, db: Session = Depends(get_db)):
-    item = db.query(Item).filter(Item.id == item_id).first()
-    if not item:
+def get_market_item_comments(item_id: str, db: Session = Depends(get_db)):
+    # Existence check only — select the PK instead of hydrating the full row
+    if db.execute(select(Item.id).where(Item.id == item_id)).first() is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Item not found")
     comments = db.query(MarketItemComment).filter(MarketItemComment.item_id == item_id).order_by(MarketItemComment.created_at.asc()).all()
     result: List[MarketItemCommentResponse] = []
     for c in comments:
         # fetch username
-        user = db.query(User).filter(User.id == c.user_id).first()
+        user = db.get(User, c.user_id)
         result.append(MarketItemCommentResponse(
             id=c.id,
             content=c.content,
@@ -3241,42 +3552,42 @@ async def get_market_item_comments(item_id: str, db: Session = Depends(get_db)):
     return result
 
 @app.delete("/market-items/comments/{comment_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_market_item_comment(
+def delete_market_item_comment(
     comment_id: str,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
-    db_comment = db.query(MarketItemComment).filter(MarketItemComment.id == comment_id).first()
+    db_comment = db.get(MarketItemComment, comment_id)
     if not db_comment:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Comment not found")
     if db_comment.user_id != current_user.id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to delete this comment")
     db.delete(db_comment)
     db.commit()
-    return JSONResponse(status_code=status.HTTP_204_NO_CONTENT, content=None)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 @app.post("/market-items/{item_id}/watch", status_code=status.HTTP_204_NO_CONTENT)
-async def watch_market_item(item_id: str, current_user: User = Depends(get_current_active_user), db: Session = Depends(get_db)):
-    item = db.query(Item).filter(Item.id == item_id).first()
-    if not item:
+def watch_market_item(item_id: str, current_user: User = Depends(get_current_active_user), db: Session = Depends(get_db)):
+    # Existence check only — select the PK instead of hydrating the full row
+    if db.execute(select(Item.id).where(Item.id == item_id)).first() is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Item not found")
     existing = db.query(WatchedItem).filter(WatchedItem.user_id == current_user.id, WatchedItem.item_id == item_id).first()
     if not existing:
         db_watch = WatchedItem(user_id=current_user.id, item_id=item_id)
         db.add(db_watch)
         db.commit()
-    return JSONResponse(status_code=status.HTTP_204_NO_CONTENT, content=None)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 @app.delete("/market-items/{item_id}/watch", status_code=status.HTTP_204_NO_CONTENT)
-async def unwatch_market_item(item_id: str, current_user: User = Depends(get_current_active_user), db: Session = Depends(get_db)):
+def unwatch_market_item(item_id: str, current_user: User = Depends(get_current_active_user), db: Session = Depends(get_db)):
     existing = db.query(WatchedItem).filter(WatchedItem.user_id == current_user.id, WatchedItem.item_id == item_id).first()
     if existing:
         db.delete(existing)
         db.commit()
-    return JSONResponse(status_code=status.HTTP_204_NO_CONTENT, content=None)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 @app.get("/user/watched-items", response_model=List[MarketItemResponse])
-async def get_watched_items(
+def get_watched_items(
     current_user: User = Depends(get_current_active_user),
     item_status: Optional[str] = Query(None, pattern="^(active|pending|sold|hidden)$", alias="status"),
     limit: int = Query(50, ge=1, le=100),
@@ -3288,7 +3599,7 @@ async def get_watched_items(
     query = db.query(WatchedItem, Item).join(Item, WatchedItem.item_id == Item.id).filter(
         WatchedItem.user_id == current_user.id,
         Item.is_public == True
-    )
+    ).options(selectinload(Item.owner))
     
     # Filter by status if provided (default: active)
     if item_status:
@@ -3354,11 +3665,11 @@ async def get_watched_items(
     return result
 
 @app.put("/market-items/{item_id}", response_model=MarketItemResponse)
-async def update_market_item(item_id: str, update: MarketItemUpdate, current_user: User = Depends(get_current_active_user), db: Session = Depends(get_db)):
+def update_market_item(item_id: str, update: MarketItemUpdate, current_user: User = Depends(get_current_active_user), db: Session = Depends(get_db)):
     """Update a market item (owner only, or admin can edit any item)"""
     # Allow admins to edit any item, otherwise only owner can edit
     if current_user.permissions == "admin":
-        item = db.query(Item).filter(Item.id == item_id).first()
+        item = db.get(Item, item_id)
     else:
         item = db.query(Item).filter(Item.id == item_id, Item.owner_id == current_user.id).first()
     
@@ -3367,7 +3678,7 @@ async def update_market_item(item_id: str, update: MarketItemUpdate, current_use
     
     # Track price changes
     old_price = item.price
-    update_data = update.dict(exclude_unset=True)
+    update_data = update.model_dump(exclude_unset=True)
     
     # Handle is_free and price synchronization
     if "is_free" in update_data or "price" in update_data:
@@ -3449,11 +3760,11 @@ async def update_market_item(item_id: str, update: MarketItemUpdate, current_use
     )
 
 @app.delete("/market-items/{item_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_market_item(item_id: str, current_user: User = Depends(get_current_active_user), db: Session = Depends(get_db)):
+def delete_market_item(item_id: str, current_user: User = Depends(get_current_active_user), db: Session = Depends(get_db)):
     """Delete a market item (owner only, or admin can delete any item)"""
     # Allow admins to delete any item, otherwise only owner can delete
     if current_user.permissions == "admin":
-        item = db.query(Item).filter(Item.id == item_id).first()
+        item = db.get(Item, item_id)
     else:
         item = db.query(Item).filter(Item.id == item_id, Item.owner_id == current_user.id).first()
     
@@ -3484,7 +3795,7 @@ async def delete_market_item(item_id: str, current_user: User = Depends(get_curr
         db.delete(item)
         db.commit()
         
-        return JSONResponse(status_code=status.HTTP_204_NO_CONTENT, content=None)
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
     except Exception as e:
         db.rollback()
         raise HTTPException(
@@ -3494,7 +3805,7 @@ async def delete_market_item(item_id: str, current_user: User = Depends(get_curr
 
 # Yard Sale Endpoints
 @app.post("/yard-sales", response_model=YardSaleResponse, status_code=status.HTTP_201_CREATED)
-async def create_yard_sale(yard_sale: YardSaleCreate, current_user: User = Depends(get_current_active_user), db: Session = Depends(get_db)):
+def create_yard_sale(yard_sale: YardSaleCreate, current_user: User = Depends(get_current_active_user), db: Session = Depends(get_db)):
     """Create a new yard sale"""
     db_yard_sale = YardSale(
         title=yard_sale.title,
@@ -3522,29 +3833,43 @@ async def create_yard_sale(yard_sale: YardSaleCreate, current_user: User = Depen
         photos=yard_sale.photos,
         featured_image=yard_sale.featured_image,
         status=yard_sale.status.value if yard_sale.status else "active",
-        owner_id=current_user.id
+        owner_id=current_user.id,
+        owner_username=current_user.username
     )
     
     db.add(db_yard_sale)
-    db.commit()
-    db.refresh(db_yard_sale)
-    
-    # Get comment count
-    comment_count = db.query(Comment).filter(Comment.yard_sale_id == db_yard_sale.id).count()
-    
+    # Flush assigns the client-side defaults; build the response before
+    # commit so no refresh SELECT is needed. A brand-new sale has no comments.
+    db.flush()
+
     # Check if owner is admin
     owner_is_admin = current_user.permissions == "admin"
-    
-    return YardSaleResponse(
-        **db_yard_sale.__dict__,
-        owner_username=current_user.username,
+
+    response = YardSaleResponse(
+        **orm_to_dict(db_yard_sale),
         owner_is_admin=owner_is_admin,
         owner_profile_picture=current_user.profile_picture,
-        comment_count=comment_count
+        comment_count=0
     )
+    db.commit()
+    _invalidate_yard_sale_list_cache()
+    return response
+
+# Short-TTL cache for the anonymous /yard-sales listing, the hottest read in
+# the app. Entries are keyed on the full filter/paging tuple and invalidated
+# whenever a yard sale is created, updated or deleted. A shared Redis cache
+# would be needed for multi-process deployments; a plain dict matches the
+# single-process uvicorn setup used here.
+YARD_SALE_LIST_CACHE_TTL = int(os.getenv("YARD_SALE_LIST_CACHE_TTL", "5"))
+_yard_sale_list_cache: Dict[tuple, tuple] = {}
+
+
+def _invalidate_yard_sale_list_cache():
+    _yard_sale_list_cache.clear()
+
 
 @app.get("/yard-sales", response_model=List[YardSaleResponse])
-async def get_yard_sales(
+def get_yard_sales(
     skip: int = 0,
     limit: int = 100,
     city: Optional[str] = None,
@@ -3554,10 +3879,34 @@ async def get_yard_sales(
     price_range: Optional[str] = None,
     status: Optional[YardSaleStatus] = None,
     include_visited_status: bool = False,
+    after_start_date: Optional[date] = Query(None, description="Keyset cursor: start_date of the last yard sale on the previous page"),
+    after_id: Optional[str] = Query(None, description="Keyset cursor: id of the last yard sale on the previous page"),
+    stream: bool = Query(False, description="Stream the JSON array row by row instead of buffering the whole page"),
     authorization: Optional[str] = Header(None, alias="Authorization"),
+    if_none_match: Optional[str] = Header(None, alias="If-None-Match"),
     db: Session = Depends(get_db)
 ):
-    """Get all active yard sales with optional filtering"""
+    """Get all active yard sales with optional filtering.
+
+    Pass the last row's start_date/id back as after_start_date/after_id to
+    page with an index seek instead of a deep OFFSET scan; skip is kept for
+    existing clients. With stream=true the response body is written
+    incrementally, so large pages don't buffer a second serialized copy.
+    """
+    # Anonymous requests with identical filters return near-identical
+    # payloads; serve them from the short-TTL cache with an ETag so repeat
+    # clients get 304s. Authenticated or streamed requests bypass the cache.
+    cache_key = None
+    if authorization is None and not include_visited_status and not stream:
+        cache_key = (skip, limit, city, state, zip_code, category, price_range,
+                     status.value if status else None, after_start_date, after_id)
+        cached = _yard_sale_list_cache.get(cache_key)
+        if cached and cached[0] > datetime.now().timestamp():
+            _, etag, body = cached
+            if if_none_match == etag:
+                return Response(status_code=304, headers={"ETag": etag})
+            return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
     # Get optional current user for visited status
     current_user = None
     if authorization:
@@ -3571,7 +3920,9 @@ async def get_yard_sales(
     
     # Apply filters
     if city:
-        query = query.filter(YardSale.city.ilike(f"%{city}%"))
+        # Prefix match instead of %substring% so the city index is usable;
+        # MySQL's ci collation already makes LIKE case-insensitive
+        query = query.filter(YardSale.city.like(f"{city}%"))
     if state:
         query = query.filter(YardSale.state == state.upper())
     if zip_code:
@@ -3583,103 +3934,131 @@ async def get_yard_sales(
     if status:
         query = query.filter(YardSale.status == status.value)
     
-    # Order by start date (upcoming sales first)
-    query = query.order_by(YardSale.start_date.asc())
-    
-    yard_sales = query.offset(skip).limit(limit).all()
-    
-    # Build response with comment counts and visited status
-    result = []
-    for yard_sale in yard_sales:
-        comment_count = db.query(Comment).filter(Comment.yard_sale_id == yard_sale.id).count()
-        
+    # Order by start date (upcoming sales first), eager-loading owners with
+    # the page instead of lazy-loading one per yard sale; the id tiebreaker
+    # keeps the keyset ordering stable
+    query = query.options(joinedload(YardSale.owner)).order_by(YardSale.start_date.asc(), YardSale.id.asc())
+
+    if after_start_date is not None and after_id is not None:
+        query = query.filter(tuple_(YardSale.start_date, YardSale.id) > (after_start_date, after_id))
+        yard_sales = query.limit(limit).all()
+    else:
+        yard_sales = query.offset(skip).limit(limit).all()
+    yard_sale_ids = [yard_sale.id for yard_sale in yard_sales]
+
+    # Batch the per-yard-sale lookups: one grouped count for comments and one
+    # IN query for the user's visits, instead of 1-2 queries per row
+    comment_counts = {}
+    visits_by_yard_sale = {}
+    if yard_sale_ids:
+        comment_counts = dict(db.execute(
+            select(Comment.yard_sale_id, func.count(Comment.id))
+            .where(Comment.yard_sale_id.in_(yard_sale_ids))
+            .group_by(Comment.yard_sale_id)
+        ).all())
+
+        if include_visited_status and current_user:
+            visits = db.query(VisitedYardSale).filter(
+                VisitedYardSale.user_id == current_user.id,
+                VisitedYardSale.yard_sale_id.in_(yard_sale_ids)
+            ).all()
+            visits_by_yard_sale = {visit.yard_sale_id: visit for visit in visits}
+
+    def build_response(yard_sale):
         # Get visited status if requested and user is authenticated
         is_visited = None
         visit_count = None
         last_visited = None
-        
+
         if include_visited_status and current_user:
-            visit = db.query(VisitedYardSale).filter(
-                VisitedYardSale.user_id == current_user.id,
-                VisitedYardSale.yard_sale_id == yard_sale.id
-            ).first()
-            
+            visit = visits_by_yard_sale.get(yard_sale.id)
             if visit:
                 is_visited = True
                 visit_count = visit.visit_count
                 last_visited = visit.last_visited
             else:
                 is_visited = False
-        
+
         # Check if owner is admin
         owner_is_admin = yard_sale.owner.permissions == "admin" if yard_sale.owner else False
-        
-        result.append(YardSaleResponse(
-            **yard_sale.__dict__,
-            owner_username=yard_sale.owner.username if yard_sale.owner else "unknown",
+
+        return YardSaleResponse(
+            **yard_sale_data(yard_sale),
             owner_is_admin=owner_is_admin,
             owner_profile_picture=yard_sale.owner.profile_picture if yard_sale.owner else None,
-            comment_count=comment_count,
+            comment_count=comment_counts.get(yard_sale.id, 0),
             is_visited=is_visited,
             visit_count=visit_count,
             last_visited=last_visited
-        ))
-    
+        )
+
+    if stream:
+        # Serialize one row at a time so the full page is never held as a
+        # second JSON copy in memory; owners and counts are already batched
+        # above, so no queries run while the body is being written
+        def stream_rows():
+            yield b"["
+            first = True
+            for yard_sale in yard_sales:
+                if not first:
+                    yield b","
+                first = False
+                yield orjson.dumps(build_response(yard_sale).model_dump())
+            yield b"]"
+
+        return StreamingResponse(stream_rows(), media_type="application/json")
+
+    result = [build_response(yard_sale) for yard_sale in yard_sales]
+
+    if cache_key is not None:
+        body = orjson.dumps([response.model_dump() for response in result])
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+        _yard_sale_list_cache[cache_key] = (
+            datetime.now().timestamp() + YARD_SALE_LIST_CACHE_TTL, etag, body
+        )
+        if if_none_match == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
     return result
 
 # Yard Sale Messaging Endpoints (must be before /yard-sales/{yard_sale_id} route)
 @app.post("/yard-sales/{yard_sale_id}/messages", response_model=YardSaleMessageResponse, status_code=status.HTTP_201_CREATED)
-async def send_yard_sale_message(
+def send_yard_sale_message(
     yard_sale_id: str,
     message: YardSaleMessageCreate,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """Send initial message to a yard sale (creates a conversation)"""
-    # Get the yard sale
-    yard_sale = db.query(YardSale).filter(YardSale.id == yard_sale_id).first()
-    if not yard_sale:
+    # Validate the yard sale and fetch the recipient (its owner) in one joined query
+    row = db.execute(
+        select(YardSale.allow_messages, YardSale.owner_id, User.username)
+        .join(User, User.id == YardSale.owner_id)
+        .where(YardSale.id == yard_sale_id)
+    ).first()
+    if row is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Yard sale not found")
-    
+
     # Check if yard sale allows messages
-    if not yard_sale.allow_messages:
+    if not row.allow_messages:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="This yard sale does not allow messages")
-    
+
     # Determine recipient (seller is the yard sale owner)
-    seller_id = yard_sale.owner_id
+    seller_id = row.owner_id
     recipient_id = seller_id
-    
+    recipient_username = row.username
+
     # Can't message yourself
     if current_user.id == recipient_id:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cannot send message to yourself")
     
-    # Find or create conversation
-    conversation = db.query(Conversation).filter(
-        Conversation.yard_sale_id == yard_sale_id,
-        ((Conversation.participant1_id == current_user.id) & (Conversation.participant2_id == recipient_id)) |
-        ((Conversation.participant1_id == recipient_id) & (Conversation.participant2_id == current_user.id))
-    ).first()
-    
-    if not conversation:
-        # Create new conversation (participant1 is the buyer/inquirer, participant2 is the seller)
-        if current_user.id == seller_id:
-            # Seller messaging someone (shouldn't happen normally, but handle it)
-            conversation = Conversation(
-                yard_sale_id=yard_sale_id,
-                participant1_id=recipient_id,
-                participant2_id=current_user.id
-            )
-        else:
-            # Buyer messaging seller
-            conversation = Conversation(
-                yard_sale_id=yard_sale_id,
-                participant1_id=current_user.id,
-                participant2_id=seller_id
-            )
-        db.add(conversation)
-        db.commit()
-        db.refresh(conversation)
-    
+    # Find or create conversation. The helper normalizes participant order
+    # (smaller id first) — the invariant the unique triplet index relies on —
+    # and handles the concurrent-first-message race, so every creation path
+    # must go through it
+    conversation = get_or_create_conversation(db, yard_sale_id, current_user.id, recipient_id)
+
     # Create message
     db_message = Message(
         content=message.content,
@@ -3688,17 +4067,12 @@ async def send_yard_sale_message(
         recipient_id=recipient_id
     )
     db.add(db_message)
-    
-    # Update conversation updated_at
-    conversation.updated_at = get_mountain_time()
-    
-    db.commit()
-    db.refresh(db_message)
-    
-    # Get usernames
-    recipient = db.query(User).filter(User.id == recipient_id).first()
-    
-    return YardSaleMessageResponse(
+
+    # Flush assigns the client-side defaults (id, created_at, is_read); the
+    # response is built before commit so no readback SELECT is needed
+    db.flush()
+
+    response = YardSaleMessageResponse(
         id=db_message.id,
         content=db_message.content,
         is_read=db_message.is_read,
@@ -3709,40 +4083,127 @@ async def send_yard_sale_message(
         sender_is_admin=(current_user.permissions == "admin"),
         sender_profile_picture=current_user.profile_picture,
         recipient_id=recipient_id,
-        recipient_username=recipient.username if recipient else "unknown",
+        recipient_username=recipient_username,
         yard_sale_id=yard_sale_id
     )
 
+    db.commit()
+    return response
+
+@app.post("/yard-sales/{yard_sale_id}/messages/batch", response_model=List[YardSaleMessageResponse], status_code=status.HTTP_201_CREATED)
+def send_yard_sale_messages_batch(
+    yard_sale_id: str,
+    batch: YardSaleMessageBatchCreate,
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """Send multiple messages to a yard sale in one request.
+
+    Validates the yard sale and conversation once and inserts all messages
+    under a single commit, instead of paying HTTP + commit overhead per message.
+    """
+    # Validate the yard sale and fetch the recipient (its owner) in one joined query
+    row = db.execute(
+        select(YardSale.allow_messages, YardSale.owner_id, User.username)
+        .join(User, User.id == YardSale.owner_id)
+        .where(YardSale.id == yard_sale_id)
+    ).first()
+    if row is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Yard sale not found")
+
+    # Check if yard sale allows messages
+    if not row.allow_messages:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="This yard sale does not allow messages")
+
+    # Determine recipient (seller is the yard sale owner)
+    recipient_id = row.owner_id
+    recipient_username = row.username
+
+    # Can't message yourself
+    if current_user.id == recipient_id:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cannot send message to yourself")
+
+    # Find or create conversation via the shared helper, which normalizes
+    # participant order and handles the concurrent-first-message race under
+    # the unique triplet index
+    conversation = get_or_create_conversation(db, yard_sale_id, current_user.id, recipient_id)
+
+    # Create all messages and commit once
+    db_messages = [
+        Message(
+            content=message.content,
+            conversation_id=conversation.id,
+            sender_id=current_user.id,
+            recipient_id=recipient_id
+        )
+        for message in batch.messages
+    ]
+    db.add_all(db_messages)
+    conversation.updated_at = get_mountain_time()
+
+    # Flush so client-side defaults (id, created_at) are assigned, then build
+    # responses before the commit expires the instances
+    db.flush()
+
+    result = [
+        YardSaleMessageResponse(
+            id=db_message.id,
+            content=db_message.content,
+            is_read=db_message.is_read,
+            created_at=db_message.created_at,
+            conversation_id=db_message.conversation_id,
+            sender_id=current_user.id,
+            sender_username=current_user.username,
+            sender_is_admin=(current_user.permissions == "admin"),
+            sender_profile_picture=current_user.profile_picture,
+            recipient_id=recipient_id,
+            recipient_username=recipient_username,
+            yard_sale_id=yard_sale_id
+        )
+        for db_message in db_messages
+    ]
+
+    db.commit()
+    return result
+
 @app.get("/yard-sales/conversations", response_model=List[YardSaleConversationResponse])
-async def get_yard_sale_conversations(
+def get_yard_sale_conversations(
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """Get all yard sale conversations for the current authenticated user"""
-    # Get all conversations where user is a participant
+    # Get all conversations where user is a participant, eager-loading the
+    # related rows; last messages and unread counts are batched below instead
+    # of being queried once per conversation
     conversations = db.query(Conversation).filter(
-        (Conversation.participant1_id == current_user.id) | 
+        (Conversation.participant1_id == current_user.id) |
         (Conversation.participant2_id == current_user.id)
+    ).options(
+        selectinload(Conversation.yard_sale),
+        selectinload(Conversation.participant1),
+        selectinload(Conversation.participant2)
     ).order_by(Conversation.updated_at.desc()).all()
-    
+
+    conversation_ids = [conv.id for conv in conversations]
+    last_messages = get_last_messages_map(db, conversation_ids)
+    unread_counts = get_unread_counts_map(db, conversation_ids, current_user.id)
+    message_users = get_users_map(
+        db,
+        [m.sender_id for m in last_messages.values()] +
+        [m.recipient_id for m in last_messages.values()]
+    )
+
     result: List[YardSaleConversationResponse] = []
     for conv in conversations:
-        # Get yard sale info
-        yard_sale = db.query(YardSale).filter(YardSale.id == conv.yard_sale_id).first()
-        
-        # Get participant usernames
-        p1 = db.query(User).filter(User.id == conv.participant1_id).first()
-        p2 = db.query(User).filter(User.id == conv.participant2_id).first()
-        
-        # Get last message
-        last_msg = db.query(Message).filter(
-            Message.conversation_id == conv.id
-        ).order_by(Message.created_at.desc()).first()
-        
+        yard_sale = conv.yard_sale
+        p1 = conv.participant1
+        p2 = conv.participant2
+        last_msg = last_messages.get(conv.id)
+
         last_message_response = None
         if last_msg:
-            sender = db.query(User).filter(User.id == last_msg.sender_id).first()
-            recipient = db.query(User).filter(User.id == last_msg.recipient_id).first()
+            sender = message_users.get(last_msg.sender_id)
+            recipient = message_users.get(last_msg.recipient_id)
             # Handle None timestamp (fallback to current time)
             last_msg_created_at = last_msg.created_at if last_msg.created_at else get_mountain_time()
             last_message_response = YardSaleMessageResponse(
@@ -3759,14 +4220,9 @@ async def get_yard_sale_conversations(
                 recipient_username=recipient.username if recipient else "unknown",
                 yard_sale_id=conv.yard_sale_id
             )
-        
-        # Count unread messages for current user
-        unread_count = db.query(Message).filter(
-            Message.conversation_id == conv.id,
-            Message.recipient_id == current_user.id,
-            Message.is_read == False
-        ).count()
-        
+
+        unread_count = unread_counts.get(conv.id, 0)
+
         # Handle None timestamps (fallback to current time)
         created_at = conv.created_at if conv.created_at else get_mountain_time()
         updated_at = conv.updated_at if conv.updated_at else get_mountain_time()
@@ -3787,30 +4243,38 @@ async def get_yard_sale_conversations(
     return result
 
 @app.get("/yard-sales/conversations/{conversation_id}/messages", response_model=List[YardSaleMessageResponse])
-async def get_yard_sale_conversation_messages(
+def get_yard_sale_conversation_messages(
     conversation_id: str,
+    before: Optional[datetime] = Query(None, description="Only return messages created before this timestamp (keyset pagination)"),
+    limit: int = Query(100, ge=1, le=500),
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
-    """Get all messages for a specific conversation"""
+    """Get messages for a specific conversation (newest page first, returned oldest-to-newest).
+
+    Pass the oldest returned message's created_at as ?before= to page further back.
+    """
     # Get conversation
-    conversation = db.query(Conversation).filter(Conversation.id == conversation_id).first()
+    conversation = db.get(Conversation, conversation_id)
     if not conversation:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Conversation not found")
-    
+
     # Verify user is a participant
     if current_user.id not in [conversation.participant1_id, conversation.participant2_id]:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to view this conversation")
-    
-    # Get all messages
-    messages = db.query(Message).filter(
-        Message.conversation_id == conversation_id
-    ).order_by(Message.created_at.asc()).all()
-    
+
+    # Get the most recent page of messages, then flip back to chronological order
+    query = db.query(Message).filter(Message.conversation_id == conversation_id)
+    if before:
+        query = query.filter(Message.created_at < before)
+    messages = query.order_by(Message.created_at.desc(), Message.id.desc()).limit(limit).all()
+    messages.reverse()
+
+    users = get_users_map(db, [m.sender_id for m in messages] + [m.recipient_id for m in messages])
     result: List[YardSaleMessageResponse] = []
     for msg in messages:
-        sender = db.query(User).filter(User.id == msg.sender_id).first()
-        recipient = db.query(User).filter(User.id == msg.recipient_id).first()
+        sender = users.get(msg.sender_id)
+        recipient = users.get(msg.recipient_id)
         # Handle None timestamp (fallback to current time)
         msg_created_at = msg.created_at if msg.created_at else get_mountain_time()
         result.append(YardSaleMessageResponse(
@@ -3830,7 +4294,7 @@ async def get_yard_sale_conversation_messages(
     return result
 
 @app.post("/yard-sales/conversations/{conversation_id}/messages", response_model=YardSaleMessageResponse, status_code=status.HTTP_201_CREATED)
-async def send_yard_sale_conversation_message(
+def send_yard_sale_conversation_message(
     conversation_id: str,
     message: YardSaleMessageCreate,
     current_user: User = Depends(get_current_active_user),
@@ -3838,7 +4302,7 @@ async def send_yard_sale_conversation_message(
 ):
     """Send a message in an existing conversation"""
     # Get conversation
-    conversation = db.query(Conversation).filter(Conversation.id == conversation_id).first()
+    conversation = db.get(Conversation, conversation_id)
     if not conversation:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Conversation not found")
     
@@ -3861,13 +4325,14 @@ async def send_yard_sale_conversation_message(
     # Update conversation updated_at
     conversation.updated_at = get_mountain_time()
     
-    db.commit()
-    db.refresh(db_message)
+    # Flush assigns the client-side defaults (id, created_at, is_read); the
+    # response is built before commit so no readback SELECT is needed
+    db.flush()
     
     # Get usernames
-    recipient = db.query(User).filter(User.id == recipient_id).first()
+    recipient = db.get(User, recipient_id)
     
-    return YardSaleMessageResponse(
+    response = YardSaleMessageResponse(
         id=db_message.id,
         content=db_message.content,
         is_read=db_message.is_read,
@@ -3881,53 +4346,56 @@ async def send_yard_sale_conversation_message(
         yard_sale_id=conversation.yard_sale_id
     )
 
+    db.commit()
+    return response
+
 @app.put("/yard-sales/messages/{message_id}/read", status_code=status.HTTP_200_OK)
-async def mark_yard_sale_message_read(
+def mark_yard_sale_message_read(
     message_id: str,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """Mark a specific message as read"""
-    message = db.query(Message).filter(Message.id == message_id).first()
-    if not message:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Message not found")
-    
-    # Only recipient can mark as read
-    if message.recipient_id != current_user.id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to mark this message as read")
-    
-    message.is_read = True
+    updated = db.execute(
+        update(Message)
+        .where(Message.id == message_id, Message.recipient_id == current_user.id)
+        .values(is_read=True)
+    ).rowcount
     db.commit()
-    
+
+    if not updated:
+        recipient_id = db.execute(
+            select(Message.recipient_id).where(Message.id == message_id)
+        ).scalar()
+        if recipient_id is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Message not found")
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to mark this message as read")
+
     return {"success": True}
 
 @app.get("/yard-sales/messages/unread-count", response_model=dict)
-async def get_yard_sale_unread_count(
+def get_yard_sale_unread_count(
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """Get total count of unread yard sale messages for current user"""
-    # Get conversations where user is a participant
-    conversations = db.query(Conversation).filter(
-        (Conversation.participant1_id == current_user.id) | 
-        (Conversation.participant2_id == current_user.id)
-    ).all()
-    
-    conversation_ids = [conv.id for conv in conversations]
-    
-    # Count unread messages in these conversations
-    unread_count = db.query(Message).filter(
-        Message.conversation_id.in_(conversation_ids),
-        Message.recipient_id == current_user.id,
+    # A message's recipient is by construction a participant in its
+    # conversation, so the old conversation pre-query (which materialized
+    # full Conversation rows just for their ids) was redundant — one cached
+    # count statement on the (recipient_id, is_read) index covers it
+    user_id = current_user.id
+    stmt = lambda_stmt(lambda: select(func.count()).select_from(Message).where(
+        Message.recipient_id == user_id,
         Message.is_read == False
-    ).count() if conversation_ids else 0
-    
+    ))
+    unread_count = db.execute(stmt).scalar()
+
     return {"unread_count": unread_count}
 
 @app.get("/yard-sales/{yard_sale_id}", response_model=YardSaleResponse)
-async def get_yard_sale(yard_sale_id: str, db: Session = Depends(get_db)):
+def get_yard_sale(yard_sale_id: str, db: Session = Depends(get_db)):
     """Get a specific yard sale by ID"""
-    yard_sale = db.query(YardSale).filter(YardSale.id == yard_sale_id).first()
+    yard_sale = db.get(YardSale, yard_sale_id)
     
     if not yard_sale:
         raise HTTPException(
@@ -3942,48 +4410,56 @@ async def get_yard_sale(yard_sale_id: str, db: Session = Depends(get_db)):
     owner_is_admin = yard_sale.owner.permissions == "admin" if yard_sale.owner else False
     
     return YardSaleResponse(
-        **yard_sale.__dict__,
-        owner_username=yard_sale.owner.username if yard_sale.owner else "unknown",
+        **yard_sale_data(yard_sale),
         owner_is_admin=owner_is_admin,
         owner_profile_picture=yard_sale.owner.profile_picture if yard_sale.owner else None,
         comment_count=comment_count
     )
 
 @app.put("/yard-sales/{yard_sale_id}", response_model=YardSaleResponse)
-async def update_yard_sale(
+def update_yard_sale(
     yard_sale_id: str, 
     yard_sale_update: YardSaleUpdate, 
     current_user: User = Depends(get_current_active_user), 
     db: Session = Depends(get_db)
 ):
     """Update a yard sale (owner only, or admin can edit any yard sale)"""
-    # Allow admins to edit any yard sale, otherwise only owner can edit
-    if current_user.permissions == "admin":
-        yard_sale = db.query(YardSale).filter(YardSale.id == yard_sale_id).first()
-    else:
-        yard_sale = db.query(YardSale).filter(
-            YardSale.id == yard_sale_id, 
-            YardSale.owner_id == current_user.id
-        ).first()
-    
+    # Apply transforms to the provided fields, then push them in a single
+    # ownership-filtered UPDATE instead of load + setattr loop + refresh
+    update_data = yard_sale_update.model_dump(exclude_unset=True)
+    for field, value in list(update_data.items()):
+        if field == "state" and value:
+            update_data[field] = value.upper()  # Store state as uppercase
+        elif field == "status" and value:
+            update_data[field] = value.value if hasattr(value, 'value') else value  # Handle enum
+
+    if update_data:
+        stmt = update(YardSale).where(YardSale.id == yard_sale_id).values(**update_data)
+        # Admins may edit any yard sale; everyone else only their own
+        if current_user.permissions != "admin":
+            stmt = stmt.where(YardSale.owner_id == current_user.id)
+        if db.execute(stmt).rowcount == 0:
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Yard sale with id {yard_sale_id} not found"
+            )
+        db.commit()
+        _invalidate_yard_sale_list_cache()
+
+    # Load the updated row once for the response (MySQL has no
+    # UPDATE ... RETURNING); owner comes along in the same query
+    query = db.query(YardSale).options(joinedload(YardSale.owner)).filter(YardSale.id == yard_sale_id)
+    if current_user.permissions != "admin":
+        query = query.filter(YardSale.owner_id == current_user.id)
+    yard_sale = query.first()
+
     if not yard_sale:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Yard sale with id {yard_sale_id} not found"
         )
     
-    # Update only provided fields
-    update_data = yard_sale_update.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        if field == "state" and value:
-            value = value.upper()  # Store state as uppercase
-        elif field == "status" and value:
-            value = value.value if hasattr(value, 'value') else value  # Handle enum
-        setattr(yard_sale, field, value)
-    
-    db.commit()
-    db.refresh(yard_sale)
-    
     # Get comment count
     comment_count = db.query(Comment).filter(Comment.yard_sale_id == yard_sale.id).count()
     
@@ -3991,15 +4467,14 @@ async def update_yard_sale(
     owner_is_admin = yard_sale.owner.permissions == "admin" if yard_sale.owner else False
     
     return YardSaleResponse(
-        **yard_sale.__dict__,
-        owner_username=yard_sale.owner.username if yard_sale.owner else "unknown",
+        **yard_sale_data(yard_sale),
         owner_is_admin=owner_is_admin,
         owner_profile_picture=yard_sale.owner.profile_picture if yard_sale.owner else None,
         comment_count=comment_count
     )
 
 @app.delete("/yard-sales/{yard_sale_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_yard_sale(
+def delete_yard_sale(
     yard_sale_id: str, 
     current_user: User = Depends(get_current_active_user), 
     db: Session = Depends(get_db)
@@ -4007,7 +4482,7 @@ async def delete_yard_sale(
     """Delete a yard sale (owner only, or admin can delete any yard sale)"""
     # Allow admins to delete any yard sale, otherwise only owner can delete
     if current_user.permissions == "admin":
-        yard_sale = db.query(YardSale).filter(YardSale.id == yard_sale_id).first()
+        yard_sale = db.get(YardSale, yard_sale_id)
     else:
         yard_sale = db.query(YardSale).filter(
             YardSale.id == yard_sale_id, 
@@ -4053,8 +4528,9 @@ async def delete_yard_sale(
         # Finally, delete the yard sale
         db.delete(yard_sale)
         db.commit()
-        
-        return JSONResponse(status_code=status.HTTP_204_NO_CONTENT, content=None)
+        _invalidate_yard_sale_list_cache()
+
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
     except Exception as e:
         db.rollback()
         raise HTTPException(
@@ -4063,7 +4539,7 @@ async def delete_yard_sale(
         )
 
 @app.put("/yard-sales/{yard_sale_id}/featured-image", response_model=FeaturedImageResponse)
-async def set_featured_image(
+def set_featured_image(
     yard_sale_id: str,
     request: Request,
     featured_request: SetFeaturedImageRequest,
@@ -4139,7 +4615,7 @@ async def set_featured_image(
     )
 
 @app.delete("/yard-sales/{yard_sale_id}/featured-image", response_model=FeaturedImageResponse)
-async def remove_featured_image(
+def remove_featured_image(
     yard_sale_id: str,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
@@ -4167,14 +4643,14 @@ async def remove_featured_image(
     )
 
 @app.get("/yard-sales/{yard_sale_id}/images", response_model=dict)
-async def get_yard_sale_images(
+def get_yard_sale_images(
     yard_sale_id: str,
     request: Request,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """Get all available images for a yard sale (photos + user's uploaded images)"""
-    yard_sale = db.query(YardSale).filter(YardSale.id == yard_sale_id).first()
+    yard_sale = db.get(YardSale, yard_sale_id)
     
     if not yard_sale:
         raise HTTPException(
@@ -4201,22 +4677,11 @@ async def get_yard_sale_images(
     uploaded_images = []
     if yard_sale.owner_id == current_user.id:
         try:
-            prefix = f"images/{current_user.id}/"
-            response = s3_client.list_objects_v2(
-                Bucket=MINIO_BUCKET_NAME,
-                Prefix=prefix
-            )
-            
-            if 'Contents' in response:
-                for obj in response['Contents']:
-                    image_url = f"{base_url}/image-proxy/{obj['Key']}"
-                    uploaded_images.append({
-                        'key': obj['Key'],
-                        'url': image_url,
-                        'size': obj['Size'],
-                        'last_modified': obj['LastModified'].isoformat(),
-                        'filename': obj['Key'].split('/')[-1]
-                    })
+            for obj in list_user_image_objects(current_user.id):
+                uploaded_images.append({
+                    **obj,
+                    'url': f"{base_url}/image-proxy/{obj['key']}"
+                })
         except Exception as e:
             print(f"Error fetching uploaded images: {e}")
     
@@ -4229,11 +4694,13 @@ async def get_yard_sale_images(
     }
 
 @app.get("/yard-sales/search/nearby", response_model=List[YardSaleResponse])
-async def search_nearby_yard_sales(
+def search_nearby_yard_sales(
     zip_code: str,
     radius_miles: int = 10,
     skip: int = 0,
     limit: int = 50,
+    after_start_date: Optional[date] = Query(None, description="Keyset cursor: start_date of the last yard sale on the previous page"),
+    after_id: Optional[str] = Query(None, description="Keyset cursor: id of the last yard sale on the previous page"),
     db: Session = Depends(get_db)
 ):
     """Search for yard sales near a ZIP code"""
@@ -4242,38 +4709,48 @@ async def search_nearby_yard_sales(
     query = db.query(YardSale).filter(
         YardSale.is_active == True,
         YardSale.zip_code == zip_code
-    ).order_by(YardSale.start_date.asc())
-    
-    yard_sales = query.offset(skip).limit(limit).all()
-    
-    # Build response with comment counts
+    ).options(joinedload(YardSale.owner)).order_by(YardSale.start_date.asc(), YardSale.id.asc())
+
+    if after_start_date is not None and after_id is not None:
+        query = query.filter(tuple_(YardSale.start_date, YardSale.id) > (after_start_date, after_id))
+        yard_sales = query.limit(limit).all()
+    else:
+        yard_sales = query.offset(skip).limit(limit).all()
+    yard_sale_ids = [yard_sale.id for yard_sale in yard_sales]
+
+    # One grouped count instead of a COUNT(*) query per yard sale
+    comment_counts = {}
+    if yard_sale_ids:
+        comment_counts = dict(db.execute(
+            select(Comment.yard_sale_id, func.count(Comment.id))
+            .where(Comment.yard_sale_id.in_(yard_sale_ids))
+            .group_by(Comment.yard_sale_id)
+        ).all())
+
     result = []
     for yard_sale in yard_sales:
-        comment_count = db.query(Comment).filter(Comment.yard_sale_id == yard_sale.id).count()
         # Check if owner is admin
         owner_is_admin = yard_sale.owner.permissions == "admin" if yard_sale.owner else False
         result.append(YardSaleResponse(
-            **yard_sale.__dict__,
-            owner_username=yard_sale.owner.username if yard_sale.owner else "unknown",
+            **yard_sale_data(yard_sale),
             owner_is_admin=owner_is_admin,
             owner_profile_picture=yard_sale.owner.profile_picture if yard_sale.owner else None,
-            comment_count=comment_count
+            comment_count=comment_counts.get(yard_sale.id, 0)
         ))
-    
+
     return result
 
 # Comment Endpoints
 @app.post("/yard-sales/{yard_sale_id}/comments", response_model=CommentResponse, status_code=status.HTTP_201_CREATED)
-async def create_comment(
+def create_comment(
     yard_sale_id: str,
     comment: CommentCreate,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """Add a comment to a yard sale"""
-    # Check if yard sale exists
-    yard_sale = db.query(YardSale).filter(YardSale.id == yard_sale_id).first()
-    if not yard_sale:
+    # Existence check only — select the PK instead of hydrating the full row
+    if db.execute(select(YardSale.id).where(YardSale.id == yard_sale_id)).first() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Yard sale with id {yard_sale_id} not found"
@@ -4286,22 +4763,24 @@ async def create_comment(
     )
     
     db.add(db_comment)
-    db.commit()
-    db.refresh(db_comment)
-    
-    return CommentResponse(
-        **db_comment.__dict__,
+    # Flush assigns the client-side defaults; build the response before
+    # commit so no refresh SELECT is needed
+    db.flush()
+
+    response = CommentResponse(
+        **orm_to_dict(db_comment),
         username=current_user.username,
         user_is_admin=(current_user.permissions == "admin"),
         user_profile_picture=current_user.profile_picture
     )
+    db.commit()
+    return response
 
 @app.get("/yard-sales/{yard_sale_id}/comments", response_model=List[CommentResponse])
-async def get_comments(yard_sale_id: str, db: Session = Depends(get_db)):
+def get_comments(yard_sale_id: str, db: Session = Depends(get_db)):
     """Get all comments for a yard sale"""
-    # Check if yard sale exists
-    yard_sale = db.query(YardSale).filter(YardSale.id == yard_sale_id).first()
-    if not yard_sale:
+    # Existence check only — select the PK instead of hydrating the full row
+    if db.execute(select(YardSale.id).where(YardSale.id == yard_sale_id)).first() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Yard sale with id {yard_sale_id} not found"
@@ -4312,15 +4791,16 @@ async def get_comments(yard_sale_id: str, db: Session = Depends(get_db)):
     ).order_by(Comment.created_at.asc()).all()
     
     return [CommentResponse(
-        **comment.__dict__, 
+        **orm_to_dict(comment), 
         username=comment.user.username,
         user_is_admin=(comment.user.permissions == "admin"),
         user_profile_picture=comment.user.profile_picture
     ) for comment in comments]
 
 @app.delete("/comments/{comment_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_comment(
+def delete_comment(
     comment_id: str,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
@@ -4329,17 +4809,18 @@ async def delete_comment(
         Comment.id == comment_id,
         Comment.user_id == current_user.id
     ).first()
-    
+
     if not comment:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Comment with id {comment_id} not found"
         )
-    
-    db.delete(comment)
-    db.commit()
-    
-    return JSONResponse(status_code=status.HTTP_204_NO_CONTENT, content=None)
+
+    # Perform the delete after the response is sent so the client doesn't
+    # wait on the commit
+    background_tasks.add_task(delete_row_in_background, Comment, comment_id)
+
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 # ============================================================================
 # MESSAGE ENDPOINTS
@@ -4347,38 +4828,35 @@ async def delete_comment(
 
 # Get all conversations for current user
 @app.get("/conversations", response_model=List[ConversationResponse])
-async def get_user_conversations(
+def get_user_conversations(
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """Get all conversations for the current user"""
-    # Get conversations where user is either participant1 or participant2
+    # Get conversations where user is either participant1 or participant2,
+    # eager-loading the yard sale and both participants with IN queries
+    # instead of three lazy SELECTs per conversation
     conversations = db.query(Conversation).filter(
-        (Conversation.participant1_id == current_user.id) | 
+        (Conversation.participant1_id == current_user.id) |
         (Conversation.participant2_id == current_user.id)
+    ).options(
+        selectinload(Conversation.yard_sale),
+        selectinload(Conversation.participant1),
+        selectinload(Conversation.participant2)
     ).order_by(Conversation.updated_at.desc()).all()
-    
+
+    conversation_ids = [conv.id for conv in conversations]
+    last_messages = get_last_messages_map(db, conversation_ids)
+    unread_counts = get_unread_counts_map(db, conversation_ids, current_user.id)
+
     result = []
     for conv in conversations:
-        # Get yard sale info
-        yard_sale = db.query(YardSale).filter(YardSale.id == conv.yard_sale_id).first()
-        
-        # Get participant info
-        participant1 = db.query(User).filter(User.id == conv.participant1_id).first()
-        participant2 = db.query(User).filter(User.id == conv.participant2_id).first()
-        
-        # Get last message
-        last_message = db.query(Message).filter(
-            Message.conversation_id == conv.id
-        ).order_by(Message.created_at.desc()).first()
-        
-        # Count unread messages for current user
-        unread_count = db.query(Message).filter(
-            Message.conversation_id == conv.id,
-            Message.recipient_id == current_user.id,
-            Message.is_read == False
-        ).count()
-        
+        yard_sale = conv.yard_sale
+        participant1 = conv.participant1
+        participant2 = conv.participant2
+        last_message = last_messages.get(conv.id)
+        unread_count = unread_counts.get(conv.id, 0)
+
         result.append(ConversationResponse(
             id=conv.id,
             yard_sale_id=conv.yard_sale_id,
@@ -4398,7 +4876,7 @@ async def get_user_conversations(
 
 # Get conversation summaries with unread counts
 @app.get("/conversations/summaries", response_model=ConversationSummariesResponse)
-async def get_conversation_summaries(
+def get_conversation_summaries(
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
@@ -4409,36 +4887,39 @@ async def get_conversation_summaries(
         (Conversation.participant2_id == current_user.id)
     ).order_by(Conversation.updated_at.desc()).all()
     
+    conversation_ids = [conv.id for conv in conversations]
+    last_messages = get_last_messages_map(db, conversation_ids)
+    unread_counts = get_unread_counts_map(db, conversation_ids, current_user.id)
+
+    # Total message counts per conversation in one grouped query
+    total_counts = {}
+    if conversation_ids:
+        total_counts = dict(db.execute(
+            select(Message.conversation_id, func.count(Message.id))
+            .where(Message.conversation_id.in_(conversation_ids))
+            .group_by(Message.conversation_id)
+        ).all())
+
+    other_users = get_users_map(db, [
+        conv.participant2_id if conv.participant1_id == current_user.id else conv.participant1_id
+        for conv in conversations
+    ])
+
     result = []
     total_unread = 0
-    
+
     for conv in conversations:
         # Determine the other user
         if conv.participant1_id == current_user.id:
             other_user_id = conv.participant2_id
         else:
             other_user_id = conv.participant1_id
-        
-        # Get other user info
-        other_user = db.query(User).filter(User.id == other_user_id).first()
-        
-        # Get last message
-        last_message = db.query(Message).filter(
-            Message.conversation_id == conv.id
-        ).order_by(Message.created_at.desc()).first()
-        
-        # Count unread messages for current user
-        unread_count = db.query(Message).filter(
-            Message.conversation_id == conv.id,
-            Message.recipient_id == current_user.id,
-            Message.is_read == False
-        ).count()
-        
-        # Count total messages in conversation
-        total_messages = db.query(Message).filter(
-            Message.conversation_id == conv.id
-        ).count()
-        
+
+        other_user = other_users.get(other_user_id)
+        last_message = last_messages.get(conv.id)
+        unread_count = unread_counts.get(conv.id, 0)
+        total_messages = total_counts.get(conv.id, 0)
+
         total_unread += unread_count
         
         result.append(ConversationSummary(
@@ -4462,7 +4943,7 @@ async def websocket_endpoint(websocket: WebSocket, user_id: str):
     """WebSocket endpoint for real-time message notifications"""
     # Verify user exists
     db = next(get_db())
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if not user:
         await websocket.close(code=4004, reason="User not found")
         return
@@ -4479,7 +4960,7 @@ async def websocket_endpoint(websocket: WebSocket, user_id: str):
 
 # Get messages for a specific conversation
 @app.get("/conversations/{conversation_id}/messages", response_model=List[MessageResponse])
-async def get_conversation_messages(
+def get_conversation_messages(
     conversation_id: str,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
@@ -4500,10 +4981,11 @@ async def get_conversation_messages(
         Message.conversation_id == conversation_id
     ).order_by(Message.created_at.asc()).all()
     
+    users = get_users_map(db, [m.sender_id for m in messages] + [m.recipient_id for m in messages])
     result = []
     for message in messages:
-        sender = db.query(User).filter(User.id == message.sender_id).first()
-        recipient = db.query(User).filter(User.id == message.recipient_id).first()
+        sender = users.get(message.sender_id)
+        recipient = users.get(message.recipient_id)
         
         result.append(MessageResponse(
             id=message.id,
@@ -4523,7 +5005,7 @@ async def get_conversation_messages(
 
 # Send a message in a conversation
 @app.post("/conversations/{conversation_id}/messages", response_model=MessageResponse)
-async def send_conversation_message(
+def send_conversation_message(
     conversation_id: str,
     message_data: MessageCreate,
     current_user: User = Depends(get_current_active_user),
@@ -4531,7 +5013,7 @@ async def send_conversation_message(
 ):
     """Send a message in an existing conversation"""
     # Check if conversation exists and user is a participant
-    conversation = db.query(Conversation).filter(Conversation.id == conversation_id).first()
+    conversation = db.get(Conversation, conversation_id)
     if not conversation:
         raise HTTPException(status_code=404, detail="Conversation not found")
     
@@ -4556,26 +5038,14 @@ async def send_conversation_message(
     # Update conversation's updated_at timestamp
     conversation.updated_at = get_mountain_time()
     
-    db.commit()
-    db.refresh(message)
-    
+    # Flush assigns the client-side defaults (id, created_at, is_read); the
+    # response is built before commit so no readback SELECT is needed
+    db.flush()
+
     # Get recipient info for response
-    recipient = db.query(User).filter(User.id == recipient_id).first()
-    
-    # Create notification for the recipient (only if not sending to self)
-    if recipient_id != current_user.id:
-        create_notification(
-            db=db,
-            user_id=recipient_id,
-            notification_type="message",
-            title=f"New message from {current_user.username}",
-            message=f"You received a message: \"{message_data.content[:100]}{'...' if len(message_data.content) > 100 else ''}\"",
-            related_user_id=current_user.id,
-            related_yard_sale_id=conversation.yard_sale_id,
-            related_message_id=message.id
-        )
-    
-    return MessageResponse(
+    recipient = db.get(User, recipient_id)
+
+    response = MessageResponse(
         id=message.id,
         content=message.content,
         is_read=message.is_read,
@@ -4589,127 +5059,170 @@ async def send_conversation_message(
         recipient_username=recipient.username
     )
 
+    # conversation.yard_sale_id is read before commit expires the instance
+    related_yard_sale_id = conversation.yard_sale_id
+
+    db.commit()
+
+    # Create notification for the recipient (only if not sending to self)
+    if recipient_id != current_user.id:
+        create_notification(
+            db=db,
+            user_id=recipient_id,
+            notification_type="message",
+            title=f"New message from {current_user.username}",
+            message=f"You received a message: \"{message_data.content[:100]}{'...' if len(message_data.content) > 100 else ''}\"",
+            related_user_id=current_user.id,
+            related_yard_sale_id=related_yard_sale_id,
+            related_message_id=response.id
+        )
+
+    return response
+
 # Get all messages for current user (inbox)
 @app.get("/messages", response_model=MessagesWithNotificationStatus)
-async def get_user_messages(
+def get_user_messages(
     include_notification_status: bool = False,
+    before: Optional[datetime] = Query(None, description="Only return messages created before this timestamp (keyset pagination)"),
+    limit: int = Query(50, ge=1, le=200),
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
-    """Get all messages for the current user with optional notification status"""
-    messages = db.query(Message).filter(
+    """Get messages for the current user with optional notification status.
+
+    Uses keyset pagination on created_at: pass the returned next_cursor back
+    as ?before= to fetch the next page.
+    """
+    from sqlalchemy.orm import aliased
+
+    # Single projection query: the response only needs scalar columns, so join
+    # sender/recipient usernames in rather than hydrating Message + User objects
+    Sender = aliased(User)
+    Recipient = aliased(User)
+    stmt = (
+        select(
+            Message.id,
+            Message.content,
+            Message.is_read,
+            Message.created_at,
+            Message.conversation_id,
+            Message.sender_id,
+            Message.recipient_id,
+            Sender.username.label("sender_username"),
+            Sender.permissions.label("sender_permissions"),
+            Sender.profile_picture.label("sender_profile_picture"),
+            Recipient.username.label("recipient_username"),
+        )
+        .join(Sender, Sender.id == Message.sender_id)
+        .join(Recipient, Recipient.id == Message.recipient_id)
+        .where((Message.sender_id == current_user.id) | (Message.recipient_id == current_user.id))
+    )
+    if before:
+        stmt = stmt.where(Message.created_at < before)
+    stmt = stmt.order_by(Message.created_at.desc(), Message.id.desc()).limit(limit)
+    rows = db.execute(stmt).all()
+
+    # Totals are computed in the database so they stay correct across pages
+    unread_count = db.query(func.count(Message.id)).filter(
+        Message.recipient_id == current_user.id,
+        Message.is_read == False
+    ).scalar() or 0
+    total_messages = db.query(func.count(Message.id)).filter(
         (Message.sender_id == current_user.id) | (Message.recipient_id == current_user.id)
-    ).order_by(Message.created_at.desc()).all()
-    
-    result = []
-    unread_count = 0
-    
-    for message in messages:
-        sender = db.query(User).filter(User.id == message.sender_id).first()
-        recipient = db.query(User).filter(User.id == message.recipient_id).first()
-        
-        # Get notification info if requested
-        notification_id = None
-        has_unread_notification = False
-        
-        if include_notification_status:
-            notification = db.query(Notification).filter(
-                Notification.related_message_id == message.id,
+    ).scalar() or 0
+
+    # Batch the notification lookup for the whole page instead of per message
+    notifications_by_message = {}
+    if include_notification_status and rows:
+        notification_rows = db.execute(
+            select(Notification.related_message_id, Notification.id, Notification.is_read)
+            .where(
+                Notification.related_message_id.in_([row.id for row in rows]),
                 Notification.user_id == current_user.id
-            ).first()
-            
-            if notification:
-                notification_id = notification.id
-                has_unread_notification = not notification.is_read
-        
-        # Count unread messages (received but not read)
-        if message.recipient_id == current_user.id and not message.is_read:
-            unread_count += 1
-        
+            )
+        ).all()
+        notifications_by_message = {n.related_message_id: n for n in notification_rows}
+
+    result = []
+    for row in rows:
+        notification = notifications_by_message.get(row.id)
         result.append(MessageResponse(
-            id=message.id,
-            content=message.content,
-            is_read=message.is_read,
-            created_at=message.created_at,
-            conversation_id=message.conversation_id,
-            sender_id=message.sender_id,
-            sender_username=sender.username,
-            sender_is_admin=(sender.permissions == "admin"),
-            sender_profile_picture=sender.profile_picture if sender else None,
-            recipient_id=message.recipient_id,
-            recipient_username=recipient.username,
-            notification_id=notification_id,
-            has_unread_notification=has_unread_notification
+            id=row.id,
+            content=row.content,
+            is_read=row.is_read,
+            created_at=row.created_at,
+            conversation_id=row.conversation_id,
+            sender_id=row.sender_id,
+            sender_username=row.sender_username,
+            sender_is_admin=(row.sender_permissions == "admin"),
+            sender_profile_picture=row.sender_profile_picture,
+            recipient_id=row.recipient_id,
+            recipient_username=row.recipient_username,
+            notification_id=notification.id if notification else None,
+            has_unread_notification=(not notification.is_read) if notification else False
         ))
-    
+
     return MessagesWithNotificationStatus(
         messages=result,
         unread_message_count=unread_count,
-        total_messages=len(result)
+        total_messages=total_messages,
+        next_cursor=rows[-1].created_at if len(rows) == limit else None
     )
 
 # Bulk mark messages as read
 @app.post("/messages/mark-read", response_model=BulkMarkReadResponse)
-async def bulk_mark_messages_read(
+def bulk_mark_messages_read(
     request: BulkMarkReadRequest,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """Mark multiple messages as read in one call"""
+    # Resolve the affected message ids (recipient filter doubles as the
+    # ownership check), then flip messages and their notifications with one
+    # set-based UPDATE each instead of a SELECT + UPDATE per message
+    if request.conversation_id:
+        message_ids = db.execute(
+            select(Message.id).where(
+                Message.conversation_id == request.conversation_id,
+                Message.recipient_id == current_user.id,
+                Message.is_read == False
+            )
+        ).scalars().all()
+    elif request.message_ids:
+        message_ids = db.execute(
+            select(Message.id).where(
+                Message.id.in_(request.message_ids),
+                Message.recipient_id == current_user.id,
+                Message.is_read == False
+            )
+        ).scalars().all()
+    else:
+        message_ids = []
+
     marked_count = 0
     updated_notifications = []
-    
-    if request.conversation_id:
-        # Mark all messages in conversation as read
-        messages = db.query(Message).filter(
-            Message.conversation_id == request.conversation_id,
-            Message.recipient_id == current_user.id,
-            Message.is_read == False
-        ).all()
-        
-        for message in messages:
-            message.is_read = True
-            marked_count += 1
-            
-            # Mark related notification as read
-            notification = db.query(Notification).filter(
-                Notification.related_message_id == message.id,
+
+    if message_ids:
+        marked_count = db.execute(
+            update(Message).where(Message.id.in_(message_ids)).values(is_read=True)
+        ).rowcount
+
+        updated_notifications = db.execute(
+            select(Notification.id).where(
+                Notification.related_message_id.in_(message_ids),
                 Notification.user_id == current_user.id,
                 Notification.is_read == False
-            ).first()
-            
-            if notification:
-                notification.is_read = True
-                notification.read_at = get_mountain_time()
-                updated_notifications.append(notification.id)
-    
-    else:
-        # Mark specific messages as read
-        for message_id in request.message_ids:
-            message = db.query(Message).filter(
-                Message.id == message_id,
-                Message.recipient_id == current_user.id,
-                Message.is_read == False
-            ).first()
-            
-            if message:
-                message.is_read = True
-                marked_count += 1
-                
-                # Mark related notification as read
-                notification = db.query(Notification).filter(
-                    Notification.related_message_id == message.id,
-                    Notification.user_id == current_user.id,
-                    Notification.is_read == False
-                ).first()
-                
-                if notification:
-                    notification.is_read = True
-                    notification.read_at = get_mountain_time()
-                    updated_notifications.append(notification.id)
-    
+            )
+        ).scalars().all()
+        if updated_notifications:
+            db.execute(
+                update(Notification)
+                .where(Notification.id.in_(updated_notifications))
+                .values(is_read=True, read_at=get_mountain_time())
+            )
+
     db.commit()
-    
+
     return BulkMarkReadResponse(
         marked_count=marked_count,
         updated_notifications=updated_notifications
@@ -4717,63 +5230,73 @@ async def bulk_mark_messages_read(
 
 # Get unread messages count
 @app.get("/messages/unread-count")
-async def get_unread_messages_count(
+def get_unread_messages_count(
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """Get count of unread messages for current user"""
-    unread_count = db.query(Message).filter(
-        Message.recipient_id == current_user.id,
+    # lambda_stmt caches the constructed statement for this badge-poll hot
+    # path; only the bound user id changes between calls
+    user_id = current_user.id
+    stmt = lambda_stmt(lambda: select(func.count()).select_from(Message).where(
+        Message.recipient_id == user_id,
         Message.is_read == False
-    ).count()
-    
+    ))
+    unread_count = db.execute(stmt).scalar()
+
     return {"unread_count": unread_count}
 
 # Mark message as read
 @app.put("/messages/{message_id}/read")
-async def mark_message_as_read(
+def mark_message_as_read(
     message_id: str,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """Mark a message as read (only recipient can mark as read)"""
-    message = db.query(Message).filter(Message.id == message_id).first()
-    
-    if not message:
-        raise HTTPException(status_code=404, detail="Message not found")
-    
-    if message.recipient_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Not authorized to mark this message as read")
-    
-    message.is_read = True
+    updated = db.execute(
+        update(Message)
+        .where(Message.id == message_id, Message.recipient_id == current_user.id)
+        .values(is_read=True)
+    ).rowcount
     db.commit()
-    
+
+    if not updated:
+        recipient_id = db.execute(
+            select(Message.recipient_id).where(Message.id == message_id)
+        ).scalar()
+        if recipient_id is None:
+            raise HTTPException(status_code=404, detail="Message not found")
+        raise HTTPException(status_code=403, detail="Not authorized to mark this message as read")
+
     return {"message": "Message marked as read"}
 
 # Delete message (sender or recipient can delete)
 @app.delete("/messages/{message_id}")
-async def delete_message(
+def delete_message(
     message_id: str,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """Delete a message (sender or recipient can delete)"""
-    message = db.query(Message).filter(Message.id == message_id).first()
-    
+    message = db.get(Message, message_id)
+
     if not message:
         raise HTTPException(status_code=404, detail="Message not found")
-    
+
     if message.sender_id != current_user.id and message.recipient_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized to delete this message")
-    
-    db.delete(message)
-    db.commit()
-    
+
+    # Perform the delete after the response is sent so the client doesn't
+    # wait on the commit
+    background_tasks.add_task(delete_row_in_background, Message, message_id)
+
     return {"message": "Message deleted successfully"}
 
 # General message sending endpoint (alternative to yard-sale specific)
 @app.post("/messages", response_model=MessageResponse)
-async def send_message_general(
+def send_message_general(
     message_data: MessageCreate,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
@@ -4793,7 +5316,7 @@ async def send_message_general(
     
     if message_data.yard_sale_id:
         # Use the existing yard sale messaging logic
-        yard_sale = db.query(YardSale).filter(YardSale.id == message_data.yard_sale_id).first()
+        yard_sale = db.get(YardSale, message_data.yard_sale_id)
         if not yard_sale:
             raise HTTPException(status_code=404, detail="Yard sale not found")
         
@@ -4814,26 +5337,15 @@ async def send_message_general(
         
         db.add(message)
         conversation.updated_at = get_mountain_time()
-        db.commit()
-        db.refresh(message)
-        
+
+        # Flush assigns the client-side defaults (id, created_at, is_read); the
+        # response is built before commit so no readback SELECT is needed
+        db.flush()
+
         # Get recipient info
-        recipient = db.query(User).filter(User.id == recipient_id).first()
-        
-        # Create notification for the recipient (only if not sending to self)
-        if recipient_id != current_user.id:
-            create_notification(
-                db=db,
-                user_id=recipient_id,
-                notification_type="message",
-                title=f"New message from {current_user.username}",
-                message=f"You received a message: \"{message_data.content[:100]}{'...' if len(message_data.content) > 100 else ''}\"",
-                related_user_id=current_user.id,
-                related_yard_sale_id=message_data.yard_sale_id,
-                related_message_id=message.id
-            )
-        
-        return MessageResponse(
+        recipient = db.get(User, recipient_id)
+
+        response = MessageResponse(
             id=message.id,
             content=message.content,
             is_read=message.is_read,
@@ -4845,10 +5357,27 @@ async def send_message_general(
             recipient_id=message.recipient_id,
             recipient_username=recipient.username
         )
+
+        db.commit()
+
+        # Create notification for the recipient (only if not sending to self)
+        if recipient_id != current_user.id:
+            create_notification(
+                db=db,
+                user_id=recipient_id,
+                notification_type="message",
+                title=f"New message from {current_user.username}",
+                message=f"You received a message: \"{message_data.content[:100]}{'...' if len(message_data.content) > 100 else ''}\"",
+                related_user_id=current_user.id,
+                related_yard_sale_id=message_data.yard_sale_id,
+                related_message_id=response.id
+            )
+
+        return response
     
     else:  # conversation_id provided
         # Use the conversation messaging logic
-        conversation = db.query(Conversation).filter(Conversation.id == message_data.conversation_id).first()
+        conversation = db.get(Conversation, message_data.conversation_id)
         if not conversation:
             raise HTTPException(status_code=404, detail="Conversation not found")
         
@@ -4870,26 +5399,15 @@ async def send_message_general(
         
         db.add(message)
         conversation.updated_at = get_mountain_time()
-        db.commit()
-        db.refresh(message)
-        
+
+        # Flush assigns the client-side defaults (id, created_at, is_read); the
+        # response is built before commit so no readback SELECT is needed
+        db.flush()
+
         # Get recipient info
-        recipient = db.query(User).filter(User.id == recipient_id).first()
-        
-        # Create notification for the recipient (only if not sending to self)
-        if recipient_id != current_user.id:
-            create_notification(
-                db=db,
-                user_id=recipient_id,
-                notification_type="message",
-                title=f"New message from {current_user.username}",
-                message=f"You received a message: \"{message_data.content[:100]}{'...' if len(message_data.content) > 100 else ''}\"",
-                related_user_id=current_user.id,
-                related_yard_sale_id=conversation.yard_sale_id,
-                related_message_id=message.id
-            )
-        
-        return MessageResponse(
+        recipient = db.get(User, recipient_id)
+
+        response = MessageResponse(
             id=message.id,
             content=message.content,
             is_read=message.is_read,
@@ -4902,13 +5420,118 @@ async def send_message_general(
             recipient_username=recipient.username
         )
 
+        # conversation.yard_sale_id is read before commit expires the instance
+        related_yard_sale_id = conversation.yard_sale_id
+
+        db.commit()
+
+        # Create notification for the recipient (only if not sending to self)
+        if recipient_id != current_user.id:
+            create_notification(
+                db=db,
+                user_id=recipient_id,
+                notification_type="message",
+                title=f"New message from {current_user.username}",
+                message=f"You received a message: \"{message_data.content[:100]}{'...' if len(message_data.content) > 100 else ''}\"",
+                related_user_id=current_user.id,
+                related_yard_sale_id=related_yard_sale_id,
+                related_message_id=response.id
+            )
+
+        return response
+
 # ============================================================================
 # TRUST SYSTEM ENDPOINTS
 # ============================================================================
 
 # User Rating and Review Endpoints
+# Verification badges rarely change (status is flipped by an admin, out of
+# band), so profile views read them through a short-TTL in-process cache
+# instead of querying per request. Cleared wholesale if it fills up, and
+# invalidated for a user when they file a new verification request.
+VERIFICATION_BADGE_CACHE_TTL = int(os.getenv("VERIFICATION_BADGE_CACHE_TTL", "60"))
+VERIFICATION_BADGE_CACHE_MAX = 10000
+_verification_badge_cache: Dict[str, tuple] = {}
+
+
+def get_verification_badges(db: Session, user_id: str) -> list:
+    """Verified badge types for a user, cached for a short TTL"""
+    cached = _verification_badge_cache.get(user_id)
+    if cached and cached[0] > datetime.now().timestamp():
+        return cached[1]
+    # GROUP_CONCAT aggregates in the database, so the miss path gets one
+    # scalar back instead of one row per badge (MySQL's stand-in for
+    # array_agg)
+    concatenated = db.execute(
+        select(func.group_concat(Verification.verification_type)).where(
+            Verification.user_id == user_id,
+            Verification.status == "verified"
+        )
+    ).scalar()
+    badges = concatenated.split(",") if concatenated else []
+    if len(_verification_badge_cache) >= VERIFICATION_BADGE_CACHE_MAX:
+        _verification_badge_cache.clear()
+    _verification_badge_cache[user_id] = (
+        datetime.now().timestamp() + VERIFICATION_BADGE_CACHE_TTL, badges
+    )
+    return badges
+
+
+def bulk_create_ratings(db: Session, rows: List[dict]) -> int:
+    """Insert many ratings with one ORM-bypass statement.
+
+    bulk_insert_mappings skips the per-instance unit of work (no events,
+    relationships or identity-map entries), which is 10-50x faster than
+    per-row adds for large imports. Ids and timestamps are filled in here
+    because client-side column defaults don't run on the bulk path, and the
+    cached rating aggregates are recomputed from scratch for every affected
+    user so the import can't leave them stale.
+    """
+    now = get_mountain_time()
+    for row in rows:
+        row.setdefault("id", str(uuid.uuid4()))
+        row.setdefault("created_at", now)
+        row.setdefault("updated_at", now)
+    db.bulk_insert_mappings(UserRating, rows)
+
+    affected_user_ids = {row["rated_user_id"] for row in rows}
+    aggregates = db.execute(
+        select(UserRating.rated_user_id, func.avg(UserRating.rating), func.count(UserRating.id))
+        .where(UserRating.rated_user_id.in_(affected_user_ids))
+        .group_by(UserRating.rated_user_id)
+    ).all()
+    for rated_user_id, avg_rating, total in aggregates:
+        db.execute(
+            update(User)
+            .where(User.id == rated_user_id)
+            .values(average_rating=float(avg_rating), total_ratings=total)
+        )
+    db.commit()
+    return len(rows)
+
+
+@app.post("/admin/ratings/bulk", status_code=status.HTTP_201_CREATED)
+def import_ratings_bulk(
+    ratings: List[AdminRatingImport],
+    current_user: User = Depends(get_current_admin_user),
+    db: Session = Depends(get_db)
+):
+    """Bulk-import ratings (admin only, for migrations and imports)"""
+    if not ratings:
+        return {"inserted": 0}
+    try:
+        inserted = bulk_create_ratings(db, [rating.model_dump() for rating in ratings])
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Import contains a duplicate reviewer/rated-user pair or an unknown user id"
+        )
+    return {"inserted": inserted}
+
+
 @app.post("/users/{user_id}/ratings", response_model=UserRatingResponse)
-async def create_user_rating(
+def create_user_rating(
     user_id: str,
     rating_data: UserRatingCreate,
     current_user: User = Depends(get_current_active_user),
@@ -4916,7 +5539,7 @@ async def create_user_rating(
 ):
     """Rate and review a user"""
     # Check if user exists
-    rated_user = db.query(User).filter(User.id == user_id).first()
+    rated_user = db.get(User, user_id)
     if not rated_user:
         raise HTTPException(status_code=404, detail="User not found")
     
@@ -4924,34 +5547,43 @@ async def create_user_rating(
     if user_id == current_user.id:
         raise HTTPException(status_code=400, detail="Cannot rate yourself")
     
-    # Check if user already rated this person
-    existing_rating = db.query(UserRating).filter(
-        UserRating.reviewer_id == current_user.id,
-        UserRating.rated_user_id == user_id
-    ).first()
-    
-    if existing_rating:
-        raise HTTPException(status_code=400, detail="You have already rated this user")
-    
-    # Validate yard sale if provided
-    yard_sale = None
+    # Validate yard sale if provided; only the title is needed for the
+    # response, so select that instead of hydrating the full row
+    yard_sale_title = None
     if rating_data.yard_sale_id:
-        yard_sale = db.query(YardSale).filter(YardSale.id == rating_data.yard_sale_id).first()
-        if not yard_sale:
+        yard_sale_title = db.execute(
+            select(YardSale.title).where(YardSale.id == rating_data.yard_sale_id)
+        ).scalar()
+        if yard_sale_title is None:
             raise HTTPException(status_code=404, detail="Yard sale not found")
     
-    # Create rating
+    # Create rating, capturing the response strings on the row so list
+    # endpoints don't need to join users/yard_sales later
     rating = UserRating(
         rating=rating_data.rating,
         review_text=rating_data.review_text,
         reviewer_id=current_user.id,
         rated_user_id=user_id,
-        yard_sale_id=rating_data.yard_sale_id
+        yard_sale_id=rating_data.yard_sale_id,
+        reviewer_username=current_user.username,
+        rated_user_username=rated_user.username,
+        yard_sale_title=yard_sale_title
     )
     
     db.add(rating)
-    db.commit()
-    db.refresh(rating)
+    # Maintain the cached aggregates on the user row in the same transaction
+    new_total = (rated_user.total_ratings or 0) + 1
+    rated_user.average_rating = (
+        (rated_user.average_rating or 0.0) * (new_total - 1) + rating_data.rating
+    ) / new_total
+    rated_user.total_ratings = new_total
+    try:
+        # The unique (reviewer_id, rated_user_id) constraint replaces the
+        # pre-flight duplicate SELECT — one round-trip instead of two
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=400, detail="You have already rated this user")
     
     # Create notification for the rated user
     create_notification(
@@ -4976,133 +5608,103 @@ async def create_user_rating(
         rated_user_username=rated_user.username,
         rated_user_profile_picture=rated_user.profile_picture,
         yard_sale_id=rating.yard_sale_id,
-        yard_sale_title=yard_sale.title if yard_sale else None
+        yard_sale_title=yard_sale_title
     )
 
-@app.get("/users/{user_id}/ratings", response_model=List[UserRatingResponse])
-async def get_user_ratings(
-    user_id: str,
-    db: Session = Depends(get_db)
-):
-    """Get all ratings for a user"""
-    # Check if user exists
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
+def _load_user_ratings(db: Session, user_id: str):
+    """Shared loader for the ratings listing.
+
+    Usernames and yard sale titles are denormalized onto the rating rows at
+    insert time, so the page needs only one narrow user query for profile
+    pictures; rows that predate the denormalized columns fall back to
+    batched lookups.
+    """
+    if db.execute(select(User.id).where(User.id == user_id)).first() is None:
         raise HTTPException(status_code=404, detail="User not found")
-    
+
     ratings = db.query(UserRating).filter(UserRating.rated_user_id == user_id).all()
-    
-    result = []
+
+    # Profile pictures are mutable, so they always come from users — but as
+    # narrow (id, username, profile_picture) rows, not hydrated objects.
+    # The username rides along as the fallback for pre-migration ratings.
+    lookup_user_ids = {user_id}
+    lookup_user_ids.update(rating.reviewer_id for rating in ratings)
+    user_rows = {row.id: row for row in db.execute(
+        select(User.id, User.username, User.profile_picture)
+        .where(User.id.in_(lookup_user_ids))
+    )}
+
+    # Titles only need a query for legacy rows missing the captured title
+    missing_title_ids = {
+        rating.yard_sale_id for rating in ratings
+        if rating.yard_sale_id and not rating.yard_sale_title
+    }
+    fallback_titles = dict(db.execute(
+        select(YardSale.id, YardSale.title).where(YardSale.id.in_(missing_title_ids))
+    ).all()) if missing_title_ids else {}
+
+    rated_row = user_rows.get(user_id)
+
+    rows = []
     for rating in ratings:
-        yard_sale = None
-        if rating.yard_sale_id:
-            yard_sale = db.query(YardSale).filter(YardSale.id == rating.yard_sale_id).first()
-        
-        result.append(UserRatingResponse(
+        reviewer_row = user_rows.get(rating.reviewer_id)
+        rows.append(dict(
             id=rating.id,
             rating=rating.rating,
             review_text=rating.review_text,
             created_at=rating.created_at,
             reviewer_id=rating.reviewer_id,
-            reviewer_username=rating.reviewer.username,
-            reviewer_profile_picture=rating.reviewer.profile_picture if rating.reviewer else None,
+            reviewer_username=rating.reviewer_username or (reviewer_row.username if reviewer_row else "unknown"),
+            reviewer_profile_picture=reviewer_row.profile_picture if reviewer_row else None,
             rated_user_id=rating.rated_user_id,
-            rated_user_username=rating.rated_user.username,
-            rated_user_profile_picture=rating.rated_user.profile_picture if rating.rated_user else None,
+            rated_user_username=rating.rated_user_username or (rated_row.username if rated_row else "unknown"),
+            rated_user_profile_picture=rated_row.profile_picture if rated_row else None,
             yard_sale_id=rating.yard_sale_id,
-            yard_sale_title=yard_sale.title if yard_sale else None
+            yard_sale_title=rating.yard_sale_title or fallback_titles.get(rating.yard_sale_id)
         ))
-    
-    return result
+
+    return UserRatingListAdapter.validate_python(rows)
+
 
 @app.get("/users/{user_id}/ratings", response_model=List[UserRatingResponse])
-async def get_user_ratings_by_id(
+def get_user_ratings(
     user_id: str,
-    current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
-    """Get all ratings for a user by ID (authenticated endpoint)"""
-    # Check if user exists
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    
-    ratings = db.query(UserRating).filter(UserRating.rated_user_id == user_id).all()
-    
-    result = []
-    for rating in ratings:
-        yard_sale = None
-        if rating.yard_sale_id:
-            yard_sale = db.query(YardSale).filter(YardSale.id == rating.yard_sale_id).first()
-        
-        result.append(UserRatingResponse(
-            id=rating.id,
-            rating=rating.rating,
-            review_text=rating.review_text,
-            created_at=rating.created_at,
-            reviewer_id=rating.reviewer_id,
-            reviewer_username=rating.reviewer.username,
-            reviewer_profile_picture=rating.reviewer.profile_picture if rating.reviewer else None,
-            rated_user_id=rating.rated_user_id,
-            rated_user_username=rating.rated_user.username,
-            rated_user_profile_picture=rating.rated_user.profile_picture if rating.rated_user else None,
-            yard_sale_id=rating.yard_sale_id,
-            yard_sale_title=yard_sale.title if yard_sale else None
-        ))
-    
-    return result
+    """Get all ratings for a user"""
+    return _load_user_ratings(db, user_id)
 
 @app.get("/users/{user_id}", response_model=UserResponse)
-async def get_user_by_id(
+def get_user_by_id(
     user_id: str,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """Get user by ID (basic user information)"""
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
-    return UserResponse(
-        id=user.id,
-        username=user.username,
-        email=user.email,
-        full_name=user.full_name,
-        phone_number=user.phone_number,
-        company=user.company,
-        city=user.city,
-        state=user.state,
-        zip_code=user.zip_code,
-        bio=user.bio,
-        profile_picture=user.profile_picture,
-        is_active=user.is_active,
-        permissions=UserPermission(user.permissions),
-        created_at=user.created_at,
-        updated_at=user.updated_at
-    )
+    return UserResponse.model_validate(user)
 
-@app.get("/users/{user_id}/profile", response_model=UserProfileResponse)
-async def get_user_profile(
-    user_id: str,
-    db: Session = Depends(get_db)
-):
-    """Get user profile with trust metrics"""
-    user = db.query(User).filter(User.id == user_id).first()
+def _load_user_profile(db: Session, user_id: str) -> UserProfileResponse:
+    """Shared loader for the profile-with-trust-metrics view.
+
+    Rating aggregates are cached on the user row and badges come from the
+    short-TTL badge cache, so a warm render is the user fetch plus nothing.
+    """
+    user = db.get(User, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
-    # Calculate average rating
-    ratings = db.query(UserRating).filter(UserRating.rated_user_id == user_id).all()
-    average_rating = None
-    if ratings:
-        average_rating = sum(r.rating for r in ratings) / len(ratings)
-    
-    # Get verification badges
-    verifications = db.query(Verification).filter(
-        Verification.user_id == user_id,
-        Verification.status == "verified"
-    ).all()
-    verification_badges = [v.verification_type for v in verifications]
+    # Read the aggregates cached on the user row at rating time — zero
+    # aggregation work here; add_user_rating_aggregates.py backfills rows
+    # that predate the cached columns
+    average_rating = user.average_rating
+    total_ratings = user.total_ratings or 0
+    
+    # Get verification badges (short-TTL cached; one narrow query on miss)
+    verification_badges = get_verification_badges(db, user_id)
     
     return UserProfileResponse(
         id=user.id,
@@ -5120,14 +5722,23 @@ async def get_user_profile(
         created_at=user.created_at,
         updated_at=user.updated_at,
         average_rating=average_rating,
-        total_ratings=len(ratings),
+        total_ratings=total_ratings,
         verification_badges=verification_badges,
         is_verified=len(verification_badges) > 0
     )
 
+
+@app.get("/users/{user_id}/profile", response_model=UserProfileResponse)
+def get_user_profile(
+    user_id: str,
+    db: Session = Depends(get_db)
+):
+    """Get user profile with trust metrics"""
+    return _load_user_profile(db, user_id)
+
 # Report Endpoints
 @app.post("/reports", response_model=ReportResponse)
-async def create_report(
+def create_report(
     report_data: ReportCreate,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
@@ -5136,14 +5747,14 @@ async def create_report(
     # Validate reported user if provided
     reported_user = None
     if report_data.reported_user_id:
-        reported_user = db.query(User).filter(User.id == report_data.reported_user_id).first()
+        reported_user = db.get(User, report_data.reported_user_id)
         if not reported_user:
             raise HTTPException(status_code=404, detail="Reported user not found")
     
     # Validate reported yard sale if provided
     reported_yard_sale = None
     if report_data.reported_yard_sale_id:
-        reported_yard_sale = db.query(YardSale).filter(YardSale.id == report_data.reported_yard_sale_id).first()
+        reported_yard_sale = db.get(YardSale, report_data.reported_yard_sale_id)
         if not reported_yard_sale:
             raise HTTPException(status_code=404, detail="Reported yard sale not found")
     
@@ -5157,8 +5768,8 @@ async def create_report(
     )
     
     db.add(report)
+    # No refresh needed — all defaults are assigned client-side at flush
     db.commit()
-    db.refresh(report)
     
     # Check if reported user has been reported 5 times by 5 different users
     # If so, automatically deactivate their account
@@ -5171,27 +5782,31 @@ async def create_report(
         if distinct_reporter_count >= 5:
             reported_user.is_active = False
             db.commit()
-            db.refresh(reported_user)
             
             # Notify admins about the auto-deactivation
             try:
-                admins = db.query(User).filter(User.permissions == "admin").all()
-                for admin in admins:
-                    create_notification(
-                        db=db,
-                        user_id=admin.id,
-                        notification_type="report",
-                        title="User Auto-Deactivated",
-                        message=f"User {reported_user.username} has been automatically deactivated after receiving 5 reports from 5 different users.",
-                        related_user_id=reported_user.id
-                    )
+                admin_ids = db.execute(
+                    select(User.id).where(User.permissions == "admin")
+                ).scalars().all()
+                create_notifications_bulk(db, [
+                    {
+                        "user_id": admin_id,
+                        "type": "report",
+                        "title": "User Auto-Deactivated",
+                        "message": f"User {reported_user.username} has been automatically deactivated after receiving 5 reports from 5 different users.",
+                        "related_user_id": reported_user.id
+                    }
+                    for admin_id in admin_ids
+                ])
             except Exception as e:
                 print(f"Error notifying admins about auto-deactivation: {e}")
     
     # Notify all admins about the new report
     try:
-        admins = db.query(User).filter(User.permissions == "admin").all()
-        
+        admin_ids = db.execute(
+            select(User.id).where(User.permissions == "admin")
+        ).scalars().all()
+
         # Build notification message with report details
         report_target = ""
         if reported_user:
@@ -5208,17 +5823,18 @@ async def create_report(
             f"Description: {report_data.description[:200]}{'...' if len(report_data.description) > 200 else ''}"
         )
         
-        # Create notification for each admin
-        for admin in admins:
-            create_notification(
-                db=db,
-                user_id=admin.id,
-                notification_type="report",
-                title=notification_title,
-                message=notification_message,
-                related_user_id=current_user.id,  # The reporter
-                related_yard_sale_id=report_data.reported_yard_sale_id
-            )
+        # One bulk insert for all admins instead of a commit per recipient
+        create_notifications_bulk(db, [
+            {
+                "user_id": admin_id,
+                "type": "report",
+                "title": notification_title,
+                "message": notification_message,
+                "related_user_id": current_user.id,  # The reporter
+                "related_yard_sale_id": report_data.reported_yard_sale_id
+            }
+            for admin_id in admin_ids
+        ])
     except Exception as e:
         # Don't fail report creation if notification fails
         print(f"Error notifying admins about report: {e}")
@@ -5240,54 +5856,53 @@ async def create_report(
     )
 
 @app.get("/reports", response_model=List[ReportResponse])
-async def get_reports(
+def get_reports(
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """Get all reports (admin only - for now, returns user's own reports)"""
-    reports = db.query(Report).filter(Report.reporter_id == current_user.id).all()
-    
-    result = []
-    for report in reports:
-        reported_user = None
-        if report.reported_user_id:
-            reported_user = db.query(User).filter(User.id == report.reported_user_id).first()
-        
-        reported_yard_sale = None
-        if report.reported_yard_sale_id:
-            reported_yard_sale = db.query(YardSale).filter(YardSale.id == report.reported_yard_sale_id).first()
-        
-        result.append(ReportResponse(
-            id=report.id,
-            report_type=report.report_type,
-            description=report.description,
-            status=report.status,
-            created_at=report.created_at,
-            reporter_id=report.reporter_id,
-            reporter_username=report.reporter.username,
-            reported_user_id=report.reported_user_id,
-            reported_user_username=reported_user.username if reported_user else None,
-            reported_yard_sale_id=report.reported_yard_sale_id,
-            reported_yard_sale_title=reported_yard_sale.title if reported_yard_sale else None
-        ))
+    # Same batching as the ratings listing: load the reporter, reported
+    # user and reported yard sale with the page instead of per report
+    reports = db.query(Report).options(
+        selectinload(Report.reporter),
+        selectinload(Report.reported_user),
+        selectinload(Report.reported_yard_sale)
+    ).filter(Report.reporter_id == current_user.id).yield_per(500)
+
+    rows = [dict(
+        id=report.id,
+        report_type=report.report_type,
+        description=report.description,
+        status=report.status,
+        created_at=report.created_at,
+        reporter_id=report.reporter_id,
+        reporter_username=report.reporter.username,
+        reported_user_id=report.reported_user_id,
+        reported_user_username=report.reported_user.username if report.reported_user else None,
+        reported_yard_sale_id=report.reported_yard_sale_id,
+        reported_yard_sale_title=report.reported_yard_sale.title if report.reported_yard_sale else None
+    ) for report in reports]
     
-    return result
+    return ReportListAdapter.validate_python(rows)
 
 # Verification Endpoints
 @app.post("/verifications", response_model=VerificationResponse)
-async def create_verification(
+def create_verification(
     verification_data: VerificationCreate,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """Request verification for a user"""
-    # Check if verification already exists
-    existing_verification = db.query(Verification).filter(
-        Verification.user_id == current_user.id,
-        Verification.verification_type == verification_data.verification_type
-    ).first()
-    
-    if existing_verification:
+    # Check if verification already exists — SELECT EXISTS short-circuits on
+    # the first matching row and transfers no columns
+    already_requested = db.query(
+        db.query(Verification).filter(
+            Verification.user_id == current_user.id,
+            Verification.verification_type == verification_data.verification_type
+        ).exists()
+    ).scalar()
+    
+    if already_requested:
         raise HTTPException(status_code=400, detail="Verification request already exists for this type")
     
     # Create verification request
@@ -5297,8 +5912,10 @@ async def create_verification(
     )
     
     db.add(verification)
+    # No refresh: id, status and created_at are client-side defaults
+    # assigned at flush, and the session keeps attributes live after commit
     db.commit()
-    db.refresh(verification)
+    _verification_badge_cache.pop(current_user.id, None)
     
     return VerificationResponse(
         id=verification.id,
@@ -5311,102 +5928,53 @@ async def create_verification(
     )
 
 @app.get("/verifications", response_model=List[VerificationResponse])
-async def get_user_verifications(
+def get_user_verifications(
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """Get all verifications for current user"""
-    verifications = db.query(Verification).filter(Verification.user_id == current_user.id).all()
-    
-    result = []
-    for verification in verifications:
-        result.append(VerificationResponse(
-            id=verification.id,
-            verification_type=verification.verification_type,
-            status=verification.status,
-            verified_at=verification.verified_at,
-            created_at=verification.created_at,
-            user_id=verification.user_id,
-            user_username=current_user.username
-        ))
-    
-    return result
-
-# Additional User Profile Endpoints
-@app.get("/users/{user_id}", response_model=UserProfileResponse)
-async def get_user_by_id(
-    user_id: str,
-    db: Session = Depends(get_db)
-):
-    """Get detailed user profile by ID with trust metrics"""
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
+    verifications = db.query(Verification).filter(Verification.user_id == current_user.id).yield_per(500)
     
-    # Calculate average rating
-    ratings = db.query(UserRating).filter(UserRating.rated_user_id == user_id).all()
-    average_rating = None
-    if ratings:
-        average_rating = sum(r.rating for r in ratings) / len(ratings)
-    
-    # Get verification badges
-    verifications = db.query(Verification).filter(
-        Verification.user_id == user_id,
-        Verification.status == "verified"
-    ).all()
-    verification_badges = [v.verification_type for v in verifications]
+    rows = [dict(
+        id=verification.id,
+        verification_type=verification.verification_type,
+        status=verification.status,
+        verified_at=verification.verified_at,
+        created_at=verification.created_at,
+        user_id=verification.user_id,
+        user_username=current_user.username
+    ) for verification in verifications]
     
-    return UserProfileResponse(
-        id=user.id,
-        username=user.username,
-        email=user.email,
-        full_name=user.full_name,
-        phone_number=user.phone_number,
-        company=user.company,
-        city=user.city,
-        state=user.state,
-        zip_code=user.zip_code,
-        bio=user.bio,
-        profile_picture=user.profile_picture,
-        is_active=user.is_active,
-        created_at=user.created_at,
-        updated_at=user.updated_at,
-        average_rating=average_rating,
-        total_ratings=len(ratings),
-        verification_badges=verification_badges,
-        is_verified=len(verification_badges) > 0
-    )
+    return VerificationListAdapter.validate_python(rows)
 
 @app.get("/users/{user_id}/verifications", response_model=List[VerificationResponse])
-async def get_user_verifications_by_id(
+def get_user_verifications_by_id(
     user_id: str,
     db: Session = Depends(get_db)
 ):
     """Get all verifications for a specific user"""
     # Check if user exists
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
-    verifications = db.query(Verification).filter(Verification.user_id == user_id).all()
+    verifications = db.query(Verification).filter(Verification.user_id == user_id).yield_per(500)
     
-    result = []
-    for verification in verifications:
-        result.append(VerificationResponse(
-            id=verification.id,
-            verification_type=verification.verification_type,
-            status=verification.status,
-            verified_at=verification.verified_at,
-            created_at=verification.created_at,
-            user_id=verification.user_id,
-            user_username=user.username
-        ))
+    rows = [dict(
+        id=verification.id,
+        verification_type=verification.verification_type,
+        status=verification.status,
+        verified_at=verification.verified_at,
+        created_at=verification.created_at,
+        user_id=verification.user_id,
+        user_username=user.username
+    ) for verification in verifications]
     
-    return result
+    return VerificationListAdapter.validate_python(rows)
 
 # Alternative Ratings Endpoint (as requested)
 @app.post("/ratings", response_model=UserRatingResponse)
-async def create_rating(
+def create_rating(
     rating_data: UserRatingCreate,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
@@ -5422,7 +5990,7 @@ async def create_rating(
     rated_user_id = rating_data.rated_user_id
     
     # Check if user exists
-    rated_user = db.query(User).filter(User.id == rated_user_id).first()
+    rated_user = db.get(User, rated_user_id)
     if not rated_user:
         raise HTTPException(status_code=404, detail="User not found")
     
@@ -5430,38 +5998,48 @@ async def create_rating(
     if rated_user_id == current_user.id:
         raise HTTPException(status_code=400, detail="Cannot rate yourself")
     
-    # Check if user already rated this person
-    existing_rating = db.query(UserRating).filter(
-        UserRating.reviewer_id == current_user.id,
-        UserRating.rated_user_id == rated_user_id
-    ).first()
-    
-    if existing_rating:
-        raise HTTPException(status_code=400, detail="You have already rated this user")
-    
-    # Validate yard sale if provided
-    yard_sale = None
+    # Validate yard sale if provided; the response only needs the title and
+    # the ownership check only needs owner_id, so select those two columns
+    yard_sale_title = None
     if rating_data.yard_sale_id:
-        yard_sale = db.query(YardSale).filter(YardSale.id == rating_data.yard_sale_id).first()
-        if not yard_sale:
+        yard_sale_row = db.execute(
+            select(YardSale.title, YardSale.owner_id).where(YardSale.id == rating_data.yard_sale_id)
+        ).first()
+        if yard_sale_row is None:
             raise HTTPException(status_code=404, detail="Yard sale not found")
+        yard_sale_title, yard_sale_owner_id = yard_sale_row
         
         # Verify yard sale is associated with the rated user
-        if yard_sale.owner_id != rated_user_id:
+        if yard_sale_owner_id != rated_user_id:
             raise HTTPException(status_code=400, detail="Yard sale is not associated with the rated user")
     
-    # Create rating
+    # Create rating, capturing the response strings on the row so list
+    # endpoints don't need to join users/yard_sales later
     rating = UserRating(
         rating=rating_data.rating,
         review_text=rating_data.review_text,
         reviewer_id=current_user.id,
         rated_user_id=rated_user_id,
-        yard_sale_id=rating_data.yard_sale_id
+        yard_sale_id=rating_data.yard_sale_id,
+        reviewer_username=current_user.username,
+        rated_user_username=rated_user.username,
+        yard_sale_title=yard_sale_title
     )
     
     db.add(rating)
-    db.commit()
-    db.refresh(rating)
+    # Maintain the cached aggregates on the user row in the same transaction
+    new_total = (rated_user.total_ratings or 0) + 1
+    rated_user.average_rating = (
+        (rated_user.average_rating or 0.0) * (new_total - 1) + rating_data.rating
+    ) / new_total
+    rated_user.total_ratings = new_total
+    try:
+        # The unique (reviewer_id, rated_user_id) constraint replaces the
+        # pre-flight duplicate SELECT — one round-trip instead of two
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=400, detail="You have already rated this user")
     
     return UserRatingResponse(
         id=rating.id,
@@ -5475,19 +6053,19 @@ async def create_rating(
         rated_user_username=rated_user.username,
         rated_user_profile_picture=rated_user.profile_picture,
         yard_sale_id=rating.yard_sale_id,
-        yard_sale_title=yard_sale.title if yard_sale else None
+        yard_sale_title=yard_sale_title
     )
 
 # Visit Tracking Endpoints
 @app.post("/yard-sales/{yard_sale_id}/visit", response_model=VisitedYardSaleResponse)
-async def mark_yard_sale_visited(
+def mark_yard_sale_visited(
     yard_sale_id: str,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """Mark a yard sale as visited by the current user"""
     # Check if yard sale exists
-    yard_sale = db.query(YardSale).filter(YardSale.id == yard_sale_id).first()
+    yard_sale = db.get(YardSale, yard_sale_id)
     if not yard_sale:
         raise HTTPException(status_code=404, detail="Yard sale not found")
     
@@ -5503,7 +6081,6 @@ async def mark_yard_sale_visited(
         existing_visit.last_visited = get_mountain_time()
         existing_visit.updated_at = get_mountain_time()
         db.commit()
-        db.refresh(existing_visit)
         
         return VisitedYardSaleResponse(
             id=existing_visit.id,
@@ -5525,8 +6102,9 @@ async def mark_yard_sale_visited(
         )
         
         db.add(visit)
+        # id and timestamps are client-side defaults assigned at flush — no
+        # readback needed
         db.commit()
-        db.refresh(visit)
         
         # Create notification for the yard sale owner (only for first visit, not repeat visits)
         if yard_sale.owner_id != current_user.id:
@@ -5556,15 +6134,14 @@ async def mark_yard_sale_visited(
         )
 
 @app.delete("/yard-sales/{yard_sale_id}/visit")
-async def mark_yard_sale_not_visited(
+def mark_yard_sale_not_visited(
     yard_sale_id: str,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """Mark a yard sale as not visited by the current user (remove visit record)"""
-    # Check if yard sale exists
-    yard_sale = db.query(YardSale).filter(YardSale.id == yard_sale_id).first()
-    if not yard_sale:
+    # Existence check only — no yard sale fields are needed on this path
+    if db.execute(select(YardSale.id).where(YardSale.id == yard_sale_id)).first() is None:
         raise HTTPException(status_code=404, detail="Yard sale not found")
     
     # Find and delete the visit record
@@ -5582,7 +6159,7 @@ async def mark_yard_sale_not_visited(
     return {"message": "Yard sale marked as not visited"}
 
 @app.get("/user/visited-yard-sales", response_model=List[VisitedYardSaleResponse])
-async def get_user_visited_yard_sales(
+def get_user_visited_yard_sales(
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
@@ -5591,14 +6168,21 @@ async def get_user_visited_yard_sales(
         VisitedYardSale.user_id == current_user.id
     ).order_by(VisitedYardSale.last_visited.desc()).all()
     
+    # One narrow (id, title) query for the page instead of a full yard sale
+    # load per visit
+    yard_sale_ids = [visit.yard_sale_id for visit in visits]
+    yard_sale_titles = dict(db.execute(
+        select(YardSale.id, YardSale.title).where(YardSale.id.in_(yard_sale_ids))
+    ).all()) if yard_sale_ids else {}
+
     result = []
     for visit in visits:
-        yard_sale = db.query(YardSale).filter(YardSale.id == visit.yard_sale_id).first()
-        if yard_sale:  # Only include visits for yard sales that still exist
+        title = yard_sale_titles.get(visit.yard_sale_id)
+        if title is not None:  # Only include visits for yard sales that still exist
             result.append(VisitedYardSaleResponse(
                 id=visit.id,
                 yard_sale_id=visit.yard_sale_id,
-                yard_sale_title=yard_sale.title,
+                yard_sale_title=title,
                 visited_at=visit.visited_at,
                 visit_count=visit.visit_count,
                 last_visited=visit.last_visited,
@@ -5608,13 +6192,13 @@ async def get_user_visited_yard_sales(
     return result
 
 @app.get("/yard-sales/{yard_sale_id}/visit-stats", response_model=VisitStatsResponse)
-async def get_yard_sale_visit_stats(
+def get_yard_sale_visit_stats(
     yard_sale_id: str,
     db: Session = Depends(get_db)
 ):
     """Get visit statistics for a specific yard sale"""
     # Check if yard sale exists
-    yard_sale = db.query(YardSale).filter(YardSale.id == yard_sale_id).first()
+    yard_sale = db.get(YardSale, yard_sale_id)
     if not yard_sale:
         raise HTTPException(status_code=404, detail="Yard sale not found")
     
@@ -5649,7 +6233,7 @@ async def get_yard_sale_visit_stats(
 
 # Notification Endpoints
 @app.get("/notifications", response_model=NotificationsWithCountsResponse)
-async def get_user_notifications(
+def get_user_notifications(
     skip: int = 0,
     limit: int = 50,
     unread_only: bool = False,
@@ -5672,14 +6256,14 @@ async def get_user_notifications(
             # Get related user info
             related_user_username = None
             if notification.related_user_id:
-                related_user = db.query(User).filter(User.id == notification.related_user_id).first()
+                related_user = db.get(User, notification.related_user_id)
                 if related_user:
                     related_user_username = related_user.username
             
             # Get related yard sale info
             related_yard_sale_title = None
             if notification.related_yard_sale_id:
-                related_yard_sale = db.query(YardSale).filter(YardSale.id == notification.related_yard_sale_id).first()
+                related_yard_sale = db.get(YardSale, notification.related_yard_sale_id)
                 if related_yard_sale:
                     related_yard_sale_title = related_yard_sale.title
             
@@ -5766,7 +6350,7 @@ async def get_user_notifications(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
 @app.get("/notifications/count", response_model=NotificationCountResponse)
-async def get_notification_count(
+def get_notification_count(
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
@@ -5830,7 +6414,7 @@ async def get_notification_count(
 
 # Get message-specific notification counts
 @app.get("/notifications/counts", response_model=MessageNotificationCounts)
-async def get_message_notification_counts(
+def get_message_notification_counts(
     type: str = "message",
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
@@ -5866,7 +6450,7 @@ async def get_message_notification_counts(
     )
 
 @app.put("/notifications/{notification_id}/read")
-async def mark_notification_read(
+def mark_notification_read(
     notification_id: str,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
@@ -5887,7 +6471,7 @@ async def mark_notification_read(
     return {"message": "Notification marked as read"}
 
 @app.put("/notifications/read-all")
-async def mark_all_notifications_read(
+def mark_all_notifications_read(
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
@@ -5904,7 +6488,7 @@ async def mark_all_notifications_read(
     return {"message": "All notifications marked as read"}
 
 @app.delete("/notifications/{notification_id}")
-async def delete_notification(
+def delete_notification(
     notification_id: str,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
@@ -5925,7 +6509,7 @@ async def delete_notification(
 
 # Event Endpoints
 @app.post("/events", response_model=EventResponse, status_code=status.HTTP_201_CREATED)
-async def create_event(
+def create_event(
     event: EventCreate,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
@@ -5973,16 +6557,15 @@ async def create_event(
     )
     
     db.add(new_event)
-    db.commit()
-    db.refresh(new_event)
-    
+    # Flush assigns the client-side defaults; build the response before
+    # commit so no refresh SELECT is needed. A brand-new event has no comments.
+    db.flush()
+
     # Get organizer info
     organizer = get_user_by_id_helper(db, new_event.organizer_id)
-    
-    # Get comment count
-    comment_count = db.query(EventComment).filter(EventComment.event_id == new_event.id).count()
-    
-    return EventResponse(
+    comment_count = 0
+
+    response = EventResponse(
         id=new_event.id,
         type=new_event.type,
         title=new_event.title,
@@ -6025,9 +6608,11 @@ async def create_event(
         created_at=new_event.created_at,
         last_updated=new_event.last_updated
     )
+    db.commit()
+    return response
 
 @app.get("/events", response_model=List[EventResponse])
-async def get_events(
+def get_events(
     skip: int = 0,
     limit: int = 100,
     type: Optional[str] = None,
@@ -6050,7 +6635,8 @@ async def get_events(
     if status:
         query = query.filter(Event.status == status)
     if city:
-        query = query.filter(Event.city.ilike(f"%{city}%"))
+        # Prefix match for the same index-friendliness as the yard sale filter
+        query = query.filter(Event.city.like(f"{city}%"))
     if state:
         query = query.filter(Event.state.ilike(f"%{state}%"))
     if location_type:
@@ -6123,7 +6709,7 @@ async def get_events(
 
 # Saved Filter Endpoints
 @app.post("/saved-filters", response_model=SavedFilterResponse, status_code=status.HTTP_201_CREATED)
-async def create_saved_filter(
+def create_saved_filter(
     filter_data: SavedFilterCreate,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
@@ -6158,7 +6744,7 @@ async def create_saved_filter(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
 @app.get("/saved-filters", response_model=List[SavedFilterResponse])
-async def get_saved_filters(
+def get_saved_filters(
     filter_type: Optional[str] = Query(None, pattern="^(yard_sale|market_item|event)$", description="Filter by type"),
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
@@ -6191,7 +6777,7 @@ async def get_saved_filters(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
 @app.get("/saved-filters/{filter_id}", response_model=SavedFilterResponse)
-async def get_saved_filter(
+def get_saved_filter(
     filter_id: str,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
@@ -6216,7 +6802,7 @@ async def get_saved_filter(
     )
 
 @app.put("/saved-filters/{filter_id}", response_model=SavedFilterResponse)
-async def update_saved_filter(
+def update_saved_filter(
     filter_id: str,
     filter_update: SavedFilterUpdate,
     current_user: User = Depends(get_current_active_user),
@@ -6259,7 +6845,7 @@ async def update_saved_filter(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
 @app.delete("/saved-filters/{filter_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_saved_filter(
+def delete_saved_filter(
     filter_id: str,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
@@ -6276,7 +6862,7 @@ async def delete_saved_filter(
     try:
         db.delete(saved_filter)
         db.commit()
-        return JSONResponse(status_code=status.HTTP_204_NO_CONTENT, content=None)
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
     except Exception as e:
         db.rollback()
         import traceback
@@ -6286,7 +6872,7 @@ async def delete_saved_filter(
 
 # Event Conversation and Message Endpoints (must come before /events/{event_id} to avoid route conflicts)
 @app.get("/events/conversations", response_model=List[EventConversationResponse])
-async def get_event_conversations(
+def get_event_conversations(
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
@@ -6297,25 +6883,37 @@ async def get_event_conversations(
             (EventConversation.participant1_id == current_user.id) | 
             (EventConversation.participant2_id == current_user.id)
         ).order_by(EventConversation.updated_at.desc()).all()
-        
+
+        conversation_ids = [conv.id for conv in conversations]
+
+        # Batch the per-conversation lookups the same way as the other
+        # conversation listings: windowed latest-message query, grouped
+        # unread count, and IN queries for event titles and users
+        last_messages = get_last_messages_map(db, conversation_ids, EventMessage)
+        unread_counts = get_unread_counts_map(db, conversation_ids, current_user.id, EventMessage)
+
+        event_ids = {conv.event_id for conv in conversations if conv.event_id}
+        event_titles = dict(db.execute(
+            select(Event.id, Event.title).where(Event.id.in_(event_ids))
+        ).all()) if event_ids else {}
+
+        user_ids = set()
+        for conv in conversations:
+            user_ids.update((conv.participant1_id, conv.participant2_id))
+        for last_msg in last_messages.values():
+            user_ids.update((last_msg.sender_id, last_msg.recipient_id))
+        users = get_users_map(db, user_ids)
+
         result: List[EventConversationResponse] = []
         for conv in conversations:
-            # Get event info
-            event = db.query(Event).filter(Event.id == conv.event_id).first()
-            
-            # Get participant usernames
-            p1 = get_user_by_id_helper(db, conv.participant1_id)
-            p2 = get_user_by_id_helper(db, conv.participant2_id)
-            
-            # Get last message
-            last_msg = db.query(EventMessage).filter(
-                EventMessage.conversation_id == conv.id
-            ).order_by(EventMessage.created_at.desc()).first()
-            
+            p1 = users.get(conv.participant1_id)
+            p2 = users.get(conv.participant2_id)
+            last_msg = last_messages.get(conv.id)
+
             last_message_response = None
             if last_msg:
-                sender = get_user_by_id_helper(db, last_msg.sender_id)
-                recipient = get_user_by_id_helper(db, last_msg.recipient_id)
+                sender = users.get(last_msg.sender_id)
+                recipient = users.get(last_msg.recipient_id)
                 last_message_response = EventMessageResponse(
                     id=last_msg.id,
                     content=last_msg.content,
@@ -6330,18 +6928,11 @@ async def get_event_conversations(
                     recipient_username=recipient.username if recipient else "unknown",
                     event_id=conv.event_id
                 )
-            
-            # Count unread messages
-            unread_count = db.query(EventMessage).filter(
-                EventMessage.conversation_id == conv.id,
-                EventMessage.recipient_id == current_user.id,
-                EventMessage.is_read == False
-            ).count()
-            
+
             result.append(EventConversationResponse(
                 id=conv.id,
                 event_id=conv.event_id,
-                event_title=event.title if event else None,
+                event_title=event_titles.get(conv.event_id),
                 participant1_id=conv.participant1_id,
                 participant1_username=p1.username if p1 else None,
                 participant2_id=conv.participant2_id,
@@ -6349,7 +6940,7 @@ async def get_event_conversations(
                 created_at=conv.created_at,
                 updated_at=conv.updated_at,
                 last_message=last_message_response,
-                unread_count=unread_count
+                unread_count=unread_counts.get(conv.id, 0)
             ))
         return result
     except Exception as e:
@@ -6361,14 +6952,14 @@ async def get_event_conversations(
         )
 
 @app.get("/events/conversations/{conversation_id}/messages", response_model=List[EventMessageResponse])
-async def get_event_conversation_messages(
+def get_event_conversation_messages(
     conversation_id: str,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """Get all messages for a specific event conversation"""
     # Get conversation
-    conversation = db.query(EventConversation).filter(EventConversation.id == conversation_id).first()
+    conversation = db.get(EventConversation, conversation_id)
     if not conversation:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Conversation not found")
     
@@ -6402,7 +6993,7 @@ async def get_event_conversation_messages(
     return result
 
 @app.post("/events/conversations/{conversation_id}/messages", response_model=EventMessageResponse, status_code=status.HTTP_201_CREATED)
-async def send_event_conversation_message(
+def send_event_conversation_message(
     conversation_id: str,
     message: EventMessageCreate,
     current_user: User = Depends(get_current_active_user),
@@ -6410,7 +7001,7 @@ async def send_event_conversation_message(
 ):
     """Send a message in an existing event conversation"""
     # Get conversation
-    conversation = db.query(EventConversation).filter(EventConversation.id == conversation_id).first()
+    conversation = db.get(EventConversation, conversation_id)
     if not conversation:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Conversation not found")
     
@@ -6433,13 +7024,14 @@ async def send_event_conversation_message(
     # Update conversation updated_at
     conversation.updated_at = get_mountain_time()
     
-    db.commit()
-    db.refresh(db_message)
+    # Flush assigns the client-side defaults (id, created_at, is_read); the
+    # response is built before commit so no readback SELECT is needed
+    db.flush()
     
     # Get recipient username
     recipient = get_user_by_id_helper(db, recipient_id)
     
-    return EventMessageResponse(
+    response = EventMessageResponse(
         id=db_message.id,
         content=db_message.content,
         is_read=db_message.is_read,
@@ -6454,28 +7046,30 @@ async def send_event_conversation_message(
         event_id=conversation.event_id
     )
 
+    db.commit()
+    return response
+
 @app.put("/events/messages/{message_id}/read", status_code=status.HTTP_200_OK)
-async def mark_event_message_read(
+def mark_event_message_read(
     message_id: str,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """Mark an event message as read"""
-    message = db.query(EventMessage).filter(
-        EventMessage.id == message_id,
-        EventMessage.recipient_id == current_user.id
-    ).first()
-    
-    if not message:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Message not found")
-    
-    message.is_read = True
+    updated = db.execute(
+        update(EventMessage)
+        .where(EventMessage.id == message_id, EventMessage.recipient_id == current_user.id)
+        .values(is_read=True)
+    ).rowcount
     db.commit()
-    
+
+    if not updated:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Message not found")
+
     return {"message": "Message marked as read"}
 
 @app.get("/events/messages/unread-count", response_model=dict)
-async def get_event_unread_count(
+def get_event_unread_count(
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
@@ -6506,9 +7100,9 @@ async def get_event_unread_count(
         )
 
 @app.get("/events/{event_id}", response_model=EventResponse)
-async def get_event(event_id: str, db: Session = Depends(get_db)):
+def get_event(event_id: str, db: Session = Depends(get_db)):
     """Get a specific event by ID"""
-    event = db.query(Event).filter(Event.id == event_id).first()
+    event = db.get(Event, event_id)
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
     
@@ -6560,7 +7154,7 @@ async def get_event(event_id: str, db: Session = Depends(get_db)):
     )
 
 @app.put("/events/{event_id}", response_model=EventResponse)
-async def update_event(
+def update_event(
     event_id: str,
     event_update: EventUpdate,
     current_user: User = Depends(get_current_active_user),
@@ -6569,7 +7163,7 @@ async def update_event(
     """Update an event (organizer only, or admin can edit any event)"""
     # Allow admins to edit any event, otherwise only organizer can edit
     if current_user.permissions == "admin":
-        event = db.query(Event).filter(Event.id == event_id).first()
+        event = db.get(Event, event_id)
     else:
         event = db.query(Event).filter(
             Event.id == event_id,
@@ -6583,7 +7177,7 @@ async def update_event(
         )
     
     # Update only provided fields
-    update_data = event_update.dict(exclude_unset=True)
+    update_data = event_update.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         if field == "tags" and value is not None:
             setattr(event, field, value)
@@ -6645,7 +7239,7 @@ async def update_event(
     )
 
 @app.delete("/events/{event_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_event(
+def delete_event(
     event_id: str,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
@@ -6653,7 +7247,7 @@ async def delete_event(
     """Delete an event (organizer only, or admin can delete any event)"""
     # Allow admins to delete any event, otherwise only organizer can delete
     if current_user.permissions == "admin":
-        event = db.query(Event).filter(Event.id == event_id).first()
+        event = db.get(Event, event_id)
     else:
         event = db.query(Event).filter(
             Event.id == event_id,
@@ -6684,20 +7278,21 @@ async def delete_event(
 
 # Event Comment Endpoints
 @app.post("/events/{event_id}/comments", response_model=EventCommentResponse, status_code=status.HTTP_201_CREATED)
-async def create_event_comment(
+def create_event_comment(
     event_id: str,
     comment: EventCommentCreate,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """Create a comment on an event"""
-    # Check if event exists
-    event = db.query(Event).filter(Event.id == event_id).first()
-    if not event:
+    # Only comments_enabled is needed — select that one column instead of the full row
+    comments_enabled = db.execute(
+        select(Event.comments_enabled).where(Event.id == event_id)
+    ).scalar()
+    if comments_enabled is None:
         raise HTTPException(status_code=404, detail="Event not found")
-    
-    # Check if comments are enabled
-    if not event.comments_enabled:
+
+    if not comments_enabled:
         raise HTTPException(status_code=400, detail="Comments are disabled for this event")
     
     # Create comment
@@ -6711,10 +7306,11 @@ async def create_event_comment(
     )
     
     db.add(new_comment)
-    db.commit()
-    db.refresh(new_comment)
-    
-    return EventCommentResponse(
+    # Flush assigns the client-side defaults; build the response before
+    # commit so no refresh SELECT is needed
+    db.flush()
+
+    response = EventCommentResponse(
         id=new_comment.id,
         event_id=new_comment.event_id,
         user_id=new_comment.user_id,
@@ -6725,18 +7321,19 @@ async def create_event_comment(
         created_at=new_comment.created_at,
         updated_at=new_comment.updated_at
     )
+    db.commit()
+    return response
 
 @app.get("/events/{event_id}/comments", response_model=List[EventCommentResponse])
-async def get_event_comments(
+def get_event_comments(
     event_id: str,
     skip: int = 0,
     limit: int = 100,
     db: Session = Depends(get_db)
 ):
     """Get all comments for an event"""
-    # Check if event exists
-    event = db.query(Event).filter(Event.id == event_id).first()
-    if not event:
+    # Existence check only — select the PK instead of hydrating the full row
+    if db.execute(select(Event.id).where(Event.id == event_id)).first() is None:
         raise HTTPException(status_code=404, detail="Event not found")
     
     comments = db.query(EventComment).filter(
@@ -6762,7 +7359,7 @@ async def get_event_comments(
 
 # Event Featured Image Endpoints
 @app.put("/events/{event_id}/featured-image", response_model=FeaturedImageResponse)
-async def set_event_featured_image(
+def set_event_featured_image(
     event_id: str,
     request: Request,
     featured_request: SetFeaturedImageRequest,
@@ -6772,7 +7369,7 @@ async def set_event_featured_image(
     """Set the featured image for an event (organizer only, or admin can edit any event)"""
     # Allow admins to edit any event, otherwise only organizer can edit
     if current_user.permissions == "admin":
-        event = db.query(Event).filter(Event.id == event_id).first()
+        event = db.get(Event, event_id)
     else:
         event = db.query(Event).filter(
             Event.id == event_id,
@@ -6842,7 +7439,7 @@ async def set_event_featured_image(
     )
 
 @app.delete("/events/{event_id}/featured-image", response_model=FeaturedImageResponse)
-async def remove_event_featured_image(
+def remove_event_featured_image(
     event_id: str,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
@@ -6850,7 +7447,7 @@ async def remove_event_featured_image(
     """Remove the featured image from an event (organizer only, or admin can edit any event)"""
     # Allow admins to edit any event, otherwise only organizer can edit
     if current_user.permissions == "admin":
-        event = db.query(Event).filter(Event.id == event_id).first()
+        event = db.get(Event, event_id)
     else:
         event = db.query(Event).filter(
             Event.id == event_id,
@@ -6874,14 +7471,14 @@ async def remove_event_featured_image(
     )
 
 @app.get("/events/{event_id}/images", response_model=dict)
-async def get_event_images(
+def get_event_images(
     event_id: str,
     request: Request,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """Get all images for an event (authenticated users only)"""
-    event = db.query(Event).filter(Event.id == event_id).first()
+    event = db.get(Event, event_id)
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
     
@@ -6930,21 +7527,26 @@ async def get_event_images(
         )
 
 @app.post("/events/{event_id}/messages", response_model=EventMessageResponse, status_code=status.HTTP_201_CREATED)
-async def send_event_message(
+def send_event_message(
     event_id: str,
     message: EventMessageCreate,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """Send initial message to an event organizer (creates a conversation)"""
-    # Get the event
-    event = db.query(Event).filter(Event.id == event_id).first()
-    if not event:
+    # Validate the event and fetch the organizer's username in one joined query
+    row = db.execute(
+        select(Event.organizer_id, User.username)
+        .join(User, User.id == Event.organizer_id)
+        .where(Event.id == event_id)
+    ).first()
+    if row is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
-    
+
     # Determine recipient (organizer is the event organizer)
-    organizer_id = event.organizer_id
+    organizer_id = row.organizer_id
     recipient_id = organizer_id
+    recipient_username = row.username
     
     # Can't message yourself
     if current_user.id == recipient_id:
@@ -6989,13 +7591,11 @@ async def send_event_message(
     # Update conversation updated_at
     conversation.updated_at = get_mountain_time()
     
-    db.commit()
-    db.refresh(db_message)
-    
-    # Get usernames
-    recipient = get_user_by_id_helper(db, recipient_id)
-    
-    return EventMessageResponse(
+    # Flush assigns the client-side defaults (id, created_at, is_read); the
+    # response is built before commit so no readback SELECT is needed
+    db.flush()
+
+    response = EventMessageResponse(
         id=db_message.id,
         content=db_message.content,
         is_read=db_message.is_read,
@@ -7006,13 +7606,16 @@ async def send_event_message(
         sender_is_admin=(current_user.permissions == "admin"),
         sender_profile_picture=current_user.profile_picture,
         recipient_id=recipient_id,
-        recipient_username=recipient.username if recipient else "unknown",
+        recipient_username=recipient_username or "unknown",
         event_id=event_id
     )
 
+    db.commit()
+    return response
+
 # Admin-only endpoints
 @app.get("/admin/users", response_model=dict)
-async def get_all_users(
+def get_all_users(
     skip: int = 0,
     limit: int = 100,
     search: Optional[str] = None,
@@ -7037,26 +7640,7 @@ async def get_all_users(
         total_count = query.count()
         users = query.order_by(User.created_at.desc()).offset(skip).limit(limit).all()
         
-        result = [
-        UserResponse(
-            id=user.id,
-            username=user.username,
-            email=user.email,
-            full_name=user.full_name,
-            phone_number=user.phone_number,
-            company=user.company,
-            city=user.city,
-            state=user.state,
-            zip_code=user.zip_code,
-            bio=user.bio,
-            profile_picture=user.profile_picture,
-            is_active=user.is_active,
-            permissions=UserPermission(user.permissions),
-            created_at=user.created_at,
-            updated_at=user.updated_at
-        )
-        for user in users
-    ]
+        result = [UserResponse.model_validate(user) for user in users]
         
         return {
             "users": result,
@@ -7072,7 +7656,7 @@ async def get_all_users(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
 @app.get("/admin/users/{user_id}", response_model=UserResponse)
-async def get_user_by_id_admin(
+def get_user_by_id_admin(
     user_id: str,
     current_user: User = Depends(get_current_admin_user),
     db: Session = Depends(get_db)
@@ -7082,23 +7666,7 @@ async def get_user_by_id_admin(
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
-    return UserResponse(
-        id=user.id,
-        username=user.username,
-        email=user.email,
-        full_name=user.full_name,
-        phone_number=user.phone_number,
-        company=user.company,
-        city=user.city,
-        state=user.state,
-        zip_code=user.zip_code,
-        bio=user.bio,
-        profile_picture=user.profile_picture,
-        is_active=user.is_active,
-        permissions=UserPermission(user.permissions),
-        created_at=user.created_at,
-        updated_at=user.updated_at
-    )
+    return UserResponse.model_validate(user)
 
 class UserUpdateAdmin(BaseModel):
     full_name: Optional[str] = Field(None, max_length=100)
@@ -7173,8 +7741,8 @@ async def update_user_admin(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Password must be at least 8 characters long"
             )
-        # Hash the new password
-        user.hashed_password = get_password_hash(user_update.password)
+        # Hash the new password (bcrypt runs in the threadpool, off the event loop)
+        user.hashed_password = await run_in_threadpool(get_password_hash, user_update.password)
     
     user.updated_at = get_mountain_time()
     
@@ -7188,26 +7756,10 @@ async def update_user_admin(
             detail=f"Failed to update user: {str(e)}"
         )
     
-    return UserResponse(
-        id=user.id,
-        username=user.username,
-        email=user.email,
-        full_name=user.full_name,
-        phone_number=user.phone_number,
-        company=user.company,
-        city=user.city,
-        state=user.state,
-        zip_code=user.zip_code,
-        bio=user.bio,
-        profile_picture=user.profile_picture,
-        is_active=user.is_active,
-        permissions=UserPermission(user.permissions),
-        created_at=user.created_at,
-        updated_at=user.updated_at
-    )
+    return UserResponse.model_validate(user)
 
 @app.delete("/admin/users/{user_id}")
-async def delete_user_admin(
+def delete_user_admin(
     user_id: str,
     current_user: User = Depends(get_current_admin_user),
     db: Session = Depends(get_db)
@@ -7373,7 +7925,7 @@ async def delete_user_admin(
 
 # Admin Dashboard Endpoints
 @app.get("/admin/dashboard/stats", response_model=dict)
-async def get_admin_dashboard_stats(
+def get_admin_dashboard_stats(
     current_user: User = Depends(get_current_admin_user),
     db: Session = Depends(get_db)
 ):
@@ -7427,7 +7979,7 @@ async def get_admin_dashboard_stats(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
 @app.get("/admin/items", response_model=dict)
-async def get_all_items_admin(
+def get_all_items_admin(
     skip: int = 0,
     limit: int = 100,
     status: Optional[str] = None,
@@ -7447,7 +7999,7 @@ async def get_all_items_admin(
         
         result = []
         for item in items:
-            owner = db.query(User).filter(User.id == item.owner_id).first()
+            owner = db.get(User, item.owner_id)
             comment_count = db.query(MarketItemComment).filter(MarketItemComment.item_id == item.id).count()
             is_free = getattr(item, 'is_free', False) or item.price == 0.0
             
@@ -7484,7 +8036,7 @@ async def get_all_items_admin(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
 @app.get("/admin/yard-sales", response_model=dict)
-async def get_all_yard_sales_admin(
+def get_all_yard_sales_admin(
     skip: int = 0,
     limit: int = 100,
     status: Optional[str] = None,
@@ -7503,7 +8055,7 @@ async def get_all_yard_sales_admin(
         
         result = []
         for yard_sale in yard_sales:
-            owner = db.query(User).filter(User.id == yard_sale.owner_id).first()
+            owner = db.get(User, yard_sale.owner_id)
             comment_count = db.query(Comment).filter(Comment.yard_sale_id == yard_sale.id).count()
             
             result.append({
@@ -7539,7 +8091,7 @@ async def get_all_yard_sales_admin(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
 @app.get("/admin/events", response_model=dict)
-async def get_all_events_admin(
+def get_all_events_admin(
     skip: int = 0,
     limit: int = 100,
     type: Optional[str] = None,
@@ -7600,7 +8152,7 @@ async def get_all_events_admin(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
 @app.get("/admin/reports", response_model=List[dict])
-async def get_all_reports(
+def get_all_reports(
     skip: int = 0,
     limit: int = 100,
     current_user: User = Depends(get_current_moderator_or_admin_user),
@@ -7632,6 +8184,47 @@ async def value_error_handler(request, exc):
     )
 
 # Image Upload Endpoints
+# Per-user MinIO listing cache. The /images endpoint and both
+# *-items/{id}/images endpoints re-list the same images/{user_id}/ prefix on
+# every call; cache the listing for a short TTL and drop a user's entry on
+# upload/delete so their own changes show immediately. (The original
+# proposal cached presigned URLs, but this app serves images through
+# /image-proxy, so the repeated S3 work here is the listing itself.)
+USER_IMAGE_LIST_TTL = int(os.getenv("USER_IMAGE_LIST_TTL", "30"))
+USER_IMAGE_LIST_CACHE_MAX = 5000
+_user_image_list_cache: Dict[str, tuple] = {}
+
+
+def list_user_image_objects(user_id: str) -> list:
+    """S3 objects under a user's image prefix, cached for a short TTL.
+
+    Returns plain dicts (key, size, last_modified, filename) without the
+    request-dependent URL, which callers build per request.
+    """
+    cached = _user_image_list_cache.get(user_id)
+    if cached and cached[0] > datetime.now().timestamp():
+        return cached[1]
+    response = s3_client.list_objects_v2(
+        Bucket=MINIO_BUCKET_NAME,
+        Prefix=f"images/{user_id}/"
+    )
+    objects = [
+        {
+            'key': obj['Key'],
+            'size': obj['Size'],
+            'last_modified': obj['LastModified'].isoformat(),
+            'filename': obj['Key'].split('/')[-1]
+        }
+        for obj in response.get('Contents', [])
+    ]
+    if len(_user_image_list_cache) >= USER_IMAGE_LIST_CACHE_MAX:
+        _user_image_list_cache.clear()
+    _user_image_list_cache[user_id] = (
+        datetime.now().timestamp() + USER_IMAGE_LIST_TTL, objects
+    )
+    return objects
+
+
 @app.post("/upload/image", response_model=ImageUploadResponse)
 async def upload_image(
     request: Request,
@@ -7671,7 +8264,9 @@ async def upload_image(
         # Test connection first
         try:
             print("🔍 Testing MinIO connection...")
-            s3_client.head_bucket(Bucket=MINIO_BUCKET_NAME)
+            await asyncio.wrap_future(
+                UPLOAD_EXECUTOR.submit(s3_client.head_bucket, Bucket=MINIO_BUCKET_NAME)
+            )
             print("✅ Bucket access confirmed")
         except Exception as conn_error:
             print(f"❌ Connection test failed: {conn_error}")
@@ -7699,8 +8294,12 @@ async def upload_image(
         #     'original-filename': file.filename or 'unknown'
         # }
         
-        s3_client.put_object(**put_params)
+        # Run the transfer on the upload pool so the event loop stays free
+        await asyncio.wrap_future(
+            UPLOAD_EXECUTOR.submit(s3_client.put_object, **put_params)
+        )
         print("✅ Upload successful")
+        _user_image_list_cache.pop(current_user.id, None)
         
         # Generate proxy URL using request origin (works for both localhost and IP access)
         # Check for X-Forwarded-Host header (used by reverse proxies like Vite)
@@ -7770,19 +8369,15 @@ async def upload_image(
         )
 
 @app.get("/images", response_model=ImageListResponse)
-async def list_user_images(
+def list_user_images(
     request: Request,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """List all images uploaded by the current user"""
     try:
-        # List objects in user's folder
-        prefix = f"images/{current_user.id}/"
-        response = s3_client.list_objects_v2(
-            Bucket=MINIO_BUCKET_NAME,
-            Prefix=prefix
-        )
+        # List objects in user's folder (short-TTL cached per user)
+        objects = list_user_image_objects(current_user.id)
         
         # Determine base URL for image URLs using request origin
         # Check for X-Forwarded-Host header (used by reverse proxies like Vite)
@@ -7800,17 +8395,10 @@ async def list_user_images(
             # Fallback to request.base_url
             base_url = str(request.base_url).rstrip('/')
         
-        images = []
-        if 'Contents' in response:
-            for obj in response['Contents']:
-                image_url = f"{base_url}/image-proxy/{obj['Key']}"
-                images.append({
-                    'key': obj['Key'],
-                    'url': image_url,
-                    'size': obj['Size'],
-                    'last_modified': obj['LastModified'].isoformat(),
-                    'filename': obj['Key'].split('/')[-1]
-                })
+        images = [
+            {**obj, 'url': f"{base_url}/image-proxy/{obj['key']}"}
+            for obj in objects
+        ]
         
         return ImageListResponse(
             images=images,
@@ -7824,7 +8412,7 @@ async def list_user_images(
         )
 
 @app.delete("/images/{image_key:path}")
-async def delete_image(
+def delete_image(
     image_key: str,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
@@ -7849,6 +8437,7 @@ async def delete_image(
         
         # Delete the object
         s3_client.delete_object(Bucket=MINIO_BUCKET_NAME, Key=image_key)
+        _user_image_list_cache.pop(current_user.id, None)
         
         return {"message": "Image deleted successfully"}
         
@@ -7861,7 +8450,7 @@ async def delete_image(
         )
 
 @app.get("/image-proxy/{image_key:path}")
-async def proxy_image(
+def proxy_image(
     image_key: str,
     authorization: str | None = Header(default=None, alias="Authorization"),
     token_query: str | None = Query(default=None, alias="token"),
@@ -7888,14 +8477,19 @@ async def proxy_image(
         try:
             if resolved_token in token_blacklist:
                 raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token has been revoked")
-            payload = jwt.decode(resolved_token, SECRET_KEY, algorithms=[ALGORITHM])
-            username: str | None = payload.get("sub")
-            if not username:
-                raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Could not validate credentials")
+            # Reuse the verified-token cache; images are fetched in bursts
+            # with the same token, so most requests skip the HMAC entirely
+            username = get_cached_token_username(resolved_token)
+            if username is None:
+                payload = jwt.decode(resolved_token, JWT_SIGNING_KEY, algorithms=[ALGORITHM], options=JWT_DECODE_OPTIONS)
+                username = payload.get("sub")
+                if not username:
+                    raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Could not validate credentials")
+                cache_token_username(resolved_token, username, payload.get("exp"))
         except JWTError:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Could not validate credentials")
 
-        user = get_user_by_username(db, username)
+        user = get_user_for_token(db, username)
         if user is None or not user.is_active:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Could not validate credentials")
 
@@ -7935,10 +8529,24 @@ async def proxy_image(
 
 
 if __name__ == "__main__":
+    # Auto-reload runs a file watcher and restarts workers on every file event,
+    # so it's opt-in for development only (DEV=1). Workers stay at 1 unless
+    # WEB_CONCURRENCY opts in: token revocation (TokenBlacklist) and the
+    # listing/badge/image caches are per-process, so with multiple workers a
+    # logout only takes effect on the worker that handled it and the caches
+    # serve inconsistent data. Move those to a shared store before raising
+    # the default.
+    dev_mode = os.getenv("DEV") == "1"
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,  # Auto-reload on code changes
-        log_level="info"
+        reload=dev_mode,
+        workers=1 if dev_mode else int(os.getenv("WEB_CONCURRENCY", "1")),
+        log_level="info" if dev_mode else os.getenv("LOG_LEVEL", "warning"),
+        # uvicorn[standard] ships uvloop and httptools; pin them explicitly in
+        # production rather than trusting "auto" detection, since silently
+        # falling back to the pure-Python loop/parser costs real throughput
+        loop="auto" if dev_mode else "uvloop",
+        http="auto" if dev_mode else "httptools"
     )
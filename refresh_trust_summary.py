@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Recompute the cached trust aggregates on users from user_ratings.
+
+The columns are maintained incrementally on every rating insert, so this is
+a periodic safety net rather than a required job: schedule it from cron
+(e.g. every 10 minutes) and any drift — from bulk imports, manual SQL, or
+crashes between INSERT and UPDATE — converges back to the true values.
+MySQL has no materialized views, so refreshing the denormalized columns in
+place plays the same role as REFRESH MATERIALIZED VIEW would.
+"""
+
+import mysql.connector
+from mysql.connector import Error
+
+
+def refresh():
+    try:
+        connection = mysql.connector.connect(
+            host='127.0.0.1',
+            port=3306,
+            user='root',
+            password=''  # adjust as needed
+        )
+        if connection.is_connected():
+            cursor = connection.cursor()
+            cursor.execute("USE fastapi_db")
+
+            # Report drift before fixing it, so cron logs show whether the
+            # incremental maintenance is actually holding up
+            cursor.execute(
+                "SELECT COUNT(*) FROM users u "
+                "LEFT JOIN ("
+                "  SELECT rated_user_id, AVG(rating) AS avg_rating, COUNT(*) AS cnt "
+                "  FROM user_ratings GROUP BY rated_user_id"
+                ") r ON r.rated_user_id = u.id "
+                "WHERE u.total_ratings <> COALESCE(r.cnt, 0) "
+                "   OR COALESCE(u.average_rating, -1) <> COALESCE(r.avg_rating, -1)"
+            )
+            drifted = cursor.fetchone()[0]
+            if drifted:
+                print(f"⚠️ {drifted} user(s) had stale trust aggregates")
+            else:
+                print("✅ No drift detected")
+
+            cursor.execute(
+                "UPDATE users u "
+                "LEFT JOIN ("
+                "  SELECT rated_user_id, AVG(rating) AS avg_rating, COUNT(*) AS cnt "
+                "  FROM user_ratings GROUP BY rated_user_id"
+                ") r ON r.rated_user_id = u.id "
+                "SET u.average_rating = r.avg_rating, "
+                "    u.total_ratings = COALESCE(r.cnt, 0)"
+            )
+            print(f"✅ Refreshed trust aggregates ({cursor.rowcount} row(s) written)")
+
+            connection.commit()
+
+    except Error as e:
+        print(f"❌ Database error: {e}")
+    finally:
+        try:
+            if connection.is_connected():
+                cursor.close()
+                connection.close()
+                print("✅ Database connection closed")
+        except NameError:
+            pass
+
+
+if __name__ == "__main__":
+    refresh()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Check hot listing endpoints for N+1 query regressions.
+
+Runs a few representative requests through the app with a query counter
+attached to the engine and fails if any endpoint issues more statements
+than its expected bound. Requires the database (and some test data, e.g.
+from populate_test_data.py) to be reachable.
+"""
+import sys
+
+from fastapi.testclient import TestClient
+
+from database import count_queries
+from main import app
+
+# (method, path, max statements allowed)
+# Bounds are intentionally loose: page query + a constant number of batched
+# lookups. If one of these starts scaling with row count again, it will blow
+# straight past its bound.
+CHECKS = [
+    ("GET", "/yard-sales?limit=100", 5),
+    ("GET", "/yard-sales/search/nearby?zip_code=84078&limit=50", 4),
+    ("GET", "/market-items?limit=50", 6),
+    ("GET", "/payment-methods", 1),
+]
+
+
+def main():
+    client = TestClient(app)
+    failures = []
+
+    for method, path, bound in CHECKS:
+        with count_queries() as queries:
+            response = client.request(method, path)
+
+        # Any non-2xx means the request never reached the code under test
+        # (bad path, validation error, ...) and the bound check would pass
+        # vacuously — treat it as a failure
+        if not 200 <= response.status_code < 300:
+            print(f"❌ {method} {path} returned {response.status_code}")
+            failures.append(path)
+            continue
+
+        if len(queries) > bound:
+            print(f"❌ {method} {path} issued {len(queries)} queries (bound: {bound})")
+            for statement in queries:
+                print(f"   - {statement.splitlines()[0][:100]}")
+            failures.append(path)
+        else:
+            print(f"✅ {method} {path}: {len(queries)} queries (bound: {bound})")
+
+    if failures:
+        print(f"\n❌ {len(failures)} endpoint(s) over their query bound")
+        sys.exit(1)
+
+    print("\n✅ All endpoints within their query bounds")
+
+
+if __name__ == "__main__":
+    main()